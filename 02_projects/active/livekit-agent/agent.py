@@ -13,6 +13,9 @@ import json
 import logging
 import os
 import asyncio
+import sys
+import time
+import uuid
 from datetime import datetime
 
 import aiohttp
@@ -26,13 +29,14 @@ from livekit.agents import (
     JobContext,
     JobProcess,
     RoomInputOptions,
+    StopResponse,
     WorkerOptions,
     cli,
     inference,
     llm,
+    stt,
     function_tool,
 )
-from livekit.plugins import silero
 
 try:
     from livekit.plugins import deepgram as deepgram_plugin
@@ -46,12 +50,6 @@ try:
 except ImportError:
     HAS_ANTHROPIC_PLUGIN = False
 
-try:
-    from livekit.plugins import noise_cancellation
-    HAS_NOISE_CANCELLATION = True
-except ImportError:
-    HAS_NOISE_CANCELLATION = False
-
 load_dotenv()
 logger = logging.getLogger("nitara-voice")
 
@@ -63,20 +61,49 @@ ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 OPENCLAW_BASE_URL = os.getenv("OPENCLAW_BASE_URL", "http://localhost:18789/v1")
 OPENCLAW_TOKEN = os.getenv("OPENCLAW_TOKEN", "")
 CONFIG_DIR = os.path.join(os.path.dirname(__file__), "config")
+VOICES_PATH = os.path.join(CONFIG_DIR, "voices.json")
+# Cache persona instructions/config per process (set false to measure the cold path)
+PERSONA_ASSET_CACHE = os.getenv("PERSONA_ASSET_CACHE", "true").lower() != "false"
+# Ask the orchestrator for an SSE stream; single-shot JSON is still accepted
+ORCHESTRATOR_STREAMING = os.getenv("ORCHESTRATOR_STREAMING", "true").lower() != "false"
+# Seconds a turn may stay silent before it is handed off to the background (0 disables)
+ORCHESTRATOR_TURN_BUDGET = float(os.getenv("ORCHESTRATOR_TURN_BUDGET", "8"))
+ORCHESTRATOR_TURN_BUDGET_SIP = float(os.getenv("ORCHESTRATOR_TURN_BUDGET_SIP", "5"))
+HANDOFF_HOLDING_LINE = (
+    "This one needs a bit more thought. I'll keep working on it in the background "
+    "and tell you as soon as it's ready."
+)
+HANDOFF_RESULT_LINE = "About your earlier question."
+TIMEOUT_LINE = "That's still processing. Check your dashboard or ask me again shortly."
+GREETING_FALLBACK_LINE = "Hey Vimo. I'm here. What would you like to work on?"
+FAILURE_LINE = "Something went wrong on my end. Could you try again?"
+# Whole-turn lines spoken often enough to pre-render for every persona voice
+FIXED_PHRASES = ["Done.", HANDOFF_HOLDING_LINE, TIMEOUT_LINE, GREETING_FALLBACK_LINE, FAILURE_LINE]
+TTS_MODEL = "cartesia/sonic-2"
+TTS_PRERENDER = os.getenv("TTS_PRERENDER", "true").lower() != "false"
+# Race slow non-deep orchestrator turns against Claude directly (see resilience.py)
+ORCHESTRATOR_HEDGE = os.getenv("ORCHESTRATOR_HEDGE", "true").lower() != "false"
 
 # Load voice presets
-VOICE_CONFIG = {}
-try:
-    with open(os.path.join(CONFIG_DIR, "voices.json"), "r") as f:
-        VOICE_CONFIG = json.load(f)
-except FileNotFoundError:
-    pass
-
-PERSONA_VOICES = {
-    "nitara-main": VOICE_CONFIG.get("personas", {}).get("nitara-main", {}).get("voice_id", "f786b574-daa5-4673-aa0c-cbe3e8534c02"),
-    "nitara-analyst": VOICE_CONFIG.get("personas", {}).get("nitara-analyst", {}).get("voice_id", "228fca29-3a0a-435c-8728-5cb483251068"),
-    "nitara-profiler": VOICE_CONFIG.get("personas", {}).get("nitara-profiler", {}).get("voice_id", "6ccbfb76-1fc6-48f7-b71d-91ac6298247b"),
-}
+def load_voice_config() -> dict:
+    try:
+        with open(VOICES_PATH, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def resolve_persona_voices(voice_config: dict) -> dict:
+    personas = voice_config.get("personas", {})
+    return {
+        "nitara-main": personas.get("nitara-main", {}).get("voice_id", "f786b574-daa5-4673-aa0c-cbe3e8534c02"),
+        "nitara-analyst": personas.get("nitara-analyst", {}).get("voice_id", "228fca29-3a0a-435c-8728-5cb483251068"),
+        "nitara-profiler": personas.get("nitara-profiler", {}).get("voice_id", "6ccbfb76-1fc6-48f7-b71d-91ac6298247b"),
+    }
+
+
+VOICE_CONFIG = load_voice_config()
+PERSONA_VOICES = resolve_persona_voices(VOICE_CONFIG)
 
 # Legacy preset mapping for backward compatibility
 VOICE_PRESETS = {
@@ -87,7 +114,28 @@ VOICE_PRESETS = {
 
 # ─── Import function tools ────────────────────────────────────────────────────
 
+from backend_client import get_backend_client, release_backend_client, retain_backend_client
+from batched_vad import load_vad, start_vad_server
+from briefing import BriefingBuilder
+from chat_context import SUMMARY_ITEM_ID, ContextWindow, RollingSummaryContext
+from endpointing import EndpointingController, endpointing_profile
+from fast_path import FAST_PATH_ENABLED, IntentRouter
+from file_io import run_file_io
+from input_stage import TURN_GATE_ENABLED, TurnGate, get_noise_budget, noise_filter_for_call
+from keyword_cache import KeywordCache, KeywordSet
+from loop_lag import get_loop_lag_monitor
+from metrics import TurnTracker, get_metrics
+from resilience import CircuitBreaker, CircuitOpenError
+from speech_pool import get_speech_pool
+from speech_text import SpeechChunker, speakable_llm_stream, speakable_sentences
+from task_watcher import TaskWatcher, describe_task
+from tts_cache import CachedAudio, cache_key, get_tts_cache, normalize_phrase
+from worker_load import worker_options_kwargs
 from tools import (
+    CHECKLIST_STORE,
+    REPORT_INDEX,
+    REPORTS_DIR,
+    queue_auth_headers,
     enqueue_task,
     check_task_status,
     read_latest_report,
@@ -123,46 +171,63 @@ def load_soul_instructions() -> str:
         )
 
 
-async def fetch_keywords() -> list[str]:
-    """Fetch domain-specific keywords from the backend for STT boosting."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{BACKEND_URL}/api/livekit/keywords",
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data.get("keywords", [])
-    except Exception as e:
-        logger.warning(f"Failed to fetch keywords: {e}")
-    return []
+def _tts_key(voice_id: str) -> tuple:
+    return ("tts", TTS_MODEL, voice_id, "")
 
 
-def build_stt(keywords: list[str] | None = None):
-    """Build the best available STT instance with optional keyword boosting."""
+def _new_tts(voice_id: str):
+    return inference.TTS(model=TTS_MODEL, voice=voice_id)
+
+
+def pooled_tts(voice_id: str):
+    """A ready TTS client for ``voice_id`` from the process speech pool."""
+    return get_speech_pool().acquire(_tts_key(voice_id), lambda: _new_tts(voice_id))
+
+
+def pooled_default_stt():
+    """The gateway Nova-3 STT used when no Deepgram plugin client was built."""
+    return get_speech_pool().acquire(
+        ("stt", "deepgram/nova-3", "", ""), lambda: inference.STT(model="deepgram/nova-3")
+    )
+
+
+def _flux_key(keywords: KeywordSet) -> tuple:
+    return ("stt", "deepgram/flux-general-en", "", keywords.version)
+
+
+def _new_flux_stt(keywords: KeywordSet):
+    return deepgram_plugin.STTv2(model="flux-general-en", keyterm=keywords.keyterms or None)
+
+
+def build_stt(keywords: KeywordSet | None = None):
+    """Build the best available STT instance with optional keyword boosting.
+
+    Takes a cached ``KeywordSet`` so the cleaned keyterm list is reused across
+    jobs instead of being rebuilt per call. Clients come from the process
+    speech pool, keyed by the keyword set's version.
+    """
     stt_instance = None
     using_sttv2 = False
 
-    if HAS_DEEPGRAM_PLUGIN and keywords:
-        clean_keywords = [k.split(":")[0] for k in keywords if k]
-        if clean_keywords:
-            logger.info(f"Loaded {len(clean_keywords)} keywords for STT boosting")
+    if HAS_DEEPGRAM_PLUGIN and keywords and keywords.keyterms:
+        clean_keywords = keywords.keyterms
+        logger.info(f"Loaded {len(clean_keywords)} keywords (v{keywords.version}) for STT boosting")
+        pool = get_speech_pool()
 
         try:
-            stt_instance = deepgram_plugin.STTv2(
-                model="flux-general-en",
-                keyterm=clean_keywords or None,
-            )
+            stt_instance = pool.acquire(_flux_key(keywords), lambda: _new_flux_stt(keywords))
             using_sttv2 = True
             logger.info("Using Deepgram Flux STTv2")
         except Exception as e:
             logger.warning(f"Flux STTv2 init failed, falling back to Nova-3: {e}")
             try:
-                stt_instance = deepgram_plugin.STT(
-                    model="nova-3",
-                    language="en",
-                    keyterm=clean_keywords or None,
+                stt_instance = pool.acquire(
+                    ("stt", "deepgram/nova-3-plugin", "", keywords.version),
+                    lambda: deepgram_plugin.STT(
+                        model="nova-3",
+                        language="en",
+                        keyterm=clean_keywords or None,
+                    ),
                 )
                 logger.info("Using Deepgram Nova-3 with keyterm boosting")
             except Exception as e2:
@@ -171,29 +236,157 @@ def build_stt(keywords: list[str] | None = None):
     return stt_instance, using_sttv2
 
 
+def fill_speech_pool(keywords: KeywordSet, persona_voices: dict) -> None:
+    """Build the clients the first job will ask for. Blocking; for ``prewarm``."""
+    pool = get_speech_pool()
+    for voice_id in dict.fromkeys(persona_voices.values()):
+        pool.fill(_tts_key(voice_id), lambda voice_id=voice_id: _new_tts(voice_id))
+    if HAS_DEEPGRAM_PLUGIN and keywords.keyterms:
+        pool.fill(_flux_key(keywords), lambda: _new_flux_stt(keywords))
+
+
+def release_speech_clients(*clients) -> None:
+    """Hand pooled STT/TTS clients back once their session is done with them."""
+    pool = get_speech_pool()
+    for client in clients:
+        pool.release(client)
+
+
+def build_direct_llm(purpose: str) -> llm.LLM | None:
+    """Claude without the orchestrator: Anthropic plugin, else OpenClaw gateway.
+
+    Returns ``None`` when neither is configured.
+    """
+    if HAS_ANTHROPIC_PLUGIN and ANTHROPIC_API_KEY:
+        logger.info(f"{purpose} using Claude Sonnet directly via Anthropic plugin")
+        return anthropic_plugin.LLM(
+            model="claude-sonnet-4-20250514",
+            api_key=ANTHROPIC_API_KEY,
+            temperature=0.7,
+        )
+    if OPENCLAW_BASE_URL and OPENCLAW_TOKEN:
+        # OpenAI-compatible gateway
+        logger.info(f"{purpose} using Claude via OpenClaw gateway")
+        return inference.LLM(
+            model="anthropic/claude-sonnet-4-20250514",
+            base_url=OPENCLAW_BASE_URL,
+            api_key=OPENCLAW_TOKEN,
+            temperature=0.7,
+        )
+    return None
+
+
 # ─── Orchestrator LLM (routes through backend) ───────────────────────────────
 
+# One breaker per worker process: backend health is shared by all sessions
+ORCHESTRATOR_BREAKER = CircuitBreaker("orchestrator")
+
+
 class OrchestratorLLM(llm.LLM):
-    """Custom LLM that routes through the Focus Flow orchestrator API."""
+    """Custom LLM that routes through the Focus Flow orchestrator API.
+
+    HTTP goes through the worker-wide pooled backend client, so personas do
+    not own sessions of their own.
+    """
 
     def __init__(self, backend_url: str = BACKEND_URL, project_id: str = "",
-                 deep_mode: bool = False, room=None):
+                 deep_mode: bool = False, room=None, fast_path: IntentRouter | None = None,
+                 secondary_llm: llm.LLM | None = None):
         super().__init__()
         self._backend_url = backend_url
-        self._http_session: aiohttp.ClientSession | None = None
         self._project_id = project_id
         self._deep_mode = deep_mode
         self._room = room
         self._thread_id = ""
+        self._greeting_prefetch: tuple[asyncio.Task, dict] | None = None
+        self._cancel_tasks: set[asyncio.Task] = set()
+        self.turn_tracker: TurnTracker | None = None
+        self.fast_path = fast_path if FAST_PATH_ENABLED else None
+        self.breaker = ORCHESTRATOR_BREAKER
+        self.secondary_llm = secondary_llm
+        # Set by the entrypoint; a turn is handed off only when both are set
+        self.turn_budget = 0.0
+        self.task_watcher: TaskWatcher | None = None
+
+    def build_payload(self, user_message: str) -> dict:
+        # request_id identifies this turn so the backend can cancel it on barge-in
+        payload = {"source": "voice", "request_id": uuid.uuid4().hex}
+        if self._thread_id:
+            payload["thread_id"] = self._thread_id
+        if self._project_id:
+            payload["project_id"] = self._project_id
+        if self._deep_mode:
+            payload["deep_mode"] = True
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self._http_session is None or self._http_session.closed:
-            self._http_session = aiohttp.ClientSession()
-        return self._http_session
+        if not user_message:
+            # Greeting intent
+            payload["content"] = ""
+            payload["intent"] = "greeting"
+        else:
+            payload["content"] = user_message
+        return payload
+
+    def prefetch_greeting(self) -> None:
+        """Start the first-turn greeting request before the session exists.
+
+        The first greeting stream picks the result up instead of sending its
+        own request; ``cancel_greeting_prefetch`` drops it on a mismatch.
+        """
+        if self._greeting_prefetch is not None:
+            return
+        payload = self.build_payload("")
+        self._greeting_prefetch = (asyncio.create_task(self._post_chat(payload)), payload)
+
+    def cancel_greeting_prefetch(self) -> None:
+        if self._greeting_prefetch is not None:
+            task, payload = self._greeting_prefetch
+            self._greeting_prefetch = None
+            task.cancel()
+            self.cancel_request(payload["request_id"])
+
+    def _take_greeting_prefetch(self) -> tuple[asyncio.Task, dict] | None:
+        prefetch, self._greeting_prefetch = self._greeting_prefetch, None
+        return prefetch
+
+    def cancel_request(self, request_id: str) -> None:
+        """Tell the backend to stop working on an abandoned turn.
+
+        Fire-and-forget: the caller is usually being cancelled itself, so the
+        request runs as its own task and failures are only logged.
+        """
+        task = asyncio.create_task(self._post_cancel(request_id))
+        self._cancel_tasks.add(task)
+        task.add_done_callback(self._cancel_tasks.discard)
+
+    async def _post_cancel(self, request_id: str) -> None:
+        try:
+            async with get_backend_client().post(
+                f"{self._backend_url}/api/orchestrator/cancel",
+                json={"request_id": request_id, "thread_id": self._thread_id},
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                if resp.status >= 400:
+                    logger.info(f"Orchestrator cancel for {request_id} returned HTTP {resp.status}")
+        except Exception as e:
+            logger.warning(f"Orchestrator cancel for {request_id} failed: {e}")
+
+    async def _post_chat(self, payload: dict) -> dict:
+        """Single-shot JSON request to the orchestrator."""
+        async with get_backend_client().post(
+            f"{self._backend_url}/api/orchestrator/chat", json=payload,
+            timeout=aiohttp.ClientTimeout(total=600),
+        ) as resp:
+            if resp.status >= 400:
+                raise Exception(f"HTTP {resp.status}: {await resp.text()}")
+            return await resp.json()
 
     async def aclose(self) -> None:
-        if self._http_session and not self._http_session.closed:
-            await self._http_session.close()
+        self.cancel_greeting_prefetch()
+        if self._cancel_tasks:
+            await asyncio.gather(*self._cancel_tasks, return_exceptions=True)
+        if self.secondary_llm is not None:
+            await self.secondary_llm.aclose()
+        await super().aclose()
 
     def chat(self, *, chat_ctx: llm.ChatContext, tools: list[llm.Tool] | None = None,
              conn_options: APIConnectOptions = APIConnectOptions(), **kwargs) -> "OrchestratorLLMStream":
@@ -209,6 +402,11 @@ class OrchestratorLLMStream(llm.LLMStream):
         super().__init__(orchestrator_llm, chat_ctx=chat_ctx, tools=tools,
                          conn_options=conn_options)
         self._orchestrator_llm = orchestrator_llm
+        self._sentences_sent = 0
+        # Once handed off, the rest of the reply is collected for later
+        self._handed_off = False
+        self._handoff_sentences: list[str] = []
+        self._first_output = asyncio.Event()
 
     def _extract_user_message(self) -> str:
         """Extract the latest user message from chat context."""
@@ -219,8 +417,8 @@ class OrchestratorLLMStream(llm.LLMStream):
                         return msg.content
                     elif isinstance(msg.content, list):
                         return " ".join(
-                            p.text if hasattr(p, 'text') else str(p)
-                            for p in msg.content if hasattr(p, 'text')
+                            p if isinstance(p, str) else p.text
+                            for p in msg.content if isinstance(p, str) or hasattr(p, 'text')
                         )
                 break
             elif hasattr(msg, 'type') and msg.type == 'message':
@@ -238,75 +436,336 @@ class OrchestratorLLMStream(llm.LLMStream):
 
         return ""
 
+    def _send_chunk(self, content: str) -> None:
+        self._event_ch.send_nowait(
+            llm.ChatChunk(
+                id=f"orchestrator-{self._orchestrator_llm._thread_id or 'unknown'}",
+                delta=llm.ChoiceDelta(role="assistant", content=content),
+            )
+        )
+
+    def _send_sentences(self, sentences: list[str]) -> None:
+        """Send each speakable sentence as its own chunk so TTS can start early."""
+        if sentences:
+            self._first_output.set()
+        if self._handed_off:
+            self._handoff_sentences.extend(sentences)
+            return
+        for sentence in sentences:
+            self._send_chunk(sentence if not self._sentences_sent else f" {sentence}")
+            self._sentences_sent += 1
+
+    async def _publish_open_canvas(self, open_canvas: dict) -> None:
+        """Forward an open_canvas directive to the frontend via data channel."""
+        if not open_canvas or not self._orchestrator_llm._room:
+            return
+        try:
+            canvas_msg = json.dumps({
+                "type": "open_canvas",
+                "canvas": open_canvas.get("canvas", ""),
+                "params": open_canvas.get("params", {}),
+            })
+            await self._orchestrator_llm._room.local_participant.publish_data(
+                canvas_msg, reliable=True, topic="nitara.canvas"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish open_canvas data: {e}")
+
     async def _send_orchestrator_request(self, payload: dict) -> dict:
-        session = await self._orchestrator_llm._ensure_session()
+        """POST the turn to the orchestrator.
+
+        When the backend answers with ``text/event-stream`` the deltas are
+        forwarded to ``_event_ch`` as they arrive and the returned dict has
+        ``streamed`` set. Any other response is read as the single-shot JSON.
+        """
         url = f"{self._orchestrator_llm._backend_url}/api/orchestrator/chat"
-        async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=600)) as resp:
+        headers = {}
+        if ORCHESTRATOR_STREAMING:
+            payload = {**payload, "stream": True}
+            headers["Accept"] = "text/event-stream, application/json"
+        tracker = self._orchestrator_llm.turn_tracker
+        if tracker:
+            tracker.mark("orchestrator_sent")
+        async with get_backend_client().post(url, json=payload, headers=headers,
+                                             timeout=aiohttp.ClientTimeout(total=600)) as resp:
+            if tracker:
+                tracker.mark("orchestrator_first_byte")
             if resp.status >= 400:
                 raise Exception(f"HTTP {resp.status}: {await resp.text()}")
+            if "text/event-stream" in resp.headers.get("Content-Type", ""):
+                return await self._consume_event_stream(resp)
             return await resp.json()
 
+    async def _consume_event_stream(self, resp: aiohttp.ClientResponse) -> dict:
+        """Read orchestrator SSE events, emitting content deltas immediately.
+
+        Events are JSON objects: ``{"type": "delta", "content": "..."}`` for
+        text, ``{"type": "open_canvas", "open_canvas": {...}}`` for canvas
+        directives and ``{"type": "done", ...}`` carrying the final response.
+        ``thread_id`` may appear on any event.
+        """
+        data = {"content": "", "streamed": False}
+        chunker = SpeechChunker()
+        async for event in _iter_sse_events(resp.content):
+            if event.get("thread_id"):
+                data["thread_id"] = event["thread_id"]
+                self._orchestrator_llm._thread_id = event["thread_id"]
+
+            if event.get("open_canvas"):
+                await self._publish_open_canvas(event["open_canvas"])
+
+            event_type = event.get("type", "delta")
+            if event_type == "delta":
+                delta = event.get("content") or event.get("delta") or ""
+                if delta:
+                    self._send_sentences(chunker.push(delta))
+                    data["content"] += delta
+                    data["streamed"] = True
+            elif event_type == "done":
+                if not data["streamed"]:
+                    data["content"] = event.get("content", "")
+                break
+            elif event_type == "error":
+                raise Exception(f"Orchestrator stream error: {event.get('error', 'unknown')}")
+        self._send_sentences(chunker.flush())
+        return data
+
+    async def _request_within_budget(self, payload: dict, user_message: str) -> dict | None:
+        """Send the turn, handing it off if it stays silent past the budget.
+
+        Returns the orchestrator data, or ``None`` when the turn was handed
+        off: a holding line is spoken and the still-running request becomes
+        a background task on the session's task watcher. Its answer is
+        announced later in the session and lands in the orchestrator thread
+        either way. Greetings and turns that already started speaking are
+        never handed off.
+        """
+        request = asyncio.ensure_future(self._resilient_request(payload, user_message))
+        budget = self._orchestrator_llm.turn_budget
+        watcher = self._orchestrator_llm.task_watcher
+        try:
+            if not user_message or budget <= 0 or watcher is None:
+                return await request
+            done, _ = await asyncio.wait({request}, timeout=budget)
+            if done or self._sentences_sent:
+                return await request
+        except asyncio.CancelledError:
+            request.cancel()
+            raise
+
+        self._send_chunk(HANDOFF_HOLDING_LINE)
+        self._sentences_sent += 1
+        self._handed_off = True
+        tracker = self._orchestrator_llm.turn_tracker
+        labels = tracker.labels if tracker else {}
+        get_metrics().incr("orchestrator_handoffs", **labels)
+        logger.info(f"Orchestrator turn {payload['request_id']} handed off after {budget:.1f}s")
+        watcher.track(f"voice-{payload['request_id'][:12]}", "orchestrator-reply",
+                      self._finish_handoff(request, labels))
+        return None
+
+    async def _resilient_request(self, payload: dict, user_message: str) -> dict:
+        """Send the turn through the circuit breaker, hedging when it is slow.
+
+        With the breaker open the backend is skipped: the secondary LLM
+        answers, or ``CircuitOpenError`` triggers the usual fallback line
+        at once. Otherwise, if the primary has produced nothing by its p95
+        time to first output, the secondary LLM is started too and the first to answer
+        wins. A primary that has started speaking always wins. Hedged
+        answers come back as ``{"content": ..., "hedged": True}``.
+        """
+        orchestrator_llm = self._orchestrator_llm
+        breaker = orchestrator_llm.breaker
+        secondary = orchestrator_llm.secondary_llm if user_message else None
+        if not breaker.allow():
+            get_metrics().incr("orchestrator_breaker_rejected")
+            if secondary is not None:
+                return await self._secondary_request(secondary)
+            raise CircuitOpenError("Orchestrator circuit breaker is open")
+
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self._send_orchestrator_request(payload))
+        first_output = asyncio.ensure_future(self._first_output.wait())
+        if secondary is not None:
+            # Only hedgeable turns set the hedge delay
+            first_output.add_done_callback(
+                lambda f: f.cancelled() or breaker.record_first_output(time.perf_counter() - start)
+            )
+        hedge: asyncio.Future | None = None
+        try:
+            waiting = {primary, first_output}
+            hedge_delay = breaker.hedge_delay() if secondary is not None else None
+            done, _ = await asyncio.wait(waiting, timeout=hedge_delay,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                get_metrics().incr("orchestrator_hedges")
+                logger.info(f"Orchestrator slower than {hedge_delay:.1f}s, hedging to secondary LLM")
+                hedge = asyncio.ensure_future(self._secondary_request(secondary))
+                waiting.add(hedge)
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if (hedge in done and not hedge.cancelled() and not hedge.exception()
+                        and not primary.done() and not first_output.done()):
+                    get_metrics().incr("orchestrator_hedge_wins", winner="secondary")
+                    primary.cancel()
+                    orchestrator_llm.cancel_request(payload["request_id"])
+                    breaker.release()
+                    return hedge.result()
+
+            # The primary answered, started speaking, or the hedge failed
+            try:
+                data = await primary
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                breaker.record_failure()
+                # Once the primary has spoken, a second answer can't follow it
+                if (hedge is None or first_output.done() or hedge.cancelled()
+                        or (hedge.done() and hedge.exception())):
+                    raise
+                logger.info("Orchestrator failed, using hedged answer")
+                get_metrics().incr("orchestrator_hedge_wins", winner="secondary")
+                return await hedge
+            breaker.record_success(time.perf_counter() - start)
+            if secondary is not None and not first_output.done():
+                # A single-shot reply: the whole answer is the first output
+                breaker.record_first_output(time.perf_counter() - start)
+            if hedge is not None:
+                get_metrics().incr("orchestrator_hedge_wins", winner="primary")
+            return data
+        except asyncio.CancelledError:
+            primary.cancel()
+            breaker.release()
+            raise
+        finally:
+            first_output.cancel()
+            if hedge is not None and not hedge.done():
+                hedge.cancel()
+
+    async def _secondary_request(self, secondary: llm.LLM) -> dict:
+        """Answer the turn with the secondary LLM, collecting the whole reply."""
+        parts = []
+        async with secondary.chat(chat_ctx=self._chat_ctx) as stream:
+            async for chunk in stream:
+                if chunk.delta and chunk.delta.content:
+                    parts.append(chunk.delta.content)
+        return {"content": "".join(parts), "hedged": True}
+
+    async def _finish_handoff(self, request: asyncio.Future, labels: dict) -> dict:
+        """Wait out a handed-off request; the result is what gets announced."""
+        handoff_start = time.perf_counter()
+        data = await request
+        # Seconds the caller would otherwise have waited in silence
+        saved = time.perf_counter() - handoff_start
+        voice_metrics = get_metrics()
+        voice_metrics.incr("orchestrator_handoff_dead_air_saved_seconds", saved, **labels)
+        voice_metrics.observe("orchestrator_handoff_completion", saved, **labels)
+
+        if data.get("thread_id"):
+            self._orchestrator_llm._thread_id = data["thread_id"]
+        if data.get("streamed"):
+            content = " ".join(self._handoff_sentences)
+        else:
+            await self._publish_open_canvas(data.get("open_canvas"))
+            content = " ".join(speakable_sentences(data.get("content", "")))
+        logger.info(f"Handed-off turn finished after {saved:.1f}s more: {content[:100]}")
+        return {"result": content or "Done."}
+
+    async def _try_fast_path(self, user_message: str) -> bool:
+        """Answer simple intents from the tools; False forwards the turn."""
+        router = self._orchestrator_llm.fast_path
+        tracker = self._orchestrator_llm.turn_tracker
+        labels = tracker.labels if tracker else {}
+        voice_metrics = get_metrics()
+
+        match = router.classify(user_message)
+        if match is None or match.confidence < router.threshold:
+            voice_metrics.incr("fast_path_forwarded", **labels)
+            if match is not None:
+                logger.info(f"Fast path: forwarded {match.intent} ({match.confidence:.2f} < {router.threshold})")
+            return False
+
+        start = time.perf_counter()
+        try:
+            answer = await router.answer(match)
+        except Exception as e:
+            logger.warning(f"Fast path {match.intent} failed, forwarding: {e}")
+            voice_metrics.incr("fast_path_forwarded", **labels)
+            return False
+        elapsed = time.perf_counter() - start
+        voice_metrics.observe("turn_path", elapsed, path="fast", **labels)
+        voice_metrics.incr("fast_path_routed", intent=match.intent, **labels)
+        logger.info(f"Fast path: routed {match.intent} ({match.confidence:.2f}) in {elapsed * 1000:.0f}ms")
+        self._send_sentences(speakable_sentences(answer) or ["Done."])
+        return True
+
     async def _run(self) -> None:
         user_message = self._extract_user_message()
+        if user_message and self._orchestrator_llm.fast_path is not None:
+            if await self._try_fast_path(user_message):
+                return
 
-        payload = {"source": "voice"}
-        if self._orchestrator_llm._thread_id:
-            payload["thread_id"] = self._orchestrator_llm._thread_id
-        if self._orchestrator_llm._project_id:
-            payload["project_id"] = self._orchestrator_llm._project_id
-        if self._orchestrator_llm._deep_mode:
-            payload["deep_mode"] = True
-
-        if not user_message:
-            # Greeting intent
-            payload["content"] = ""
-            payload["intent"] = "greeting"
-        else:
-            payload["content"] = user_message
+        payload = self._orchestrator_llm.build_payload(user_message)
+        if user_message:
             logger.info(f"Orchestrator request: {user_message[:100]}")
 
+        prefetched = None if user_message else self._orchestrator_llm._take_greeting_prefetch()
+        if prefetched is not None:
+            prefetch_task, payload = prefetched
+
+        tracker = self._orchestrator_llm.turn_tracker
+        labels = tracker.labels if tracker else {}
+        voice_metrics = get_metrics()
+        request_start = time.perf_counter()
         try:
-            data = await self._send_orchestrator_request(payload)
+            if prefetched is not None:
+                data = await prefetch_task
+                logger.info("Using prefetched greeting")
+            else:
+                data = await self._request_within_budget(payload, user_message)
+                if data is None:
+                    return  # handed off; the holding line has been sent
+            elapsed = time.perf_counter() - request_start
+            voice_metrics.incr("orchestrator_useful_seconds", elapsed, **labels)
+            voice_metrics.observe("turn_path", elapsed, path="orchestrator", **labels)
+            if tracker:
+                tracker.mark("orchestrator_parsed")
+                tracker.observe("orchestrator_request", elapsed)
 
             if data.get("thread_id"):
                 self._orchestrator_llm._thread_id = data["thread_id"]
 
+            if data.get("streamed"):
+                logger.info(f"Orchestrator streamed response: {data['content'][:100]}")
+                return
+
             # Forward open_canvas directive via data channel
-            open_canvas = data.get("open_canvas")
-            if open_canvas and self._orchestrator_llm._room:
-                try:
-                    canvas_msg = json.dumps({
-                        "type": "open_canvas",
-                        "canvas": open_canvas.get("canvas", ""),
-                        "params": open_canvas.get("params", {}),
-                    })
-                    await self._orchestrator_llm._room.local_participant.publish_data(
-                        canvas_msg, reliable=True, topic="nitara.canvas"
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to publish open_canvas data: {e}")
+            await self._publish_open_canvas(data.get("open_canvas"))
 
             content = data.get("content", "") or "Done."
             logger.info(f"Orchestrator response: {content[:100]}")
-
-            self._event_ch.send_nowait(
-                llm.ChatChunk(
-                    id=f"orchestrator-{data.get('thread_id', 'unknown')}",
-                    delta=llm.ChoiceDelta(role="assistant", content=content),
-                )
-            )
+            self._send_sentences(speakable_sentences(content) or ["Done."])
+        except asyncio.CancelledError:
+            # Barge-in: the session dropped this generation. Leaving the
+            # request context has already aborted the HTTP call; tell the
+            # backend too so it stops spending LLM time on the answer.
+            elapsed = time.perf_counter() - request_start
+            voice_metrics.incr("orchestrator_wasted_seconds", elapsed, **labels)
+            voice_metrics.incr("orchestrator_cancelled_turns", **labels)
+            logger.info(f"Orchestrator turn {payload['request_id']} cancelled after {elapsed:.1f}s")
+            self._orchestrator_llm.cancel_request(payload["request_id"])
+            raise
         except asyncio.TimeoutError:
             logger.error("Orchestrator request timed out after 600s")
             self._event_ch.send_nowait(
                 llm.ChatChunk(
                     id="orchestrator-timeout",
                     delta=llm.ChoiceDelta(role="assistant",
-                        content="That's still processing. Check your dashboard or ask me again shortly."),
+                        content=TIMEOUT_LINE),
                 )
             )
         except Exception as e:
             logger.error(f"Orchestrator request failed: {e}")
-            fallback = "Hey Vimo. I'm here. What would you like to work on?" if not user_message else "Something went wrong on my end. Could you try again?"
+            fallback = GREETING_FALLBACK_LINE if not user_message else FAILURE_LINE
             self._event_ch.send_nowait(
                 llm.ChatChunk(
                     id="orchestrator-fail",
@@ -315,40 +774,248 @@ class OrchestratorLLMStream(llm.LLMStream):
             )
 
 
+def _decode_sse_event(event_name: str, data_lines: list[str]) -> dict | None:
+    """Turn one SSE event block into a dict; ``None`` marks ``[DONE]``."""
+    body = "\n".join(data_lines)
+    if body == "[DONE]":
+        return None
+    try:
+        event = json.loads(body)
+    except json.JSONDecodeError:
+        event = {"type": event_name or "delta", "content": body}
+    if not isinstance(event, dict):
+        event = {"content": str(event)}
+    if event_name and "type" not in event:
+        event["type"] = event_name
+    return event
+
+
+async def _iter_sse_events(stream: aiohttp.StreamReader):
+    """Yield JSON payloads from a server-sent events stream.
+
+    Multi-line ``data:`` fields are joined, the ``event:`` name is used as the
+    payload ``type`` when it has none, and ``[DONE]`` ends the stream.
+    """
+    event_name = ""
+    data_lines: list[str] = []
+    async for raw in stream:
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line.startswith(":"):
+            continue
+        if line.startswith("event:"):
+            event_name = line[6:].strip()
+        elif line.startswith("data:"):
+            value = line[5:]
+            data_lines.append(value[1:] if value.startswith(" ") else value)
+        elif not line and data_lines:
+            event = _decode_sse_event(event_name, data_lines)
+            if event is None:
+                return
+            yield event
+            event_name, data_lines = "", []
+
+    if data_lines:
+        event = _decode_sse_event(event_name, data_lines)
+        if event is not None:
+            yield event
+
+
+# ─── Bounded Context ──────────────────────────────────────────────────────────
+
+class BoundedContextAgent(Agent):
+    """Agent whose chat history is bounded by a per-persona context policy.
+
+    The policy compacts the context given to the LLM on every turn, and the
+    agent's own history is trimmed to match, so neither grows with the
+    length of the call. See chat_context.
+
+    When ``turn_gate`` is set, junk turns (filler, too short, or short and
+    low-confidence) are dropped before the LLM sees them. See input_stage.
+    """
+
+    context_policy: ContextWindow | None = None
+    turn_gate: TurnGate | None = None
+
+    async def stt_node(self, audio, model_settings):
+        async for ev in Agent.default.stt_node(self, audio, model_settings):
+            if (self.turn_gate is not None and isinstance(ev, stt.SpeechEvent)
+                    and ev.type == stt.SpeechEventType.FINAL_TRANSCRIPT and ev.alternatives):
+                self.turn_gate.observe_final(ev.alternatives[0].confidence)
+            yield ev
+
+    async def on_user_turn_completed(self, turn_ctx, new_message):
+        if self.turn_gate is not None:
+            text = new_message.text_content or ""
+            reason = self.turn_gate.check(text)
+            if reason is not None:
+                self.turn_gate.record_drop(reason, text, backend_call=isinstance(self.llm, OrchestratorLLM))
+                raise StopResponse()
+        if self.context_policy is None:
+            return
+        compacted = self.context_policy.compact(self.chat_ctx)
+        kept = {item.id for item in compacted.items}
+        if any(item.id not in kept for item in self.chat_ctx.items if item.id != SUMMARY_ITEM_ID):
+            await self.update_chat_ctx(compacted)
+
+    async def llm_node(self, chat_ctx, tools, model_settings):
+        if self.context_policy is not None:
+            chat_ctx = self.context_policy.compact(chat_ctx, report=True)
+        async for chunk in Agent.default.llm_node(self, chat_ctx, tools, model_settings):
+            yield chunk
+
+    async def on_exit(self):
+        if self.context_policy is not None:
+            await self.context_policy.aclose()
+
+
+# ─── Cached Speech ────────────────────────────────────────────────────────────
+
+class CachedSpeechAgent(BoundedContextAgent):
+    """Agent whose fixed phrases are played from the TTS cache.
+
+    When a turn's first text chunk is one of ``cacheable_phrases`` (or a
+    pre-rendered briefing, see ``has_cached_audio``) and its audio is in
+    the cache, the audio plays at once and only the rest of the turn goes
+    to TTS. Other first chunks are never looked up. A single-chunk turn
+    that is one of ``cacheable_phrases`` is recorded while it is
+    synthesized, so the next one is a hit. Other replies are never written to the cache: they can
+    carry names, scores and task results.
+    """
+
+    tts_voice_id = ""
+    cacheable_phrases: frozenset[str] = frozenset(normalize_phrase(p) for p in FIXED_PHRASES)
+
+    def has_cached_audio(self, text: str) -> bool:
+        """Whether ``text`` is a phrase whose audio the cache may hold."""
+        return bool(self.tts_voice_id) and normalize_phrase(text) in self.cacheable_phrases
+
+    async def tts_node(self, text, model_settings):
+        cache = get_tts_cache()
+        chunks = text.__aiter__()
+        first = await anext(chunks, None)
+        if first is None:
+            return
+        key = cache_key(self.tts_voice_id, first, TTS_MODEL)
+        cached = await cache.get(key) if self.has_cached_audio(first) else None
+        if cached is not None:
+            for frame in cached.frames():
+                yield frame
+            # The cached audio is already playing while we wait for more text
+            following = await anext(chunks, None)
+            if following is None:
+                return
+
+            async def rest():
+                yield following
+                async for chunk in chunks:
+                    yield chunk
+
+            async for frame in Agent.default.tts_node(self, rest(), model_settings):
+                yield frame
+            return
+
+        seen = 0
+
+        async def replay():
+            nonlocal seen
+            seen += 1
+            yield first
+            async for chunk in chunks:
+                seen += 1
+                yield chunk
+
+        recorded = [] if self.tts_voice_id and normalize_phrase(first) in self.cacheable_phrases else None
+        async for frame in Agent.default.tts_node(self, replay(), model_settings):
+            if recorded is not None:
+                recorded.append(frame)
+            yield frame
+        # Only reached when playback was not interrupted; the frames are the
+        # phrase's alone only if no other chunk followed it
+        if recorded and seen == 1:
+            get_metrics().incr("tts_cache_recorded")
+            await cache.put(key, CachedAudio.from_frames(recorded))
+
+
+_phrase_prerender: asyncio.Task | None = None
+
+
+def start_phrase_prerender(persona_voices: dict) -> None:
+    """Pre-render FIXED_PHRASES for every persona voice, once per process."""
+    global _phrase_prerender
+    if _phrase_prerender is not None or not TTS_PRERENDER:
+        return
+
+    async def prerender() -> None:
+        rendered = await get_tts_cache().prerender(
+            _new_tts, persona_voices, FIXED_PHRASES, TTS_MODEL,
+        )
+        if rendered:
+            logger.info(f"Pre-rendered {rendered} fixed phrases")
+
+    _phrase_prerender = asyncio.create_task(prerender())
+
+
+async def _frames(audio: CachedAudio):
+    for frame in audio.frames():
+        yield frame
+
+
+async def _prerender_briefing(text: str) -> None:
+    if not TTS_PRERENDER:
+        return
+    await get_tts_cache().prerender(
+        _new_tts, {"nitara-analyst": PERSONA_VOICES["nitara-analyst"]}, [text], TTS_MODEL,
+    )
+
+
+# Analyst opening briefing, rebuilt when new reports land; see briefing
+ANALYST_BRIEFING = BriefingBuilder(REPORT_INDEX, REPORTS_DIR, render=_prerender_briefing)
+
+
 # ─── Persona: Nitara Main (general voice) ────────────────────────────────────
 
-class NitaraMain(Agent):
+class NitaraMain(CachedSpeechAgent):
     """General-purpose voice assistant. Warm, confident. Routes through orchestrator."""
 
+    # Set by the entrypoint once the session exists
+    task_watcher: TaskWatcher | None = None
+
     def __init__(self, voice_preset: str = "nova", thread_id: str = "",
                  project_id: str = "", deep_mode: bool = False,
-                 stt_instance=None, room=None):
-        voice_id = get_voice_id(voice_preset) if voice_preset else PERSONA_VOICES["nitara-main"]
+                 stt_instance=None, room=None, assets: "PersonaAssets | None" = None):
+        persona_voices = assets.persona_voices if assets else PERSONA_VOICES
+        voice_id = get_voice_id(voice_preset) if voice_preset else persona_voices["nitara-main"]
         orchestrator_llm = OrchestratorLLM(
             backend_url=BACKEND_URL, project_id=project_id,
-            deep_mode=deep_mode, room=room,
+            deep_mode=deep_mode, room=room, fast_path=IntentRouter(),
+            # Deep turns are slow by design; a thread-less quick answer is no substitute
+            secondary_llm=(build_direct_llm("Orchestrator hedge")
+                           if ORCHESTRATOR_HEDGE and not deep_mode else None),
         )
         if thread_id:
             orchestrator_llm._thread_id = thread_id
 
-        stt = stt_instance or inference.STT(model="deepgram/nova-3")
+        stt = stt_instance or pooled_default_stt()
 
         super().__init__(
-            instructions=load_soul_instructions(),
+            instructions=assets.instructions["nitara-main"] if assets else load_soul_instructions(),
             stt=stt,
             llm=orchestrator_llm,
-            tts=inference.TTS(model="cartesia/sonic-2", voice=voice_id),
+            tts=pooled_tts(voice_id),
         )
+        self.tts_voice_id = voice_id
+        # The orchestrator keeps the thread; locally only recent turns matter
+        self.context_policy = ContextWindow("nitara-main")
 
     @function_tool()
     async def enqueue_task(self, skill: str, arguments: str = "", priority: str = "medium") -> str:
         """Queue a task for Nitara's autonomous agents. Use for portfolio analysis, research, etc."""
-        return await enqueue_task(skill, arguments, priority)
+        return await enqueue_task(skill, arguments, priority, watcher=self.task_watcher)
 
     @function_tool()
     async def check_task_status(self, task_id: str = "") -> str:
         """Check the status of the autonomous agent task queue."""
-        return await check_task_status(task_id)
+        return await check_task_status(task_id, watcher=self.task_watcher)
 
     @function_tool()
     async def read_latest_report(self, report_type: str = "portfolio-analysis") -> str:
@@ -381,25 +1048,32 @@ You have access to tools for reading reports and checking task status.
 Use them proactively when discussing portfolio or strategy topics."""
 
 
-class NitaraAnalyst(Agent):
+class NitaraAnalyst(CachedSpeechAgent):
     """Portfolio analyst persona. Authoritative, data-driven."""
 
-    def __init__(self, stt_instance=None, room=None, thread_id: str = ""):
-        voice_id = PERSONA_VOICES["nitara-analyst"]
+    # Set by the entrypoint once the session exists
+    task_watcher: TaskWatcher | None = None
+
+    def __init__(self, stt_instance=None, room=None, thread_id: str = "",
+                 assets: "PersonaAssets | None" = None):
+        voice_id = (assets.persona_voices if assets else PERSONA_VOICES)["nitara-analyst"]
         orchestrator_llm = OrchestratorLLM(
             backend_url=BACKEND_URL, room=room, deep_mode=True,
+            fast_path=IntentRouter({"latest_report"}),
         )
         if thread_id:
             orchestrator_llm._thread_id = thread_id
 
-        stt = stt_instance or inference.STT(model="deepgram/nova-3")
+        stt = stt_instance or pooled_default_stt()
 
         super().__init__(
-            instructions=ANALYST_INSTRUCTIONS,
+            instructions=assets.instructions["nitara-analyst"] if assets else ANALYST_INSTRUCTIONS,
             stt=stt,
             llm=orchestrator_llm,
-            tts=inference.TTS(model="cartesia/sonic-2", voice=voice_id),
+            tts=pooled_tts(voice_id),
         )
+        self.tts_voice_id = voice_id
+        self.context_policy = ContextWindow("nitara-analyst")
 
     @function_tool()
     async def read_latest_report(self, report_type: str = "portfolio-analysis") -> str:
@@ -409,20 +1083,36 @@ class NitaraAnalyst(Agent):
     @function_tool()
     async def enqueue_task(self, skill: str, arguments: str = "", priority: str = "high") -> str:
         """Queue a deep analysis task."""
-        return await enqueue_task(skill, arguments, priority)
+        return await enqueue_task(skill, arguments, priority, watcher=self.task_watcher)
+
+    def has_cached_audio(self, text: str) -> bool:
+        briefing = ANALYST_BRIEFING.current()
+        return super().has_cached_audio(text) or (
+            briefing is not None and normalize_phrase(text) == normalize_phrase(briefing)
+        )
 
     async def on_enter(self):
-        self.session.generate_reply(
-            instructions="Greet the founder and briefly summarize the latest portfolio status. Mention you can dive deeper into any project.",
+        briefing = ANALYST_BRIEFING.current()
+        if briefing is None:
+            get_metrics().incr("analyst_briefing", source="live")
+            self.session.generate_reply(
+                instructions="Greet the founder and briefly summarize the latest portfolio status. Mention you can dive deeper into any project.",
+                allow_interruptions=True,
+            )
+            return
+
+        get_metrics().incr("analyst_briefing", source="cached")
+        self.llm.cancel_greeting_prefetch()
+        audio = await get_tts_cache().get(cache_key(self.tts_voice_id, briefing, TTS_MODEL))
+        self.session.say(
+            briefing, audio=_frames(audio) if audio is not None else None,
             allow_interruptions=True,
         )
 
 
 # ─── Persona: Nitara Profiler (profiling conversations) ──────────────────────
 
-def _build_profiler_instructions() -> str:
-    """Build profiling instructions with current gap data."""
-    base = """You are Nitara in Profiler mode — friendly, curious, conversational.
+PROFILER_INSTRUCTIONS = """You are Nitara in Profiler mode — friendly, curious, conversational.
 You are speaking via voice on a phone call. This is a profiling session.
 
 Your goal: Learn about the founder through natural conversation. You're gathering
@@ -439,64 +1129,54 @@ Guidelines:
 - Keep the call under 10 minutes.
 - Speak naturally — no formatting, no bullet points."""
 
+
+def _build_profiler_gap_summary() -> str:
+    """Summarize the top profiling gaps for the profiler prompt."""
     try:
         gaps = ""
-        with open("/srv/focus-flow/07_system/agent/profiling-checklist.json", "r") as f:
-            checklist = json.load(f)
-        overall = checklist.get("overall_completeness", 0)
-
-        # Find top gaps
-        priority_order = {"critical": 0, "high": 1, "medium": 2}
-        gap_items = []
-        for dk, domain in checklist.get("domains", {}).items():
-            if domain["completeness"] >= 80:
-                continue
-            for item in domain.get("items", []):
-                if item["status"] == "unknown":
-                    gap_items.append({
-                        "domain": dk,
-                        "label": item["label"],
-                        "priority": domain.get("priority", "medium"),
-                    })
-        gap_items.sort(key=lambda g: priority_order.get(g["priority"], 3))
-        top_gaps = gap_items[:5]
+        top_gaps = CHECKLIST_STORE.top_gaps(5)
+        overall = CHECKLIST_STORE.overall_completeness()
 
         if top_gaps:
             gaps = "\n\nCurrent profiling gaps to explore (in priority order):\n"
             for g in top_gaps:
-                gaps += f"- {g['domain']}: {g['label']}\n"
+                gaps += f"- {g.domain_key}: {g.label}\n"
             gaps += f"\nOverall completeness: {overall}%. Target: 80%."
 
-        return base + gaps
+        return gaps
     except Exception:
-        return base
+        return ""
+
+
+def _build_profiler_context_seed() -> str:
+    """What the checklist already records about the founder, for the profiler's summary."""
+    try:
+        lines = []
+        for domain in CHECKLIST_STORE.checklist().get("domains", {}).values():
+            for item in domain.get("items", []):
+                if item.get("notes") and item.get("status") in ("known", "partial"):
+                    lines.append(f"- {domain.get('label', '')}, {item['label']}: {item['notes']}")
+        return "\n".join(lines)
+    except Exception:
+        return ""
+
+
+def _build_profiler_instructions() -> str:
+    """Build profiling instructions with current gap data."""
+    return PROFILER_INSTRUCTIONS + _build_profiler_gap_summary()
 
 
-class NitaraProfiler(Agent):
+class NitaraProfiler(CachedSpeechAgent):
     """Profiling persona. Friendly, curious. Uses Claude directly for focused conversation."""
 
-    def __init__(self, stt_instance=None, room=None, thread_id: str = ""):
-        voice_id = PERSONA_VOICES["nitara-profiler"]
-        stt = stt_instance or inference.STT(model="deepgram/nova-3")
+    def __init__(self, stt_instance=None, room=None, thread_id: str = "",
+                 assets: "PersonaAssets | None" = None):
+        voice_id = (assets.persona_voices if assets else PERSONA_VOICES)["nitara-profiler"]
+        stt = stt_instance or pooled_default_stt()
 
-        # Use Anthropic Claude directly for focused profiling (not orchestrator)
-        if HAS_ANTHROPIC_PLUGIN and ANTHROPIC_API_KEY:
-            llm_instance = anthropic_plugin.LLM(
-                model="claude-sonnet-4-20250514",
-                api_key=ANTHROPIC_API_KEY,
-                temperature=0.7,
-            )
-            logger.info("Profiler using Claude Sonnet directly via Anthropic plugin")
-        elif OPENCLAW_BASE_URL and OPENCLAW_TOKEN:
-            # Fallback: use OpenClaw gateway (OpenAI-compatible)
-            llm_instance = inference.LLM(
-                model="anthropic/claude-sonnet-4-20250514",
-                base_url=OPENCLAW_BASE_URL,
-                api_key=OPENCLAW_TOKEN,
-                temperature=0.7,
-            )
-            logger.info("Profiler using Claude via OpenClaw gateway")
-        else:
+        # Use Claude directly for focused profiling (not orchestrator)
+        llm_instance = build_direct_llm("Profiler")
+        if llm_instance is None:
             # Last resort: orchestrator
             llm_instance = OrchestratorLLM(backend_url=BACKEND_URL, room=room)
             if thread_id:
@@ -504,12 +1184,29 @@ class NitaraProfiler(Agent):
             logger.info("Profiler falling back to orchestrator LLM")
 
         super().__init__(
-            instructions=_build_profiler_instructions(),
+            instructions=assets.instructions["nitara-profiler"] if assets else _build_profiler_instructions(),
             stt=stt,
             llm=llm_instance,
-            tts=inference.TTS(model="cartesia/sonic-2", voice=voice_id),
+            tts=pooled_tts(voice_id),
+        )
+        self.tts_voice_id = voice_id
+        self.context_policy = RollingSummaryContext(
+            "nitara-profiler",
+            seed=assets.profiler_context_seed if assets else _build_profiler_context_seed(),
+            summarizer=None if isinstance(llm_instance, OrchestratorLLM) else llm_instance,
         )
 
+    async def llm_node(self, chat_ctx, tools, model_settings):
+        """Speak the direct Claude reply sentence by sentence, markdown stripped."""
+        stream = super().llm_node(chat_ctx, tools, model_settings)
+        if isinstance(self.llm, OrchestratorLLM):
+            # Orchestrator fallback already chunks its own output
+            async for chunk in stream:
+                yield chunk
+            return
+        async for chunk in speakable_llm_stream(stream):
+            yield chunk
+
     @function_tool()
     async def update_profiling_data(self, domain: str, key: str, value: str, notes: str = "") -> str:
         """Update the profiling checklist with information learned from the conversation.
@@ -533,6 +1230,63 @@ class NitaraProfiler(Agent):
         )
 
 
+# ─── Persona Asset Cache ──────────────────────────────────────────────────────
+
+class PersonaAssets:
+    """Prebuilt persona instructions and voice config, invalidated on file mtime.
+
+    Built in ``prewarm`` and kept in ``proc.userdata`` so constructing a
+    persona does no file I/O. ``refresh`` re-stats the source files and only
+    rebuilds what changed; it is blocking and meant for an executor thread.
+    """
+
+    def __init__(self):
+        self._mtimes: dict[str, float | None] = {}
+        self.voice_config: dict = {}
+        self.persona_voices: dict = dict(PERSONA_VOICES)
+        self.profiler_gaps = ""
+        self.profiler_context_seed = ""
+        self.instructions: dict[str, str] = {}
+
+    @staticmethod
+    def _mtime(path: str) -> float | None:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _changed(self, path: str) -> bool:
+        mtime = self._mtime(path)
+        if path in self._mtimes and self._mtimes[path] == mtime:
+            return False
+        self._mtimes[path] = mtime
+        return True
+
+    def refresh(self) -> bool:
+        """Rebuild any asset whose source file changed; True if anything did."""
+        rebuilt = []
+        if self._changed(VOICES_PATH):
+            self.voice_config = load_voice_config()
+            self.persona_voices = resolve_persona_voices(self.voice_config)
+            rebuilt.append("voices")
+        if self._changed(SOUL_PATH):
+            self.instructions["nitara-main"] = load_soul_instructions()
+            rebuilt.append("soul")
+        # The checklist store reloads on external writes and its gap index
+        # follows every update, so this is a cached lookup most of the time
+        profiler_gaps = _build_profiler_gap_summary()
+        if profiler_gaps != self.profiler_gaps or "nitara-profiler" not in self.instructions:
+            self.profiler_gaps = profiler_gaps
+            self.instructions["nitara-profiler"] = PROFILER_INSTRUCTIONS + self.profiler_gaps
+            rebuilt.append("profiler")
+        # Notes change without moving the gaps; this is an in-memory walk
+        self.profiler_context_seed = _build_profiler_context_seed()
+        self.instructions.setdefault("nitara-analyst", ANALYST_INSTRUCTIONS)
+        if rebuilt:
+            logger.info(f"Persona assets rebuilt: {', '.join(rebuilt)}")
+        return bool(rebuilt)
+
+
 # ─── Metadata Extraction ─────────────────────────────────────────────────────
 
 def extract_metadata(ctx: JobContext, participant) -> dict:
@@ -542,9 +1296,9 @@ def extract_metadata(ctx: JobContext, participant) -> dict:
     project_id = ""
     deep_mode = False
 
-    # Participant metadata
+    # Participant metadata (None while still waiting for the participant)
     try:
-        meta = json.loads(participant.metadata or "{}")
+        meta = json.loads(getattr(participant, "metadata", None) or "{}")
         voice_preset = meta.get("voicePreset", "nova")
         thread_id = meta.get("threadId", "")
         project_id = meta.get("projectId", "")
@@ -588,7 +1342,7 @@ def detect_persona_from_metadata(ctx: JobContext, participant) -> str:
         pass
 
     try:
-        meta = json.loads(participant.metadata or "{}")
+        meta = json.loads(getattr(participant, "metadata", None) or "{}")
         persona = meta.get("persona", "")
         if persona:
             return persona
@@ -598,6 +1352,15 @@ def detect_persona_from_metadata(ctx: JobContext, participant) -> str:
     return "nitara-main"
 
 
+def room_names_session(ctx: JobContext) -> bool:
+    """True when room metadata already pins the persona or thread."""
+    try:
+        room_meta = json.loads(ctx.room.metadata or "{}")
+    except (json.JSONDecodeError, TypeError):
+        return False
+    return bool(room_meta.get("persona") or room_meta.get("threadId"))
+
+
 def is_sip_participant(participant) -> bool:
     """Check if participant joined via SIP (phone call)."""
     try:
@@ -606,19 +1369,43 @@ def is_sip_participant(participant) -> bool:
         return False
 
 
+# ─── Persona Builder ──────────────────────────────────────────────────────────
+
+def build_persona(persona_name: str, meta: dict, stt_instance, room,
+                  assets: PersonaAssets | None = None) -> Agent:
+    """Construct the persona agent selected by metadata."""
+    if persona_name == "nitara-profiler":
+        return NitaraProfiler(
+            stt_instance=stt_instance, room=room,
+            thread_id=meta["thread_id"], assets=assets,
+        )
+    if persona_name == "nitara-analyst":
+        return NitaraAnalyst(
+            stt_instance=stt_instance, room=room,
+            thread_id=meta["thread_id"], assets=assets,
+        )
+    return NitaraMain(
+        voice_preset=meta["voice_preset"],
+        thread_id=meta["thread_id"],
+        project_id=meta["project_id"],
+        deep_mode=meta["deep_mode"],
+        stt_instance=stt_instance,
+        room=room,
+        assets=assets,
+    )
+
+
 # ─── Session Builder ──────────────────────────────────────────────────────────
 
 def build_session(vad, using_sttv2: bool, is_sip: bool = False) -> AgentSession:
-    """Build AgentSession with appropriate settings."""
+    """Build AgentSession with the channel's starting endpointing profile."""
     kwargs = {"vad": vad}
 
     if using_sttv2:
         kwargs["turn_detection"] = "stt"
-        kwargs["min_endpointing_delay"] = 0.3
-        kwargs["max_endpointing_delay"] = 3.0
-    else:
-        kwargs["min_endpointing_delay"] = 0.5
-        kwargs["max_endpointing_delay"] = 5.0
+    profile = endpointing_profile(is_sip, using_sttv2)
+    kwargs["min_endpointing_delay"] = profile.min_delay
+    kwargs["max_endpointing_delay"] = profile.max_delay
 
     return AgentSession(**kwargs)
 
@@ -626,14 +1413,86 @@ def build_session(vad, using_sttv2: bool, is_sip: bool = False) -> AgentSession:
 # ─── Entrypoint (handles all personas) ────────────────────────────────────────
 
 def prewarm(proc: JobProcess):
-    proc.userdata["vad"] = silero.VAD.load()
+    proc.userdata["vad"] = load_vad()
+
+    keyword_cache = KeywordCache()
+    keyword_cache.prefill()
+    proc.userdata["keywords"] = keyword_cache
+
+    try:
+        REPORT_INDEX.refresh()
+        ANALYST_BRIEFING.rebuild()
+    except Exception as e:
+        logger.warning(f"Failed to index reports: {e}")
+
+    assets = None
+    if PERSONA_ASSET_CACHE:
+        assets = PersonaAssets()
+        assets.refresh()
+        proc.userdata["assets"] = assets
+
+    fill_speech_pool(keyword_cache.get(), assets.persona_voices if assets else PERSONA_VOICES)
 
 
 async def entrypoint(ctx: JobContext):
+    """Start a voice session, overlapping setup with the participant wait.
+
+    Once the room is connected, STT is built from room metadata while we wait
+    for the participant. When the room already names the persona or thread,
+    the persona is built too and its orchestrator greeting is requested early.
+    If the participant's metadata disagrees with that guess, the speculative
+    greeting is cancelled and the affected pieces are rebuilt.
+    """
+    job_start = time.perf_counter()
+    retain_backend_client()
+    ctx.add_shutdown_callback(release_backend_client)
+    # Runs for the life of the process; worker_load reads what it reports
+    get_loop_lag_monitor().start()
+
+    # Re-stat persona asset files off the event loop while we connect
+    assets: PersonaAssets | None = ctx.proc.userdata.get("assets")
+    assets_refresh = (
+        asyncio.get_running_loop().run_in_executor(None, assets.refresh)
+        if assets else None
+    )
+
     logger.info(f"Connecting to room {ctx.room.name}")
     await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
+    participant_task = asyncio.ensure_future(ctx.wait_for_participant())
+
+    keyword_cache = ctx.proc.userdata.setdefault("keywords", KeywordCache())
+    keyword_cache.start()
+    ctx.add_shutdown_callback(keyword_cache.aclose)
+    REPORT_INDEX.start()
+    ctx.add_shutdown_callback(REPORT_INDEX.aclose)
+    ANALYST_BRIEFING.start()
+    ctx.add_shutdown_callback(ANALYST_BRIEFING.aclose)
+    ctx.add_shutdown_callback(CHECKLIST_STORE.aclose)
+
+    if assets_refresh is not None:
+        try:
+            await assets_refresh
+        except Exception as e:
+            logger.warning(f"Persona asset refresh failed, using cached copy: {e}")
+
+    # Speculative setup from room metadata while the participant joins
+    guess_meta = extract_metadata(ctx, None)
+    guess_persona = detect_persona_from_metadata(ctx, None)
+    stt_instance, using_sttv2 = build_stt(keyword_cache.get(guess_meta["project_id"]))
+    agent = None
+    if room_names_session(ctx):
+        agent = build_persona(guess_persona, guess_meta, stt_instance, ctx.room, assets)
+        # A fresh analyst briefing replaces the orchestrator greeting
+        briefed = isinstance(agent, NitaraAnalyst) and ANALYST_BRIEFING.current() is not None
+        if isinstance(agent.llm, OrchestratorLLM) and not briefed:
+            agent.llm.prefetch_greeting()
 
-    participant = await ctx.wait_for_participant()
+    try:
+        participant = await participant_task
+    except BaseException:
+        if agent is not None and isinstance(agent.llm, OrchestratorLLM):
+            agent.llm.cancel_greeting_prefetch()
+        raise
     logger.info(f"Participant joined: {participant.identity}")
 
     meta = extract_metadata(ctx, participant)
@@ -646,30 +1505,30 @@ async def entrypoint(ctx: JobContext):
         f"Deep: {meta['deep_mode']}, SIP: {sip_call}"
     )
 
-    # Build STT with keyword boosting
-    keywords = await fetch_keywords()
-    stt_instance, using_sttv2 = build_stt(keywords)
-
-    # Select persona
-    if persona_name == "nitara-profiler":
-        agent = NitaraProfiler(
-            stt_instance=stt_instance, room=ctx.room,
-            thread_id=meta["thread_id"],
-        )
-    elif persona_name == "nitara-analyst":
-        agent = NitaraAnalyst(
-            stt_instance=stt_instance, room=ctx.room,
-            thread_id=meta["thread_id"],
-        )
-    else:
-        agent = NitaraMain(
-            voice_preset=meta["voice_preset"],
-            thread_id=meta["thread_id"],
-            project_id=meta["project_id"],
-            deep_mode=meta["deep_mode"],
-            stt_instance=stt_instance,
-            room=ctx.room,
-        )
+    speculative = agent is not None and (persona_name, meta) == (guess_persona, guess_meta)
+    if agent is not None and not speculative:
+        logger.info("Participant metadata differs from room metadata; rebuilding persona")
+        if isinstance(agent.llm, OrchestratorLLM):
+            agent.llm.cancel_greeting_prefetch()
+        # The shared stt_instance stays with this job unless the project changed
+        release_speech_clients(agent.tts, *([agent.stt] if agent.stt is not stt_instance else []))
+    if meta["project_id"] != guess_meta["project_id"]:
+        release_speech_clients(stt_instance)
+        stt_instance, using_sttv2 = build_stt(keyword_cache.get(meta["project_id"]))
+
+    persona_start = time.perf_counter()
+    if not speculative:
+        agent = build_persona(persona_name, meta, stt_instance, ctx.room, assets)
+    persona_ms = (time.perf_counter() - persona_start) * 1000
+
+    async def release_speech() -> None:
+        # The persona holds stt_instance, or its own pooled STT when there was none
+        release_speech_clients(agent.stt, agent.tts)
+        logger.info(f"Speech client pool: {get_speech_pool().stats()}")
+        # The job process ends with the session; no later job can use them
+        await get_speech_pool().aclose()
+
+    ctx.add_shutdown_callback(release_speech)
 
     session = build_session(
         ctx.proc.userdata["vad"],
@@ -677,14 +1536,74 @@ async def entrypoint(ctx: JobContext):
         is_sip=sip_call,
     )
 
+    tracker = TurnTracker(persona_name, sip_call, meta["deep_mode"])
+    tracker.attach(session)
+    endpointing = EndpointingController(endpointing_profile(sip_call, using_sttv2))
+    endpointing.attach(session)
+    ctx.add_shutdown_callback(endpointing.aclose)
+    voice_metrics = get_metrics()
+    voice_metrics.start_periodic_dump()
+    ctx.add_shutdown_callback(voice_metrics.flush)
+
+    async def announce_task(task: dict) -> None:
+        if task.get("skill") == "orchestrator-reply" and task.get("result"):
+            # A handed-off turn: speak the answer itself
+            session.say(f"{HANDOFF_RESULT_LINE} {task['result']}", allow_interruptions=True)
+            return
+        session.generate_reply(
+            instructions=(
+                f"Briefly let the founder know: {describe_task(task)} "
+                "If it completed, offer to read the result."
+            ),
+            allow_interruptions=True,
+        )
+
+    task_watcher = TaskWatcher(BACKEND_URL, queue_auth_headers, ctx.room, announce_task)
+    ctx.add_shutdown_callback(task_watcher.aclose)
+    if hasattr(agent, "task_watcher"):
+        agent.task_watcher = task_watcher
+    if TURN_GATE_ENABLED and isinstance(agent, BoundedContextAgent):
+        agent.turn_gate = TurnGate("sip" if sip_call else "web")
+    if isinstance(agent.llm, OrchestratorLLM):
+        agent.llm.turn_tracker = tracker
+        agent.llm.task_watcher = task_watcher
+        agent.llm.turn_budget = ORCHESTRATOR_TURN_BUDGET_SIP if sip_call else ORCHESTRATOR_TURN_BUDGET
+
+    @session.on("agent_state_changed")
+    def _on_first_audio(ev):
+        if ev.new_state == "speaking":
+            session.off("agent_state_changed", _on_first_audio)
+            tracker.observe("job_time_to_first_audio", time.perf_counter() - job_start)
+            logger.info(
+                f"Time to first audio: {(time.perf_counter() - job_start) * 1000:.0f}ms "
+                f"(speculative start: {speculative})"
+            )
+
+    noise_filter, noise_slot = await noise_filter_for_call(sip_call)
+
+    async def release_noise_slot() -> None:
+        await run_file_io(get_noise_budget().release, noise_slot)
+
+    ctx.add_shutdown_callback(release_noise_slot)
+
     await session.start(
         room=ctx.room,
         agent=agent,
-        room_input_options=RoomInputOptions(),
+        room_input_options=RoomInputOptions(noise_cancellation=noise_filter),
+    )
+    start_phrase_prerender(assets.persona_voices if assets else PERSONA_VOICES)
+
+    logger.info(
+        f"Job start: {(time.perf_counter() - job_start) * 1000:.0f}ms total, "
+        f"persona build {persona_ms:.1f}ms "
+        f"(asset cache: {'on' if assets else 'off'}, speculative: {speculative})"
     )
 
 
 if __name__ == "__main__":
+    # One VAD process per worker batches every job process's streams
+    if sys.argv[1:2] in (["start"], ["dev"]):
+        start_vad_server()
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=entrypoint,
@@ -692,5 +1611,6 @@ if __name__ == "__main__":
             ws_url=os.getenv("LIVEKIT_URL", ""),
             api_key=os.getenv("LIVEKIT_API_KEY", ""),
             api_secret=os.getenv("LIVEKIT_API_SECRET", ""),
+            **worker_options_kwargs(),
         ),
     )
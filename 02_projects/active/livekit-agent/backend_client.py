@@ -0,0 +1,143 @@
+"""Shared HTTP client for the Focus Flow backend.
+
+One pooled aiohttp session per worker process, used by the orchestrator LLM,
+keyword fetching and every function tool. Connections are kept alive between
+voice turns, DNS lookups are cached, and the number of concurrent backend
+requests is bounded so a burst of tool calls cannot exhaust the pool.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import time
+
+import aiohttp
+
+logger = logging.getLogger("nitara-voice-http")
+BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:3001")
+BACKEND_POOL_LIMIT = int(os.getenv("BACKEND_POOL_LIMIT", "32"))
+BACKEND_POOL_LIMIT_PER_HOST = int(os.getenv("BACKEND_POOL_LIMIT_PER_HOST", "16"))
+BACKEND_MAX_CONCURRENCY = int(os.getenv("BACKEND_MAX_CONCURRENCY", "24"))
+BACKEND_DNS_TTL = int(os.getenv("BACKEND_DNS_TTL", "300"))
+BACKEND_KEEPALIVE_TIMEOUT = float(os.getenv("BACKEND_KEEPALIVE_TIMEOUT", "30"))
+
+
+class BackendClient:
+    """Process-wide pooled client for the backend API."""
+
+    def __init__(self, base_url: str = BACKEND_URL,
+                 max_concurrency: int = BACKEND_MAX_CONCURRENCY):
+        self._base_url = base_url.rstrip("/")
+        self._max_concurrency = max_concurrency
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_flight = 0
+        self._requests = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._errors = 0
+
+    def url(self, path: str) -> str:
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self._base_url}{path}"
+
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=BACKEND_POOL_LIMIT,
+                limit_per_host=BACKEND_POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=BACKEND_DNS_TTL,
+                use_dns_cache=True,
+                keepalive_timeout=BACKEND_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._loop = loop
+        return self._session
+
+    @contextlib.asynccontextmanager
+    async def request(self, method: str, path: str, **kwargs):
+        """Issue a request through the pool; yields the aiohttp response."""
+        session = self.session()
+        semaphore = self._semaphore
+        if semaphore.locked():
+            self._waits += 1
+        wait_start = time.perf_counter()
+        async with semaphore:
+            self._wait_seconds += time.perf_counter() - wait_start
+            self._in_flight += 1
+            self._requests += 1
+            try:
+                async with session.request(method, self.url(path), **kwargs) as resp:
+                    yield resp
+            except Exception:
+                self._errors += 1
+                raise
+            finally:
+                self._in_flight -= 1
+
+    def get(self, path: str, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def stats(self) -> dict:
+        """Pool and concurrency counters for sizing under load."""
+        in_use = idle = 0
+        if self._session is not None and not self._session.closed:
+            connector = self._session.connector
+            in_use = len(getattr(connector, "_acquired", ()))
+            idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        return {
+            "in_use": in_use,
+            "idle": idle,
+            "in_flight": self._in_flight,
+            "requests": self._requests,
+            "waits": self._waits,
+            "wait_seconds": round(self._wait_seconds, 3),
+            "errors": self._errors,
+            "limit": BACKEND_POOL_LIMIT,
+            "limit_per_host": BACKEND_POOL_LIMIT_PER_HOST,
+            "max_concurrency": self._max_concurrency,
+        }
+
+    async def aclose(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+_client: BackendClient | None = None
+_active_jobs = 0
+
+
+def get_backend_client() -> BackendClient:
+    """Return the worker-wide backend client."""
+    global _client
+    if _client is None:
+        _client = BackendClient()
+    return _client
+
+
+def retain_backend_client() -> BackendClient:
+    """Mark a job as using the shared client; pair with release_backend_client."""
+    global _active_jobs
+    _active_jobs += 1
+    return get_backend_client()
+
+
+async def release_backend_client() -> None:
+    """Release a job's hold; the last job out logs pool stats and closes the pool."""
+    global _active_jobs
+    _active_jobs = max(0, _active_jobs - 1)
+    if _client is None or _active_jobs:
+        return
+    logger.info(f"Backend pool stats: {_client.stats()}")
+    await _client.aclose()
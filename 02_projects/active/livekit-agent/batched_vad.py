@@ -0,0 +1,453 @@
+"""Silero VAD batched across every session on a worker.
+
+With ``silero.VAD``, each AgentSession runs its own ONNX inference on every
+32 ms window, so a worker with many rooms makes many tiny inference calls
+that compete for the same cores. LiveKit runs each job in its own process,
+so a model shared inside one job process would only ever see one session.
+Instead ``start_vad_server`` starts one VAD process per worker, next to the
+job processes, and ``BatchedVAD`` is a drop-in ``vad.VAD`` whose streams
+send their windows to it over a Unix socket.
+
+The server's ``BatchedVADEngine`` collects the next window from each
+active stream, from every job process, into a micro-batch and runs a
+single vectorized inference per tick, carrying each stream's recurrent
+state in the batch. It then hands each stream its probability, and the
+stream runs the start/end-of-speech rules of ``speech_activity`` itself.
+
+A tick fires once every active stream has submitted a window, or
+``VAD_BATCH_TICK`` after the first submission, whichever comes first, so a
+quiet stream never holds the others back for long. If the server can't be
+reached, a job process loads the model itself and batches only its own
+streams.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from livekit import rtc
+from livekit.agents import vad
+from livekit.plugins import silero
+
+from loop_lag import LOOP_LAG_WORKER_ENV, claim_worker_namespace
+from metrics import get_metrics
+from speech_activity import END_OF_SPEECH, START_OF_SPEECH, SpeechActivity
+
+try:
+    from livekit.plugins.silero import onnx_model
+    HAS_SILERO_ONNX = True
+except ImportError:
+    HAS_SILERO_ONNX = False
+
+logger = logging.getLogger("nitara-voice-vad")
+VAD_BATCHED = os.getenv("VAD_BATCHED", "true").lower() != "false"
+# Longest a submitted window waits for the rest of its batch
+VAD_BATCH_TICK = float(os.getenv("VAD_BATCH_TICK", "0.01"))
+VAD_MAX_BATCH = int(os.getenv("VAD_MAX_BATCH", "64"))
+# Seconds the worker waits for the VAD server to load its model
+VAD_SERVER_START_SECONDS = float(os.getenv("VAD_SERVER_START_SECONDS", "20"))
+# Set in the worker process once its VAD server is up, inherited by job processes
+VAD_SOCKET_ENV = "NITARA_VOICE_VAD_SOCKET"
+
+SAMPLE_RATE = 16000
+WINDOW_SAMPLES = 512  # 32 ms, what Silero v5 expects at 16 kHz
+CONTEXT_SAMPLES = 64
+WINDOW_SECONDS = WINDOW_SAMPLES / SAMPLE_RATE
+
+# Wire format: (kind, stream id) headers; windows follow as float32 samples
+_HEADER = struct.Struct("<BI")
+_RESULT = struct.Struct("<Iff")  # stream id, probability, inference seconds
+_OPEN, _WINDOW, _CLOSE = 1, 2, 3
+_WINDOW_BYTES = WINDOW_SAMPLES * 4
+
+
+class _StreamState:
+    """One stream's recurrent state and audio context between windows."""
+
+    __slots__ = ("rnn", "context")
+
+    def __init__(self):
+        self.rnn = np.zeros((2, 1, 128), dtype=np.float32)
+        self.context = np.zeros((1, CONTEXT_SAMPLES), dtype=np.float32)
+
+
+class BatchedVADEngine:
+    """Runs Silero on micro-batches of windows from many streams."""
+
+    def __init__(self, tick: float = VAD_BATCH_TICK, max_batch: int = VAD_MAX_BATCH):
+        self._tick = tick
+        self._max_batch = max_batch
+        # ONNX sessions are not re-entrant; one thread runs every batch
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nitara-vad")
+        self._session = onnx_model.new_inference_session(force_cpu=True)
+        self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        self._pending: list[tuple[_StreamState, np.ndarray, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._runs: set[asyncio.Task] = set()
+        self._streams = 0
+
+    async def register(self) -> _StreamState:
+        self._streams += 1
+        return _StreamState()
+
+    def unregister(self, state: _StreamState) -> None:
+        self._streams -= 1
+        if self._pending and len(self._pending) >= self._streams:
+            self._flush()
+
+    async def infer(self, state: _StreamState, window: np.ndarray) -> tuple[float, float]:
+        """Speech probability for one window, and the batch's inference seconds."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((state, window, future))
+        if len(self._pending) >= min(self._streams, self._max_batch):
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._tick, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._runs.add(task)
+            task.add_done_callback(self._runs.discard)
+
+    async def _run(self, batch: list) -> None:
+        try:
+            probs, seconds = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._infer_batch, batch
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        voice_metrics = get_metrics()
+        voice_metrics.incr("vad_batches")
+        voice_metrics.incr("vad_batched_windows", len(batch))
+        for (_, _, future), prob in zip(batch, probs):
+            if not future.done():
+                future.set_result((float(prob), seconds))
+
+    def _infer_batch(self, batch: list) -> tuple[np.ndarray, float]:
+        start = time.perf_counter()
+        inputs = np.concatenate(
+            [np.concatenate([state.context, window[np.newaxis, :]], axis=1) for state, window, _ in batch]
+        )
+        rnn = np.concatenate([state.rnn for state, _, _ in batch], axis=1)
+        out, new_rnn = self._session.run(None, {"input": inputs, "state": rnn, "sr": self._sr})
+        for i, (state, _, _) in enumerate(batch):
+            state.rnn = new_rnn[:, i:i + 1, :].copy()
+            state.context = inputs[i:i + 1, -CONTEXT_SAMPLES:].copy()
+        return out[:, 0], time.perf_counter() - start
+
+
+class RemoteVADEngine:
+    """A job process's connection to the worker's VAD server.
+
+    Same interface as ``BatchedVADEngine``; stream state lives in the
+    server, keyed by the stream id ``register`` returns. Raises
+    ``ConnectionError`` when the server is gone.
+    """
+
+    def __init__(self, socket_path: str):
+        self._socket_path = socket_path
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._connect_lock: asyncio.Lock | None = None
+        self._results: dict[int, asyncio.Future] = {}
+        self._next_id = 0
+
+    async def register(self) -> int:
+        await self._connect()
+        self._next_id += 1
+        self._writer.write(_HEADER.pack(_OPEN, self._next_id))
+        return self._next_id
+
+    def unregister(self, stream_id: int) -> None:
+        self._results.pop(stream_id, None)
+        if self._writer is not None and not self._writer.is_closing():
+            self._writer.write(_HEADER.pack(_CLOSE, stream_id))
+
+    async def infer(self, stream_id: int, window: np.ndarray) -> tuple[float, float]:
+        if self._writer is None or self._writer.is_closing():
+            raise ConnectionError("VAD server connection closed")
+        future = asyncio.get_running_loop().create_future()
+        self._results[stream_id] = future
+        self._writer.write(_HEADER.pack(_WINDOW, stream_id) + window.astype(np.float32).tobytes())
+        return await future
+
+    async def _connect(self) -> None:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return
+            reader, self._writer = await asyncio.open_unix_connection(self._socket_path)
+            self._reader_task = asyncio.create_task(self._read_results(reader))
+
+    async def _read_results(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                stream_id, prob, seconds = _RESULT.unpack(await reader.readexactly(_RESULT.size))
+                future = self._results.pop(stream_id, None)
+                if future is not None and not future.done():
+                    future.set_result((prob, seconds))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            logger.warning(f"Lost the VAD server connection: {e}")
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            results, self._results = self._results, {}
+            for future in results.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("VAD server connection lost"))
+
+
+_engine: BatchedVADEngine | None = None
+_remote_engine: RemoteVADEngine | None = None
+
+
+def get_vad_engine() -> BatchedVADEngine:
+    """Return the process-wide batched VAD engine, loading the model once."""
+    global _engine
+    if _engine is None:
+        _engine = BatchedVADEngine()
+    return _engine
+
+
+def get_remote_vad_engine() -> RemoteVADEngine | None:
+    """Return this process's client for the worker's VAD server, if one runs."""
+    global _remote_engine
+    socket_path = os.getenv(VAD_SOCKET_ENV)
+    if not socket_path:
+        return None
+    if _remote_engine is None:
+        _remote_engine = RemoteVADEngine(socket_path)
+    return _remote_engine
+
+
+def vad_socket_path() -> str:
+    """Socket of the VAD server for the worker this process belongs to."""
+    return os.path.join(tempfile.gettempdir(),
+                        f"nitara-voice-vad-{os.getenv(LOOP_LAG_WORKER_ENV, 'shared')}.sock")
+
+
+async def _serve(socket_path: str, ready) -> None:
+    engine = get_vad_engine()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        states: dict[int, _StreamState] = {}
+        pending: set[asyncio.Task] = set()
+
+        async def infer(stream_id: int, state: _StreamState, window: np.ndarray) -> None:
+            try:
+                prob, seconds = await engine.infer(state, window)
+            except Exception as e:
+                logger.warning(f"VAD inference failed: {e}")
+                writer.close()
+                return
+            if not writer.is_closing():
+                writer.write(_RESULT.pack(stream_id, prob, seconds))
+
+        try:
+            while True:
+                kind, stream_id = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+                if kind == _OPEN:
+                    states[stream_id] = await engine.register()
+                elif kind == _WINDOW:
+                    window = np.frombuffer(await reader.readexactly(_WINDOW_BYTES), dtype=np.float32)
+                    if stream_id in states:
+                        task = asyncio.create_task(infer(stream_id, states[stream_id], window))
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                elif kind == _CLOSE and stream_id in states:
+                    engine.unregister(states.pop(stream_id))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # job process ended
+        finally:
+            for state in states.values():
+                engine.unregister(state)
+            writer.close()
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    server = await asyncio.start_unix_server(handle, socket_path)
+    ready.set()
+    get_metrics().start_periodic_dump()
+    async with server:
+        await server.serve_forever()
+
+
+def _server_main(socket_path: str, ready) -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(socket_path, ready))
+
+
+def start_vad_server() -> multiprocessing.Process | None:
+    """Start the worker's VAD process and point job processes at it.
+
+    Call in the worker process before job processes start. Blocks until the
+    model is loaded. Returns None, leaving each job process on its own
+    model, when batching is off or the server doesn't come up.
+    """
+    if not (VAD_BATCHED and HAS_SILERO_ONNX):
+        return None
+    claim_worker_namespace()
+    socket_path = vad_socket_path()
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Event()
+    proc = ctx.Process(target=_server_main, args=(socket_path, ready), name="nitara-voice-vad", daemon=True)
+    proc.start()
+    if not ready.wait(VAD_SERVER_START_SECONDS):
+        logger.warning("VAD server did not start; job processes will load their own model")
+        proc.terminate()
+        return None
+    os.environ[VAD_SOCKET_ENV] = socket_path
+    logger.info(f"VAD server listening on {socket_path} (pid {proc.pid})")
+    return proc
+
+
+class BatchedVAD(vad.VAD):
+    """``vad.VAD`` whose streams are batched by the worker's VAD server.
+
+    Thresholds and durations mean the same as for ``silero.VAD``, including
+    its smoothing and lower deactivation threshold (see ``speech_activity``).
+    """
+
+    def __init__(self, *, min_speech_duration: float = 0.05, min_silence_duration: float = 0.55,
+                 prefix_padding_duration: float = 0.5, activation_threshold: float = 0.5):
+        super().__init__(capabilities=vad.VADCapabilities(update_interval=WINDOW_SECONDS))
+        self.min_speech_duration = min_speech_duration
+        self.min_silence_duration = min_silence_duration
+        self.prefix_padding_duration = prefix_padding_duration
+        self.activation_threshold = activation_threshold
+
+    @classmethod
+    def load(cls, **kwargs) -> "BatchedVAD":
+        """Without a VAD server, load the process's model now (in ``prewarm``)."""
+        if get_remote_vad_engine() is None:
+            get_vad_engine()
+        return cls(**kwargs)
+
+    def stream(self) -> "BatchedVADStream":
+        return BatchedVADStream(self)
+
+
+class BatchedVADStream(vad.VADStream):
+    def __init__(self, vad_instance: BatchedVAD):
+        self._opts = vad_instance
+        super().__init__(vad_instance)
+
+    async def _register(self):
+        remote = get_remote_vad_engine()
+        if remote is not None:
+            try:
+                return remote, await remote.register()
+            except OSError as e:
+                logger.warning(f"VAD server unreachable, running VAD in this process: {e}")
+        engine = get_vad_engine()
+        return engine, await engine.register()
+
+    async def _main_task(self) -> None:
+        opts = self._opts
+        engine, handle = await self._register()
+        activity = SpeechActivity(
+            activation_threshold=opts.activation_threshold, min_speech_duration=opts.min_speech_duration,
+            min_silence_duration=opts.min_silence_duration, window_seconds=WINDOW_SECONDS,
+        )
+        resampler: rtc.AudioResampler | None = None
+        input_rate = 0
+        buffer = np.zeros(0, dtype=np.float32)
+        samples_index = 0
+        padding: deque[rtc.AudioFrame] = deque(maxlen=max(1, int(opts.prefix_padding_duration / WINDOW_SECONDS)))
+        speech_frames: list[rtc.AudioFrame] = []
+
+        try:
+            async for item in self._input_ch:
+                if not isinstance(item, rtc.AudioFrame):
+                    continue  # flush sentinel: windows are processed as they fill
+                if item.sample_rate != input_rate:
+                    input_rate = item.sample_rate
+                    resampler = (rtc.AudioResampler(input_rate, SAMPLE_RATE, num_channels=1)
+                                 if input_rate != SAMPLE_RATE else None)
+                for frame in (resampler.push(_mono(item)) if resampler else [_mono(item)]):
+                    pcm = np.frombuffer(frame.data, dtype=np.int16).astype(np.float32) / 32768.0
+                    buffer = np.concatenate([buffer, pcm])
+
+                while len(buffer) >= WINDOW_SAMPLES:
+                    window, buffer = buffer[:WINDOW_SAMPLES], buffer[WINDOW_SAMPLES:]
+                    try:
+                        prob, inference_seconds = await engine.infer(handle, window)
+                    except ConnectionError as e:
+                        # The recurrent state went with the server; start fresh locally
+                        logger.warning(f"VAD server lost, running VAD in this process: {e}")
+                        engine = get_vad_engine()
+                        handle = await engine.register()
+                        prob, inference_seconds = await engine.infer(handle, window)
+                    samples_index += WINDOW_SAMPLES
+                    window_frame = rtc.AudioFrame(
+                        data=(window * 32767).astype(np.int16).tobytes(), sample_rate=SAMPLE_RATE,
+                        num_channels=1, samples_per_channel=WINDOW_SAMPLES,
+                    )
+                    if activity.speaking:
+                        speech_frames.append(window_frame)
+                    else:
+                        padding.append(window_frame)
+                    transition = activity.update(prob)
+
+                    timestamp = samples_index / SAMPLE_RATE
+                    self._event_ch.send_nowait(vad.VADEvent(
+                        type=vad.VADEventType.INFERENCE_DONE, samples_index=samples_index,
+                        timestamp=timestamp, speech_duration=activity.speech_seconds,
+                        silence_duration=activity.silence_seconds, frames=[window_frame],
+                        probability=activity.probability, inference_duration=inference_seconds,
+                        speaking=activity.speaking,
+                    ))
+
+                    if transition == START_OF_SPEECH:
+                        speech_frames = list(padding)
+                        self._event_ch.send_nowait(vad.VADEvent(
+                            type=vad.VADEventType.START_OF_SPEECH, samples_index=samples_index,
+                            timestamp=timestamp, speech_duration=activity.speech_seconds,
+                            silence_duration=0.0, frames=list(speech_frames), speaking=True,
+                        ))
+                    elif transition == END_OF_SPEECH:
+                        self._event_ch.send_nowait(vad.VADEvent(
+                            type=vad.VADEventType.END_OF_SPEECH, samples_index=samples_index,
+                            timestamp=timestamp, speech_duration=activity.speech_seconds,
+                            silence_duration=activity.silence_seconds, frames=speech_frames, speaking=False,
+                        ))
+                        speech_frames = []
+                        padding.clear()
+        finally:
+            engine.unregister(handle)
+
+
+def _mono(frame: rtc.AudioFrame) -> rtc.AudioFrame:
+    if frame.num_channels == 1:
+        return frame
+    pcm = np.frombuffer(frame.data, dtype=np.int16).reshape(-1, frame.num_channels)
+    mixed = pcm.mean(axis=1).astype(np.int16)
+    return rtc.AudioFrame(data=mixed.tobytes(), sample_rate=frame.sample_rate,
+                          num_channels=1, samples_per_channel=len(mixed))
+
+
+def load_vad() -> vad.VAD:
+    """The batched VAD when enabled and available, else per-session ``silero.VAD``."""
+    if VAD_BATCHED and HAS_SILERO_ONNX:
+        try:
+            return BatchedVAD.load()
+        except Exception as e:
+            logger.warning(f"Batched VAD unavailable, using per-session Silero: {e}")
+    return silero.VAD.load()
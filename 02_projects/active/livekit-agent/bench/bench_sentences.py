@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: time to first audio with and without sentence chunking.
+
+Compares sending an orchestrator reply to TTS as one blob against sending it
+as speakable sentences (speech_text.SpeechChunker). TTS is modelled as a
+fixed time to first byte plus synthesis time proportional to the length of
+the text request that produces the first audio. Replies arrive either all
+at once (single-shot JSON) or as SSE deltas at a given rate. The chunker's
+own CPU cost is measured for real.
+
+Usage:
+    python3 bench/bench_sentences.py
+    python3 bench/bench_sentences.py --tts-ttfb 0.2 --synth-ms-per-char 0.6
+    python3 bench/bench_sentences.py --stream-chars-per-second 400
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from speech_text import SpeechChunker, speakable_sentences  # noqa: E402
+
+SAMPLE = (
+    "Your portfolio is in better shape than last week. "
+    "**Kavach** moved up to the top spot with a score of 8.2, mainly because the pilot "
+    "conversations with two clinics turned into paid commitments. "
+    "The course project is still your steadiest revenue at about CHF 3,500 a month. "
+    "Details are in [the portfolio report](https://focus.example.com/reports/portfolio). "
+    "My recommendation is to build Kavach next and keep the course running on autopilot. "
+    "- First, lock the pilot scope.\n- Second, hire a part-time designer.\n"
+    "Want me to queue a deeper market analysis?"
+)
+
+
+def reply_of(chars: int) -> str:
+    return (SAMPLE * (chars // len(SAMPLE) + 1))[:chars].rsplit(" ", 1)[0] + "."
+
+
+def first_audio_blob(text: str, args) -> float:
+    arrival = len(text) / args.stream_chars_per_second if args.stream_chars_per_second else 0.0
+    return arrival + args.tts_ttfb + len(text) * args.synth_ms_per_char / 1000
+
+
+def first_audio_chunked(text: str, args) -> float:
+    if not args.stream_chars_per_second:
+        first = speakable_sentences(text)[0]
+        return args.tts_ttfb + len(first) * args.synth_ms_per_char / 1000
+    # Streamed: first sentence is released as soon as its text has arrived
+    chunker = SpeechChunker()
+    for i in range(0, len(text), args.delta_chars):
+        sentences = chunker.push(text[i:i + args.delta_chars])
+        if sentences:
+            arrival = min(len(text), i + args.delta_chars) / args.stream_chars_per_second
+            return arrival + args.tts_ttfb + len(sentences[0]) * args.synth_ms_per_char / 1000
+    first = chunker.flush()[0]
+    return len(text) / args.stream_chars_per_second + args.tts_ttfb + len(first) * args.synth_ms_per_char / 1000
+
+
+def chunker_cost_us(text: str, args, repeats: int = 200) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        chunker = SpeechChunker()
+        for i in range(0, len(text), args.delta_chars):
+            chunker.push(text[i:i + args.delta_chars])
+        chunker.flush()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentence chunking time-to-first-audio benchmark")
+    parser.add_argument("--lengths", default="200,600,1200,2400", help="Reply lengths in characters")
+    parser.add_argument("--tts-ttfb", type=float, default=0.12, help="TTS time to first byte (s)")
+    parser.add_argument("--synth-ms-per-char", type=float, default=0.4,
+                        help="Synthesis time per character of the first request (ms)")
+    parser.add_argument("--stream-chars-per-second", type=float, default=0.0,
+                        help="SSE delivery rate; 0 means the reply arrives at once")
+    parser.add_argument("--delta-chars", type=int, default=24, help="Characters per streamed delta")
+    args = parser.parse_args()
+
+    print(f"{'chars':>6} {'sentences':>9} {'blob_ms':>9} {'chunked_ms':>11} {'saved_ms':>9} {'chunker_us':>11}")
+    for chars in (int(x) for x in args.lengths.split(",")):
+        text = reply_of(chars)
+        blob = first_audio_blob(text, args)
+        chunked = first_audio_chunked(text, args)
+        print(
+            f"{len(text):>6} {len(speakable_sentences(text)):>9} {blob * 1000:>9.0f} "
+            f"{chunked * 1000:>11.0f} {(blob - chunked) * 1000:>9.0f} "
+            f"{chunker_cost_us(text, args):>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
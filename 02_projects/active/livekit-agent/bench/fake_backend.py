@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Focus Flow backend, for offline voice benchmarks.
+
+Serves the endpoints the voice agent calls — /api/orchestrator/chat,
+/api/queue/* and /api/livekit/keywords — with configurable latency and
+payload size. The orchestrator can answer as single-shot JSON or as an SSE
+stream of deltas.
+
+Usage:
+    python3 bench/fake_backend.py                           # :8765, 800ms replies
+    python3 bench/fake_backend.py --latency 2.5 --jitter 0.5
+    python3 bench/fake_backend.py --stream --chunk-chars 24 # SSE deltas
+    python3 bench/fake_backend.py --payload-chars 1200      # long deep-mode replies
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+
+from aiohttp import web
+
+SENTENCE = (
+    "Your portfolio is tracking well and the top project is ready for the next build step. "
+)
+
+
+class FakeBackend:
+    """Configurable fake of the backend endpoints used by the voice agent."""
+
+    def __init__(self, latency: float = 0.8, jitter: float = 0.2,
+                 payload_chars: int = 240, stream: bool = False,
+                 chunk_chars: int = 32, chunk_interval: float = 0.05,
+                 keywords: int = 60, queue_latency: float = 0.05):
+        self.latency = latency
+        self.jitter = jitter
+        self.payload_chars = payload_chars
+        self.stream = stream
+        self.chunk_chars = chunk_chars
+        self.chunk_interval = chunk_interval
+        self.keywords = keywords
+        self.queue_latency = queue_latency
+        self._task_ids = itertools.count(1)
+        self.requests: dict[str, int] = {}
+        self.cancelled: list[str] = []
+        self.tasks_by_id: dict[str, dict] = {}
+
+    def _count(self, name: str) -> None:
+        self.requests[name] = self.requests.get(name, 0) + 1
+
+    def _reply_text(self) -> str:
+        body = (SENTENCE * (self.payload_chars // len(SENTENCE) + 1))[: self.payload_chars]
+        return body.rsplit(" ", 1)[0] + "." if " " in body else body
+
+    async def _delay(self, base: float, jitter: float = 0.0) -> None:
+        await asyncio.sleep(max(0.0, random.gauss(base, jitter)))
+
+    async def chat(self, request: web.Request) -> web.StreamResponse:
+        self._count("chat")
+        body = await request.json()
+        thread_id = body.get("thread_id") or f"thread-bench-{next(self._task_ids)}"
+        content = self._reply_text()
+        wants_stream = self.stream and "text/event-stream" in request.headers.get("Accept", "")
+
+        if not wants_stream:
+            await self._delay(self.latency, self.jitter)
+            return web.json_response({"thread_id": thread_id, "content": content})
+
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        await self._delay(self.latency, self.jitter)
+        await resp.write(f"data: {json.dumps({'type': 'meta', 'thread_id': thread_id})}\n\n".encode())
+        for i in range(0, len(content), self.chunk_chars):
+            delta = content[i:i + self.chunk_chars]
+            await resp.write(f"data: {json.dumps({'type': 'delta', 'content': delta})}\n\n".encode())
+            await asyncio.sleep(self.chunk_interval)
+        await resp.write(f"data: {json.dumps({'type': 'done', 'thread_id': thread_id})}\n\n".encode())
+        await resp.write_eof()
+        return resp
+
+    async def cancel(self, request: web.Request) -> web.Response:
+        self._count("cancel")
+        body = await request.json()
+        self.cancelled.append(body.get("request_id", ""))
+        return web.json_response({"status": "cancelled", "request_id": body.get("request_id")})
+
+    async def enqueue(self, request: web.Request) -> web.Response:
+        self._count("enqueue")
+        await self._delay(self.queue_latency)
+        body = await request.json()
+        task_id = f"task-bench-{next(self._task_ids)}"
+        task = {"id": task_id, "skill": body.get("skill"), "status": "queued"}
+        self.tasks_by_id[task_id] = task
+        return web.json_response(task, status=201)
+
+    async def stats(self, request: web.Request) -> web.Response:
+        self._count("stats")
+        await self._delay(self.queue_latency)
+        return web.json_response({"pending": 2, "running": 1, "completed_today": 5})
+
+    async def task(self, request: web.Request) -> web.Response:
+        self._count("task")
+        await self._delay(self.queue_latency)
+        return web.json_response({"id": request.match_info["id"], "status": "completed",
+                                  "completed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ")})
+
+    async def tasks(self, request: web.Request) -> web.Response:
+        self._count("tasks")
+        await self._delay(self.queue_latency)
+        # Every enqueued task reports as completed on the next listing
+        for task in self.tasks_by_id.values():
+            task["status"] = "completed"
+            task.setdefault("completed_at", time.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        tasks = list(self.tasks_by_id.values())
+        return web.json_response({"tasks": tasks, "count": len(tasks)})
+
+    async def keywords_handler(self, request: web.Request) -> web.Response:
+        self._count("keywords")
+        await self._delay(self.queue_latency)
+        words = [f"Project{i}" for i in range(self.keywords)] + ["Nitara", "Focus Flow", "Vimo"]
+        return web.json_response({"keywords": words, "count": len(words)})
+
+    async def bench_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"requests": self.requests, "cancelled": len(self.cancelled)})
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/orchestrator/chat", self.chat)
+        app.router.add_post("/api/orchestrator/cancel", self.cancel)
+        app.router.add_post("/api/queue/enqueue", self.enqueue)
+        app.router.add_get("/api/queue/stats", self.stats)
+        app.router.add_get("/api/queue/tasks", self.tasks)
+        app.router.add_get("/api/queue/tasks/{id}", self.task)
+        app.router.add_get("/api/livekit/keywords", self.keywords_handler)
+        app.router.add_get("/bench/stats", self.bench_stats)
+        return app
+
+
+def add_backend_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.8, help="Mean orchestrator latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Latency std deviation (s)")
+    parser.add_argument("--payload-chars", type=int, default=240, help="Reply length in characters")
+    parser.add_argument("--stream", action="store_true", help="Answer with SSE deltas")
+    parser.add_argument("--chunk-chars", type=int, default=32, help="Characters per SSE delta")
+    parser.add_argument("--chunk-interval", type=float, default=0.05, help="Seconds between deltas")
+    parser.add_argument("--keywords", type=int, default=60, help="Number of STT keywords served")
+    parser.add_argument("--queue-latency", type=float, default=0.05, help="Queue/keyword latency (s)")
+
+
+def backend_from_args(args: argparse.Namespace) -> FakeBackend:
+    return FakeBackend(
+        latency=args.latency, jitter=args.jitter, payload_chars=args.payload_chars,
+        stream=args.stream, chunk_chars=args.chunk_chars,
+        chunk_interval=args.chunk_interval, keywords=args.keywords,
+        queue_latency=args.queue_latency,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Focus Flow backend for voice benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_backend_args(parser)
+    args = parser.parse_args()
+    web.run_app(backend_from_args(args).app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+VAD CPU benchmark: per-session Silero streams vs the worker's VAD server.
+
+LiveKit runs each job in its own process, so the benchmark does too: every
+session is a separate process with one VAD stream, fed synthetic 48 kHz
+audio in real time, 10 ms frames, alternating speech-like bursts and
+silence. All sessions start streaming together. The same load is run
+through ``silero.VAD`` (each process loads the model and runs one inference
+per window) and through ``batched_vad.BatchedVAD`` against a VAD server
+started with ``start_vad_server``, as ``agent.py`` does in the worker (one
+inference per tick for the streams of every session process).
+
+Reports CPU per session, i.e. CPU seconds per second of audio, summed over
+the session processes and the VAD server while audio is streaming, and the
+sessions one core can carry within ``--cpu-budget``. Also reports
+inference calls, VAD events, session event-loop lag and the server's batch
+sizes, as JSON. CPU of other processes is read from /proc, so run it on
+Linux.
+
+Usage:
+    python3 bench/vad_bench.py                           # 20 sessions x 20s, both paths
+    python3 bench/vad_bench.py --sessions 100 --seconds 30
+    python3 bench/vad_bench.py --mode batched --out vad_bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+AGENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, AGENT_DIR)
+
+from livekit import rtc  # noqa: E402
+from livekit.agents import vad  # noqa: E402
+from livekit.plugins import silero  # noqa: E402
+
+import batched_vad  # noqa: E402
+
+INPUT_RATE = 48000
+FRAME_SECONDS = 0.01
+FRAME_SAMPLES = int(INPUT_RATE * FRAME_SECONDS)
+
+
+def synthetic_audio(seconds: float, seed: int) -> list[rtc.AudioFrame]:
+    """Speech-like bursts (modulated harmonics plus noise) separated by near-silence."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * INPUT_RATE)) / INPUT_RATE
+    pitch = rng.uniform(100, 220)
+    voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6))
+    envelope = (np.sin(2 * np.pi * rng.uniform(0.2, 0.4) * t + rng.uniform(0, np.pi)) > 0).astype(np.float32)
+    syllables = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    signal = 0.3 * voiced * envelope * syllables + 0.005 * rng.standard_normal(len(t))
+    pcm = (np.clip(signal, -1, 1) * 32767).astype(np.int16)
+    return [
+        rtc.AudioFrame(data=pcm[i:i + FRAME_SAMPLES].tobytes(), sample_rate=INPUT_RATE,
+                       num_channels=1, samples_per_channel=FRAME_SAMPLES)
+        for i in range(0, len(pcm) - FRAME_SAMPLES + 1, FRAME_SAMPLES)
+    ]
+
+
+class LoopLagSampler:
+    """Measures how late a periodic timer fires on the running loop."""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - start - self.interval))
+
+
+def percentile(samples: list[float], p: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def process_cpu_seconds(pid: int) -> float:
+    """User plus system CPU of a live process, from /proc."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def stream_session(vad_instance: vad.VAD, frames: list[rtc.AudioFrame]) -> dict:
+    counts = {"inference": 0, "start_of_speech": 0, "end_of_speech": 0}
+    inference_seconds: list[float] = []
+    stream = vad_instance.stream()
+
+    async def consume():
+        async for ev in stream:
+            if ev.type == vad.VADEventType.INFERENCE_DONE:
+                counts["inference"] += 1
+                inference_seconds.append(ev.inference_duration)
+            elif ev.type == vad.VADEventType.START_OF_SPEECH:
+                counts["start_of_speech"] += 1
+            elif ev.type == vad.VADEventType.END_OF_SPEECH:
+                counts["end_of_speech"] += 1
+
+    lag = LoopLagSampler()
+    lag.start()
+    consumer = asyncio.create_task(consume())
+    # Rooms don't start in lockstep
+    await asyncio.sleep(random.uniform(0, FRAME_SECONDS))
+    started = time.perf_counter()
+    for n, frame in enumerate(frames):
+        stream.push_frame(frame)
+        delay = started + (n + 1) * FRAME_SECONDS - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    stream.end_input()
+    await consumer
+    await stream.aclose()
+    await lag.stop()
+    return {**counts, "inference_seconds": inference_seconds, "lag": lag.samples}
+
+
+def session_main(path: str, seed: int, seconds: float, ready, go, results) -> None:
+    """One job process: load the VAD as ``prewarm`` would, then stream one session."""
+    vad_instance = batched_vad.BatchedVAD.load() if path == "batched" else silero.VAD.load()
+    frames = synthetic_audio(seconds, seed)
+    ready.release()
+    go.wait()
+    cpu_start = time.process_time()
+    result = asyncio.run(stream_session(vad_instance, frames))
+    result["cpu_seconds"] = time.process_time() - cpu_start
+    results.put(result)
+
+
+def run_path(name: str, args: argparse.Namespace, server=None) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    ready, go, results = ctx.Semaphore(0), ctx.Event(), ctx.Queue()
+    sessions = [
+        ctx.Process(target=session_main, args=(name, i % 8, args.seconds, ready, go, results))
+        for i in range(args.sessions)
+    ]
+    for proc in sessions:
+        proc.start()
+    for _ in sessions:
+        ready.acquire()
+
+    server_cpu_start = process_cpu_seconds(server.pid) if server else 0.0
+    wall_start = time.perf_counter()
+    go.set()
+    per_session = [results.get() for _ in sessions]
+    wall = time.perf_counter() - wall_start
+    server_cpu = process_cpu_seconds(server.pid) - server_cpu_start if server else 0.0
+    for proc in sessions:
+        proc.join()
+
+    cpu = sum(r["cpu_seconds"] for r in per_session) + server_cpu
+    cpu_per_session = cpu / (args.sessions * args.seconds)
+    inference_seconds = [s for r in per_session for s in r["inference_seconds"]]
+    lag = [s for r in per_session for s in r["lag"]]
+    return {
+        "path": name,
+        "sessions": args.sessions,
+        "audio_seconds_per_session": args.seconds,
+        "wall_seconds": round(wall, 2),
+        "cpu_seconds": round(cpu, 2),
+        "vad_server_cpu_seconds": round(server_cpu, 2),
+        "cpu_per_session": round(cpu_per_session, 5),
+        "max_sessions_per_core": int(args.cpu_budget / cpu_per_session) if cpu_per_session else None,
+        "inference_events": sum(r["inference"] for r in per_session),
+        "inference_ms_p50": round(percentile(inference_seconds, 0.5) * 1000, 2),
+        "inference_ms_p95": round(percentile(inference_seconds, 0.95) * 1000, 2),
+        "start_of_speech": sum(r["start_of_speech"] for r in per_session),
+        "end_of_speech": sum(r["end_of_speech"] for r in per_session),
+        "loop_lag_ms_p95": round(percentile(lag, 0.95) * 1000, 2),
+    }
+
+
+def run_batched(args: argparse.Namespace) -> dict:
+    # The server dumps its metrics here, so its batch sizes can be read back
+    metrics_dir = tempfile.mkdtemp(prefix="vad-bench-metrics-")
+    os.environ["VOICE_METRICS_DIR"] = metrics_dir
+    os.environ["VOICE_METRICS_DUMP_SECONDS"] = "1"
+    server = batched_vad.start_vad_server()
+    if server is None:
+        raise SystemExit("VAD server did not start")
+    try:
+        result = run_path("batched", args, server)
+        time.sleep(1.5)
+    finally:
+        server.terminate()
+        server.join()
+    try:
+        with open(os.path.join(metrics_dir, f"voice-metrics-{server.pid}.json")) as f:
+            counters = json.load(f)["counters"]
+    except (OSError, ValueError):
+        return result
+    batches = counters.get("vad_batches", {}).get("", 0)
+    if batches:
+        result["batches"] = batches
+        result["mean_batch_size"] = round(counters.get("vad_batched_windows", {}).get("", 0) / batches, 1)
+    return result
+
+
+def run(args: argparse.Namespace) -> dict:
+    report = {"paths": []}
+    if args.mode in ("per-session", "both"):
+        report["paths"].append(run_path("per-session", args))
+    if args.mode in ("batched", "both"):
+        report["paths"].append(run_batched(args))
+    if len(report["paths"]) == 2:
+        per_session, batched = report["paths"]
+        if batched["cpu_per_session"]:
+            report["cpu_reduction"] = round(per_session["cpu_per_session"] / batched["cpu_per_session"], 2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-session vs batched VAD CPU benchmark")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent session processes")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Audio per stream, fed in real time")
+    parser.add_argument("--mode", choices=["per-session", "batched", "both"], default="both")
+    parser.add_argument("--cpu-budget", type=float, default=0.85,
+                        help="Share of a core VAD may use when computing sessions per core")
+    parser.add_argument("--out", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run(args)
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Offline voice-pipeline benchmark for the Nitara LiveKit agent.
+
+Starts bench/fake_backend.py as a subprocess and drives N concurrent
+simulated sessions through the real ``entrypoint``, ``OrchestratorLLM`` and
+``tools.py`` code. LiveKit rooms, Deepgram and Cartesia are replaced by
+scripted stand-ins: the session emits the same events AgentSession would,
+"transcribes" a fixed script and "plays" replies at a fixed rate per
+character. No LiveKit, Deepgram or Cartesia credentials are needed.
+
+Reports turn latency distribution, CPU and RSS per session, event-loop lag
+and the agent's own per-stage histograms as JSON.
+
+Usage:
+    python3 bench/voice_bench.py                             # 10 sessions x 4 turns
+    python3 bench/voice_bench.py --sessions 50 --stream      # SSE orchestrator
+    python3 bench/voice_bench.py --latency 3 --payload-chars 1200
+    python3 bench/voice_bench.py --tools-only --sessions 200 # tools.py only
+    python3 bench/voice_bench.py --out bench_output.json
+"""
+
+import argparse
+import asyncio
+import contextvars
+import inspect
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from types import SimpleNamespace
+
+AGENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.abspath(os.path.join(AGENT_DIR, "..", "..", ".."))
+sys.path.insert(0, AGENT_DIR)
+
+from fake_backend import add_backend_args  # noqa: E402
+
+USER_SCRIPT = [
+    "What's in my queue right now?",
+    "Read me the latest portfolio report.",
+    "Which project should I build next and why?",
+    "Queue a market research task for the course idea.",
+    "How is the network analysis looking?",
+    "Thanks, that's all for now.",
+]
+
+PERSONAS = ["nitara-main", "nitara-analyst", "nitara-profiler"]
+
+
+# ─── Measurement helpers ──────────────────────────────────────────────────────
+
+def rss_mb() -> float:
+    """Current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+class LoopLagSampler:
+    """Measures how late a periodic timer fires on the event loop."""
+
+    def __init__(self, interval: float = 0.02):
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.samples: list[float] = []
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(0.0, time.perf_counter() - start - self._interval))
+
+
+def summarize(samples: list[float]) -> dict:
+    from metrics import LatencyHistogram
+
+    hist = LatencyHistogram(window=max(1, len(samples)))
+    for s in samples:
+        hist.observe(s)
+    return hist.summary()
+
+
+# ─── LiveKit stand-ins ────────────────────────────────────────────────────────
+
+class FakeLocalParticipant:
+    def __init__(self):
+        self.published = 0
+
+    async def publish_data(self, payload, reliable: bool = True, topic: str = ""):
+        self.published += 1
+
+
+class FakeRoom:
+    def __init__(self, name: str, metadata: dict):
+        self.name = name
+        self.metadata = json.dumps(metadata)
+        self.local_participant = FakeLocalParticipant()
+
+
+class FakeJobContext:
+    """Just enough of JobContext for ``entrypoint``."""
+
+    def __init__(self, name: str, proc, room_meta: dict, participant,
+                 connect_delay: float, join_delay: float):
+        self.room = FakeRoom(name, room_meta)
+        self.proc = proc
+        self._participant = participant
+        self._connect_delay = connect_delay
+        self._join_delay = join_delay
+        self._shutdown_callbacks = []
+
+    async def connect(self, **kwargs):
+        await asyncio.sleep(self._connect_delay)
+
+    async def wait_for_participant(self):
+        await asyncio.sleep(self._join_delay)
+        return self._participant
+
+    def add_shutdown_callback(self, callback):
+        self._shutdown_callbacks.append(callback)
+
+    async def shutdown(self):
+        for callback in reversed(self._shutdown_callbacks):
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
+
+
+class ScriptedSession:
+    """Stand-in for AgentSession that plays a scripted conversation.
+
+    Emits ``user_state_changed``, ``user_input_transcribed`` and
+    ``agent_state_changed`` like the real session, sends each utterance
+    through the persona's LLM, and simulates TTS with a fixed time to first
+    audio and playback time per character. ``say`` and ``generate_reply``
+    (task announcements) only record what would have been spoken.
+    """
+
+    def __init__(self, script: list[str], timing: SimpleNamespace, results: dict, **kwargs):
+        self._script = script
+        self._timing = timing
+        self._results = results
+        self._handlers: dict[str, list] = {}
+        self.agent = None
+        self.announcements: list[str] = []
+        self.done = asyncio.get_running_loop().create_future()
+
+    def on(self, event: str, callback=None):
+        if callback is None:
+            def register(fn):
+                self._handlers.setdefault(event, []).append(fn)
+                return fn
+            return register
+        self._handlers.setdefault(event, []).append(callback)
+        return callback
+
+    def off(self, event: str, callback) -> None:
+        if callback in self._handlers.get(event, []):
+            self._handlers[event].remove(callback)
+
+    def emit(self, event: str, ev) -> None:
+        for handler in list(self._handlers.get(event, [])):
+            handler(ev)
+
+    async def start(self, room=None, agent=None, room_input_options=None, **kwargs):
+        self.agent = agent
+        task = asyncio.create_task(self._drive())
+        task.add_done_callback(
+            lambda t: self.done.set_exception(t.exception()) if t.exception()
+            else self.done.set_result(None)
+        )
+
+    def say(self, text: str, **kwargs) -> None:
+        """Record what the agent would say outside a turn (task announcements)."""
+        self.announcements.append(text)
+        self._results["announcements"] += 1
+
+    def generate_reply(self, instructions: str = "", **kwargs) -> None:
+        self.announcements.append(instructions)
+        self._results["announcements"] += 1
+
+    def _agent_state(self, old: str, new: str) -> None:
+        self.emit("agent_state_changed", SimpleNamespace(old_state=old, new_state=new))
+
+    async def _respond(self, text: str) -> float | None:
+        """Run one LLM turn; returns seconds until first (simulated) audio."""
+        from livekit.agents import llm
+
+        chat_ctx = llm.ChatContext()
+        if text:
+            chat_ctx.add_message(role="user", content=text)
+        start = time.perf_counter()
+        self._agent_state("listening", "thinking")
+        first_audio = None
+        chars = 0
+
+        async def consume():
+            nonlocal first_audio, chars
+            async with self.agent.llm.chat(chat_ctx=chat_ctx) as stream:
+                async for chunk in stream:
+                    content = chunk.delta.content if chunk.delta else ""
+                    if content and first_audio is None:
+                        await asyncio.sleep(self._timing.tts_ttfb)
+                        first_audio = time.perf_counter() - start
+                        self._agent_state("thinking", "speaking")
+                    chars += len(content or "")
+
+        consumer = asyncio.create_task(consume())
+        if text and random.random() < self._timing.barge_in_ratio:
+            # Caller interrupts while the reply is still being generated
+            done, _ = await asyncio.wait([consumer], timeout=self._timing.barge_in_after)
+            if not done:
+                consumer.cancel()
+                await asyncio.gather(consumer, return_exceptions=True)
+                self._results["barge_ins"] += 1
+                self._agent_state("thinking", "listening")
+                return None
+        await consumer
+        await asyncio.sleep(chars * self._timing.playback_per_char)
+        self._agent_state("speaking" if first_audio is not None else "thinking", "listening")
+        return first_audio
+
+    async def _drive(self) -> None:
+        greeting = await self._respond("")
+        if greeting is not None:
+            self._results["greeting"].append(greeting)
+
+        for text in self._script:
+            self.emit("user_state_changed", SimpleNamespace(old_state="listening", new_state="speaking"))
+            await asyncio.sleep(self._timing.speech_seconds)
+            speech_end = time.perf_counter()
+            self.emit("user_state_changed", SimpleNamespace(old_state="speaking", new_state="listening"))
+            await asyncio.sleep(self._timing.stt_delay)
+            self.emit("user_input_transcribed", SimpleNamespace(
+                transcript=text, is_final=True, speaker_id=None, language="en",
+            ))
+            respond_start = time.perf_counter()
+            first_audio = await self._respond(text)
+            if first_audio is not None:
+                self._results["turn"].append(respond_start - speech_end + first_audio)
+            await asyncio.sleep(self._timing.think_seconds)
+
+
+# ─── Benchmark runners ───────────────────────────────────────────────────────
+
+def configure_environment(backend_url: str) -> None:
+    """Point the agent modules at the fake backend before they are imported."""
+    os.environ["BACKEND_URL"] = backend_url
+    os.environ.setdefault("LIVEKIT_URL", "ws://127.0.0.1:7880")
+    os.environ.setdefault("LIVEKIT_API_KEY", "bench")
+    os.environ.setdefault("LIVEKIT_API_SECRET", "bench-secret")
+    # Keep every persona on the orchestrator path
+    os.environ["ANTHROPIC_API_KEY"] = ""
+    # No TTS in the bench: pre-rendering would attempt real synthesis
+    os.environ["TTS_PRERENDER"] = "false"
+    os.environ["OPENCLAW_TOKEN"] = ""
+    os.environ.setdefault("VOICE_METRICS_DUMP_SECONDS", "0")
+
+
+def start_backend(args: argparse.Namespace) -> subprocess.Popen:
+    cmd = [
+        sys.executable, os.path.join(AGENT_DIR, "bench", "fake_backend.py"),
+        "--port", str(args.port), "--latency", str(args.latency),
+        "--jitter", str(args.jitter), "--payload-chars", str(args.payload_chars),
+        "--chunk-chars", str(args.chunk_chars), "--chunk-interval", str(args.chunk_interval),
+        "--keywords", str(args.keywords), "--queue-latency", str(args.queue_latency),
+    ]
+    if args.stream:
+        cmd.append("--stream")
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{args.port}/bench/stats"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(url, timeout=0.2).read()
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("fake backend did not start")
+
+
+async def run_sessions(args: argparse.Namespace) -> dict:
+    import agent
+    from livekit import rtc
+
+    timing = SimpleNamespace(
+        speech_seconds=args.speech_seconds, stt_delay=args.stt_delay,
+        tts_ttfb=args.tts_ttfb, playback_per_char=args.playback_per_char,
+        think_seconds=args.think_seconds, barge_in_ratio=args.barge_in_ratio,
+        barge_in_after=args.barge_in_after,
+    )
+    results = {"turn": [], "greeting": [], "barge_ins": 0, "announcements": 0}
+    script = USER_SCRIPT[: args.turns]
+    job_session: contextvars.ContextVar[list] = contextvars.ContextVar("job_session")
+
+    def make_session(**kwargs):
+        session = ScriptedSession(script, timing, results, **kwargs)
+        job_session.get().append(session)
+        return session
+
+    agent.AgentSession = make_session
+    # Speech is simulated by ScriptedSession; build no STT/TTS clients
+    agent.build_stt = lambda keywords=None: (None, False)
+    agent.pooled_default_stt = lambda: None
+    agent.pooled_tts = lambda voice_id: None
+    agent.fill_speech_pool = lambda *a, **kw: None
+    if args.skip_vad:
+        # prewarm looks load_vad up on the agent module
+        agent.load_vad = lambda: None
+
+    proc = SimpleNamespace(userdata={})
+    await asyncio.get_running_loop().run_in_executor(None, agent.prewarm, proc)
+
+    async def one_job(i: int) -> None:
+        persona = PERSONAS[i % len(PERSONAS)] if args.mixed_personas else "nitara-main"
+        participant = SimpleNamespace(
+            identity=f"bench-user-{i}",
+            metadata=json.dumps({"threadId": f"thread-bench-{i}"}),
+            kind=rtc.ParticipantKind.PARTICIPANT_KIND_SIP if random.random() < args.sip_ratio else None,
+        )
+        ctx = FakeJobContext(
+            f"bench-room-{i}", proc, {"persona": persona}, participant,
+            connect_delay=args.connect_delay, join_delay=args.join_delay,
+        )
+        created: list[ScriptedSession] = []
+        job_session.set(created)
+        await asyncio.sleep(random.uniform(0, args.ramp_seconds))
+        await agent.entrypoint(ctx)
+        await created[0].done
+        await ctx.shutdown()
+
+    await asyncio.gather(*(one_job(i) for i in range(args.sessions)))
+    return {
+        "turn_latency_ms": summarize(results["turn"]),
+        "greeting_latency_ms": summarize(results["greeting"]),
+        "barge_ins": results["barge_ins"],
+        "announcements": results["announcements"],
+    }
+
+
+async def run_tools(args: argparse.Namespace) -> dict:
+    import tools
+
+    from checklist_store import ChecklistStore
+    from report_index import ReportIndex
+
+    tools.REPORTS_DIR = os.path.join(REPO_ROOT, "07_system", "reports")
+    # Work on a copy: the checklist store creates journal and lock files beside it
+    tools.PROFILING_CHECKLIST_PATH = os.path.join(tempfile.mkdtemp(prefix="voice-bench-"), "profiling-checklist.json")
+    shutil.copy(os.path.join(REPO_ROOT, "07_system", "agent", "profiling-checklist.json"),
+                tools.PROFILING_CHECKLIST_PATH)
+    tools.REPORT_INDEX = ReportIndex(tools.REPORTS_DIR)
+    tools.CHECKLIST_STORE = ChecklistStore(tools.PROFILING_CHECKLIST_PATH)
+    latencies: dict[str, list[float]] = {}
+
+    async def timed(name: str, coro) -> None:
+        start = time.perf_counter()
+        await coro
+        latencies.setdefault(name, []).append(time.perf_counter() - start)
+
+    async def one_session(i: int) -> None:
+        await asyncio.sleep(random.uniform(0, args.ramp_seconds))
+        for _ in range(args.turns):
+            await timed("enqueue_task", tools.enqueue_task("research-market", f"bench {i}"))
+            await timed("check_task_status", tools.check_task_status())
+            await timed("read_latest_report", tools.read_latest_report("portfolio-analysis"))
+            await timed("get_profiling_gaps", tools.get_profiling_gaps())
+
+    await asyncio.gather(*(one_session(i) for i in range(args.sessions)))
+    return {"tool_latency_ms": {name: summarize(v) for name, v in latencies.items()}}
+
+
+async def run(args: argparse.Namespace) -> dict:
+    lag = LoopLagSampler()
+    lag.start()
+    rss_start = rss_mb()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    report = {}
+    if not args.tools_only:
+        report.update(await run_sessions(args))
+    report.update(await run_tools(args))
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    rss_end = rss_mb()
+    await lag.stop()
+
+    from backend_client import get_backend_client
+    from metrics import get_metrics
+
+    report.update({
+        "sessions": args.sessions,
+        "turns_per_session": args.turns,
+        "wall_seconds": round(wall, 2),
+        "cpu_seconds": round(cpu, 3),
+        "cpu_ms_per_session": round(cpu / args.sessions * 1000, 2),
+        "cpu_utilization": round(cpu / wall, 3) if wall else 0.0,
+        "rss_mb_start": round(rss_start, 1),
+        "rss_mb_end": round(rss_end, 1),
+        "rss_mb_per_session": round((rss_end - rss_start) / args.sessions, 3),
+        "loop_lag_ms": summarize(lag.samples),
+        "backend_pool": get_backend_client().stats(),
+        "pipeline_histograms": get_metrics().snapshot()["histograms"],
+        "pipeline_counters": get_metrics().snapshot()["counters"],
+    })
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{args.port}/bench/stats", timeout=2) as resp:
+            backend_stats = json.loads(resp.read())
+            report["backend_requests"] = backend_stats["requests"]
+            report["backend_cancelled"] = backend_stats.get("cancelled", 0)
+    except OSError:
+        pass
+    await get_backend_client().aclose()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline Nitara voice-pipeline benchmark")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent simulated sessions")
+    parser.add_argument("--turns", type=int, default=4, help="User turns per session (max 6)")
+    parser.add_argument("--port", type=int, default=8765, help="Fake backend port")
+    parser.add_argument("--ramp-seconds", type=float, default=1.0, help="Spread session starts over this window")
+    parser.add_argument("--mixed-personas", action="store_true", help="Rotate main/analyst/profiler")
+    parser.add_argument("--sip-ratio", type=float, default=0.0, help="Fraction of SIP participants")
+    parser.add_argument("--connect-delay", type=float, default=0.15, help="Simulated ctx.connect time (s)")
+    parser.add_argument("--join-delay", type=float, default=0.5, help="Simulated participant join wait (s)")
+    parser.add_argument("--speech-seconds", type=float, default=1.5, help="Simulated user utterance length")
+    parser.add_argument("--stt-delay", type=float, default=0.25, help="End of speech to final transcript (s)")
+    parser.add_argument("--tts-ttfb", type=float, default=0.15, help="Simulated TTS time to first audio (s)")
+    parser.add_argument("--playback-per-char", type=float, default=0.002, help="Simulated playback s/char")
+    parser.add_argument("--think-seconds", type=float, default=0.5, help="Pause before the next user turn")
+    parser.add_argument("--barge-in-ratio", type=float, default=0.0, help="Fraction of turns the caller interrupts")
+    parser.add_argument("--barge-in-after", type=float, default=0.4, help="Seconds into generation of the interruption")
+    parser.add_argument("--skip-vad", action="store_true", help="Do not load Silero VAD in prewarm")
+    parser.add_argument("--tools-only", action="store_true", help="Only benchmark tools.py functions")
+    parser.add_argument("--out", help="Write the JSON report to this file")
+    add_backend_args(parser)
+    args = parser.parse_args()
+
+    configure_environment(f"http://127.0.0.1:{args.port}")
+    backend = start_backend(args)
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        backend.terminate()
+        backend.wait(timeout=5)
+
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Analyst opening briefing, built when new reports land.
+
+``NitaraAnalyst`` used to open every call by asking the orchestrator, in
+deep mode, to summarize the latest portfolio status: the slowest possible
+first turn, repeated for reports that change a few times a day.
+``BriefingBuilder`` composes the briefing once, from the newest
+portfolio-analysis and monitor-project reports, whenever ``ReportIndex``
+sees either of them change. It can also pre-render the text in the analyst
+voice, so the call opens with cached audio.
+
+A briefing is served only while the reports it was built from are still
+the newest ones in the index; otherwise the analyst falls back to live
+generation.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Awaitable, Callable
+
+from file_io import run_file_io
+from report_index import ReportIndex, report_type_of
+
+logger = logging.getLogger("nitara-voice-briefing")
+BRIEFING_ENABLED = os.getenv("BRIEFING_ENABLED", "true").lower() != "false"
+
+BRIEFING_SOURCES = ("portfolio-analysis", "monitor-project")
+# Monitor alerts below this severity are not worth opening a call with
+BRIEFING_ALERT_SEVERITIES = ("critical", "error", "warning")
+
+
+def _sentence(text) -> str:
+    text = str(text).strip()
+    return text if text.endswith((".", "!", "?")) else f"{text}."
+
+
+def _lead_project(scores: list) -> dict | None:
+    """The BUILD-NEXT project, or the highest-scored one without it."""
+    scores = [s for s in scores if isinstance(s, dict) and s.get("title")]
+    for score in scores:
+        if str(score.get("recommendation", "")).upper() == "BUILD-NEXT":
+            return score
+    return max(scores, key=lambda s: s.get("weighted_total") or 0, default=None)
+
+
+def compose_briefing(portfolio: dict, monitor: dict | None = None, portfolio_date: str = "") -> str:
+    """The spoken opening briefing for a portfolio (and monitor) report."""
+    summary = portfolio.get("portfolio_summary") or {}
+    date = portfolio_date or str(portfolio.get("generated_at", ""))[:10]
+    parts = [f"Hey Vimo. Here's the portfolio as of {date}." if date
+             else "Hey Vimo. Here's where the portfolio stands."]
+
+    health = summary.get("portfolio_health")
+    if health:
+        active = summary.get("active_projects")
+        counts = f" across {active} active projects" if active else ""
+        parts.append(f"Overall health is {str(health).lower()}{counts}.")
+    if summary.get("primary_issue"):
+        parts.append(_sentence(summary["primary_issue"]))
+
+    lead = _lead_project(portfolio.get("project_scores") or [])
+    if lead is not None:
+        score = lead.get("weighted_total")
+        scored = f", scoring {score}" if score is not None else ""
+        recommendation = str(lead.get("recommendation", "")).lower().replace("-", " ")
+        marked = f" and marked {recommendation}" if recommendation else ""
+        parts.append(f"{lead['title']} leads{scored}{marked}.")
+
+    recommendations = [r for r in portfolio.get("top_recommendations") or []
+                       if isinstance(r, dict) and r.get("action")]
+    if recommendations:
+        parts.append(f"My top recommendation: {_sentence(recommendations[0]['action'])}")
+
+    if monitor:
+        alerts = [a for a in monitor.get("alerts") or []
+                  if isinstance(a, dict) and a.get("severity") in BRIEFING_ALERT_SEVERITIES]
+        status = monitor.get("status")
+        if alerts:
+            parts.append(f"One thing to watch: {_sentence(alerts[0].get('message', 'a monitor alert'))}")
+        elif status:
+            parts.append(f"Systems are {status}.")
+
+    parts.append("I can dive deeper into any project.")
+    return " ".join(parts)
+
+
+class Briefing:
+    """Briefing text and the report files it was built from."""
+
+    __slots__ = ("text", "sources")
+
+    def __init__(self, text: str, sources: tuple):
+        self.text = text
+        self.sources = sources
+
+
+class BriefingBuilder:
+    """Keeps the analyst briefing in step with the report index.
+
+    ``render(text)``, when given, is awaited after each rebuild to
+    pre-render the briefing audio; it runs in the background and a failure
+    only costs the audio, not the text.
+    """
+
+    def __init__(self, report_index: ReportIndex, reports_dir: str,
+                 render: Callable[[str], Awaitable[None]] | None = None):
+        self._index = report_index
+        self._reports_dir = reports_dir
+        self._render = render
+        self._briefing: Briefing | None = None
+        self._render_task: asyncio.Task | None = None
+        self._started = False
+
+    def _sources(self) -> tuple:
+        """(filename, mtime) of each source report currently in the index."""
+        sources = []
+        for report_type in BRIEFING_SOURCES:
+            entry = self._index.entry(report_type)
+            sources.append((entry.filename, entry.mtime_ns) if entry else None)
+        return tuple(sources)
+
+    def current(self) -> str | None:
+        """The briefing text, or None when it is missing or stale. No disk I/O."""
+        briefing = self._briefing
+        if briefing is None or briefing.sources != self._sources():
+            return None
+        return briefing.text
+
+    def rebuild(self) -> bool:
+        """Recompose the briefing if its source reports changed; True if it did.
+
+        Blocking: reads the source reports. Call from ``prewarm`` or an executor.
+        """
+        sources = self._sources()
+        if self._briefing is not None and self._briefing.sources == sources:
+            return False
+        portfolio_source, monitor_source = sources
+        if portfolio_source is None:
+            self._briefing = None
+            return False
+        portfolio = self._read(portfolio_source[0])
+        if portfolio is None:
+            return False  # keep the old briefing stale until the file parses
+        monitor = self._read(monitor_source[0]) if monitor_source else None
+        _, portfolio_date = report_type_of(portfolio_source[0])
+        self._briefing = Briefing(compose_briefing(portfolio, monitor, portfolio_date), sources)
+        logger.info(f"Analyst briefing rebuilt from {portfolio_source[0]}")
+        return True
+
+    def start(self) -> None:
+        """Rebuild on report index changes, and pre-render the current briefing."""
+        if not BRIEFING_ENABLED or self._started:
+            return
+        self._started = True
+        self._index.add_listener(self._on_reports_changed)
+        asyncio.create_task(self._on_reports_changed())
+
+    async def aclose(self) -> None:
+        if self._render_task is not None:
+            self._render_task.cancel()
+            await asyncio.gather(self._render_task, return_exceptions=True)
+            self._render_task = None
+
+    def _read(self, filename: str) -> dict | None:
+        try:
+            with open(os.path.join(self._reports_dir, filename), "r") as f:
+                report = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to read {filename} for the briefing: {e}")
+            return None
+        return report if isinstance(report, dict) else None
+
+    async def _on_reports_changed(self) -> None:
+        await run_file_io(self.rebuild)
+        text = self.current()
+        if text is None or self._render is None:
+            return
+        if self._render_task is not None and not self._render_task.done():
+            self._render_task.cancel()
+        self._render_task = asyncio.create_task(self._render_briefing(text))
+
+    async def _render_briefing(self, text: str) -> None:
+        try:
+            await self._render(text)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to pre-render analyst briefing: {e}")
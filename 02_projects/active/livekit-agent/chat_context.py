@@ -0,0 +1,241 @@
+"""Per-persona bounds on the chat history sent with each turn.
+
+Before this, every turn carried the whole session history. The profiler
+re-sent it to Claude on every turn of calls up to ten minutes long, and
+the orchestrator personas kept all of it locally, although the
+orchestrator only reads the latest user message. Each persona now has a
+context policy that compacts the history before the LLM sees it, and that
+also bounds the history the agent keeps:
+
+- ``ContextWindow`` keeps the instructions plus the most recent items.
+- ``RollingSummaryContext`` also folds items that leave the window into a
+  running summary, which is seeded from what the profiling checklist
+  already records.
+
+Both policies stay within a token budget. Token counts are estimated at
+four characters per token, which is close enough for budgeting.
+"""
+
+import asyncio
+import logging
+import os
+
+from livekit.agents import llm
+
+from metrics import get_metrics
+
+logger = logging.getLogger("nitara-voice-context")
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "6000"))
+CONTEXT_WINDOW_ITEMS = int(os.getenv("CONTEXT_WINDOW_ITEMS", "12"))
+CONTEXT_SUMMARY_TOKENS = int(os.getenv("CONTEXT_SUMMARY_TOKENS", "500"))
+
+SUMMARY_ITEM_ID = "nitara-context-summary"
+SUMMARY_PROMPT = (
+    "You maintain running notes on a voice conversation with a founder. Merge "
+    "the new transcript lines into the notes. Keep facts the founder shared, "
+    "open questions and commitments; drop pleasantries. Plain sentences, at "
+    "most {words} words."
+)
+# Evicted lines kept verbatim in the summary until the LLM has folded them in
+_PENDING_LINE_CHARS = 200
+# An oversized message is cut to the budget, unless that leaves less than this
+_MIN_TRUNCATED_CHARS = 80
+_TRUNCATION_MARK = " [...]"
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+def item_text(item) -> str:
+    kind = getattr(item, "type", "message")
+    if kind == "message":
+        return item.text_content or ""
+    if kind == "function_call":
+        return f"{item.name}({item.arguments})"
+    if kind == "function_call_output":
+        return str(item.output)
+    return ""
+
+
+def item_tokens(item) -> int:
+    # A few tokens of per-item framing on top of the text
+    return estimate_tokens(item_text(item)) + 4
+
+
+def _is_instructions(item) -> bool:
+    return (getattr(item, "type", "") == "message" and item.role in ("system", "developer")
+            and item.id != SUMMARY_ITEM_ID)
+
+
+def _truncated(item, budget: int):
+    """A copy of message ``item`` cut to ``budget`` tokens, or None if it can't be."""
+    chars = (budget - 4) * 4 - len(_TRUNCATION_MARK)
+    if getattr(item, "type", "") != "message" or chars < _MIN_TRUNCATED_CHARS:
+        return None
+    text = item_text(item)[:chars].rstrip() + _TRUNCATION_MARK
+    return item.model_copy(update={"content": [text]})
+
+
+class ContextWindow:
+    """Instructions plus the most recent items, within item and token limits."""
+
+    def __init__(self, persona: str, max_items: int = CONTEXT_WINDOW_ITEMS,
+                 token_budget: int = CONTEXT_TOKEN_BUDGET):
+        self.persona = persona
+        self._max_items = max_items
+        self._token_budget = token_budget
+        self._warned_budget = False
+
+    def compact(self, chat_ctx: llm.ChatContext, report: bool = False) -> llm.ChatContext:
+        """A bounded copy of ``chat_ctx``; ``report`` records its size as a sent turn."""
+        head = [i for i in chat_ctx.items if _is_instructions(i)]
+        history = [i for i in chat_ctx.items if not _is_instructions(i) and i.id != SUMMARY_ITEM_ID]
+        extra = self._extra_items()
+        budget = (self._token_budget - sum(item_tokens(i) for i in head)
+                  - max(sum(item_tokens(i) for i in extra), self._reserved_tokens()))
+        if budget <= 0 and not self._warned_budget:
+            self._warned_budget = True
+            logger.warning(f"{self.persona}: instructions alone exceed the "
+                           f"{self._token_budget}-token context budget")
+
+        kept = self._recent(history, budget)
+        evicted = history[:len(history) - len(kept)]
+        if evicted:
+            self._on_evicted(evicted)
+            extra = self._extra_items()
+
+        items = head + extra + kept
+        if report:
+            self._report(items, len(evicted))
+        return llm.ChatContext(items)
+
+    def _recent(self, history: list, budget: int) -> list:
+        """The longest suffix of ``history`` within the limits.
+
+        A newest message that alone is over the budget is cut down to fit;
+        anything else over it is left out entirely.
+        """
+        kept = []
+        used = 0
+        for item in reversed(history):
+            cost = item_tokens(item)
+            if kept and (len(kept) >= self._max_items or used + cost > budget):
+                break
+            if not kept and cost > budget:
+                item = _truncated(item, budget)
+                if item is None:
+                    break
+                cost = item_tokens(item)
+            kept.append(item)
+            used += cost
+        kept.reverse()
+        # A tool output without its call is rejected by the providers
+        while len(kept) > 1 and getattr(kept[0], "type", "") == "function_call_output":
+            kept.pop(0)
+        return kept
+
+    def _extra_items(self) -> list:
+        return []
+
+    def _reserved_tokens(self) -> int:
+        """Budget held back for ``_extra_items``, which may grow during compaction."""
+        return 0
+
+    def _on_evicted(self, items: list) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    def _report(self, items: list, evicted: int) -> None:
+        tokens = sum(item_tokens(i) for i in items)
+        voice_metrics = get_metrics()
+        voice_metrics.incr("context_turns", persona=self.persona)
+        voice_metrics.incr("context_tokens_sent", tokens, persona=self.persona)
+        voice_metrics.set_gauge("context_tokens_last", tokens, persona=self.persona)
+        voice_metrics.set_gauge("context_items_last", len(items), persona=self.persona)
+        if evicted:
+            voice_metrics.incr("context_items_evicted", evicted, persona=self.persona)
+        logger.debug(f"{self.persona} context: {len(items)} items, ~{tokens} tokens")
+
+
+class RollingSummaryContext(ContextWindow):
+    """A window whose evicted turns are folded into a running summary.
+
+    ``seed`` is what is already known before the call (the checklist notes).
+    Evicted turns are kept as clipped transcript lines until ``summarizer``
+    has merged them into the summary in the background; without a
+    summarizer, the oldest lines give way to newer ones.
+    """
+
+    def __init__(self, persona: str, seed: str = "", summarizer: llm.LLM | None = None,
+                 max_items: int = CONTEXT_WINDOW_ITEMS, token_budget: int = CONTEXT_TOKEN_BUDGET,
+                 summary_tokens: int = CONTEXT_SUMMARY_TOKENS):
+        super().__init__(persona, max_items, token_budget)
+        self._summary = seed
+        self._pending: list[str] = []
+        self._folded: set[str] = set()
+        self._summarizer = summarizer
+        self._summary_tokens = summary_tokens
+        self._summary_task: asyncio.Task | None = None
+
+    def summary_text(self) -> str:
+        text = self._summary
+        if self._pending:
+            text = f"{text}\n\nEarlier in this call:\n" + "\n".join(self._pending)
+        # Over the limit, keep the start of the notes and the newest lines
+        limit = self._summary_tokens * 4
+        return text if len(text) <= limit else text[:limit // 3] + " ... " + text[-(limit * 2 // 3):]
+
+    def _reserved_tokens(self) -> int:
+        return self._summary_tokens + 32
+
+    def _extra_items(self) -> list:
+        text = self.summary_text()
+        if not text:
+            return []
+        return [llm.ChatMessage(
+            id=SUMMARY_ITEM_ID, role="system",
+            content=[f"What you already know from earlier in this conversation and previous sessions:\n{text}"],
+        )]
+
+    def _on_evicted(self, items: list) -> None:
+        for item in items:
+            if item.id in self._folded:
+                continue
+            self._folded.add(item.id)
+            if getattr(item, "type", "") != "message" or item.role not in ("user", "assistant"):
+                continue
+            text = " ".join(item_text(item).split())
+            if text:
+                speaker = "Founder" if item.role == "user" else "Nitara"
+                self._pending.append(f"{speaker}: {text[:_PENDING_LINE_CHARS]}")
+        if self._pending and self._summarizer is not None and (
+                self._summary_task is None or self._summary_task.done()):
+            self._summary_task = asyncio.create_task(self._summarize(list(self._pending)))
+
+    async def _summarize(self, lines: list[str]) -> None:
+        ctx = llm.ChatContext.empty()
+        ctx.add_message(role="system", content=SUMMARY_PROMPT.format(words=self._summary_tokens * 3 // 4))
+        ctx.add_message(role="user", content=f"Notes so far:\n{self._summary or '(none)'}\n\n"
+                                             f"New transcript lines:\n" + "\n".join(lines))
+        text = ""
+        try:
+            async with self._summarizer.chat(chat_ctx=ctx) as stream:
+                async for chunk in stream:
+                    if chunk.delta and chunk.delta.content:
+                        text += chunk.delta.content
+        except Exception as e:
+            logger.warning(f"{self.persona} context summary failed, keeping transcript lines: {e}")
+            return
+        if text.strip():
+            self._summary = text.strip()
+            # Lines evicted while the summary was being written stay pending
+            self._pending = self._pending[len(lines):]
+            get_metrics().incr("context_summaries", persona=self.persona)
+
+    async def aclose(self) -> None:
+        if self._summary_task is not None:
+            self._summary_task.cancel()
+            await asyncio.gather(self._summary_task, return_exceptions=True)
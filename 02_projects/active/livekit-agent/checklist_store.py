@@ -0,0 +1,343 @@
+"""Profiling checklist store with a write-ahead journal and write-behind flush.
+
+``update_profiling_data`` used to read, modify and rewrite the whole
+checklist on every call, without locking. ``ChecklistStore`` keeps an
+in-memory copy and recomputes completeness only for the touched domain.
+Each update is appended to a journal next to the checklist and fsynced
+before it is acknowledged. Journalled updates are folded into the
+checklist by a debounced flush that re-reads the file, applies the
+journal, writes a temp file and renames it over the original.
+
+Journal appends and flushes hold an exclusive ``flock`` on a sidecar lock
+file, so several worker processes can share one checklist. Any process's
+flush applies every journalled update. A journal left behind by a crash
+is replayed on the next load.
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from datetime import datetime
+
+from file_io import run_file_io
+
+logger = logging.getLogger("nitara-voice-checklist")
+CHECKLIST_FLUSH_SECONDS = float(os.getenv("CHECKLIST_FLUSH_SECONDS", "2"))
+CHECKLIST_FLUSH_MAX_SECONDS = float(os.getenv("CHECKLIST_FLUSH_MAX_SECONDS", "10"))
+
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2}
+# Domains at or above this completeness no longer contribute gaps
+GAP_COMPLETENESS_TARGET = 80
+
+
+def domain_completeness(items: list[dict]) -> int:
+    if not items:
+        return 0
+    known = sum(1 for i in items if i.get("status") == "known")
+    partial = sum(1 for i in items if i.get("status") == "partial")
+    return round((known + partial * 0.5) / len(items) * 100)
+
+
+def _apply(checklist: dict, entry: dict) -> bool:
+    """Apply one journal entry to ``checklist``; False if it no longer fits."""
+    domain = checklist.get("domains", {}).get(entry["domain"])
+    if domain is None:
+        return False
+    items = domain.get("items", [])
+    for item in items:
+        if item["key"] == entry["key"]:
+            item["status"] = entry["status"]
+            item["source"] = entry.get("source", "voice_conversation")
+            if entry.get("notes"):
+                item["notes"] = entry["notes"]
+            domain["completeness"] = domain_completeness(items)
+            return True
+    return False
+
+
+def _overall(checklist: dict) -> int:
+    domains = list(checklist.get("domains", {}).values())
+    if not domains:
+        return 0
+    return round(sum(d.get("completeness", 0) for d in domains) / len(domains))
+
+
+class Gap:
+    """An unknown checklist item worth asking about."""
+
+    __slots__ = ("domain_key", "domain_label", "key", "label", "priority")
+
+    def __init__(self, domain_key: str, domain_label: str, key: str, label: str, priority: str):
+        self.domain_key = domain_key
+        self.domain_label = domain_label
+        self.key = key
+        self.label = label
+        self.priority = priority
+
+
+class GapIndex:
+    """Unknown items ordered by (domain priority, domain completeness).
+
+    Domains with gaps are kept in a sorted list; ``update_domain`` re-files
+    only the domain that changed. ``top`` results are cached until the next
+    change, so asking for the next gaps after every answer costs nothing.
+    """
+
+    def __init__(self):
+        self._order: list[tuple] = []
+        self._sort_keys: dict[str, tuple] = {}
+        self._gaps: dict[str, list[Gap]] = {}
+        self._positions: dict[str, int] = {}
+        self._top: dict[int, list[Gap]] = {}
+        self.version = 0
+
+    def rebuild(self, checklist: dict) -> None:
+        self._order = []
+        self._sort_keys = {}
+        self._gaps = {}
+        self._positions = {}
+        for domain_key, domain in checklist.get("domains", {}).items():
+            self.update_domain(domain_key, domain)
+
+    def update_domain(self, domain_key: str, domain: dict) -> None:
+        old = self._sort_keys.pop(domain_key, None)
+        if old is not None:
+            del self._order[bisect_left(self._order, old)]
+        # File order breaks ties, as the old stable sort did
+        position = self._positions.setdefault(domain_key, len(self._positions))
+        completeness = domain.get("completeness", 0)
+        priority = domain.get("priority", "medium")
+        gaps = []
+        if completeness < GAP_COMPLETENESS_TARGET:
+            gaps = [
+                Gap(domain_key, domain.get("label", domain_key), item["key"], item["label"], priority)
+                for item in domain.get("items", []) if item.get("status") == "unknown"
+            ]
+        self._gaps[domain_key] = gaps
+        if gaps:
+            sort_key = (PRIORITY_ORDER.get(priority, 3), completeness, position, domain_key)
+            insort(self._order, sort_key)
+            self._sort_keys[domain_key] = sort_key
+        self._top.clear()
+        self.version += 1
+
+    def top(self, n: int = 5) -> list[Gap]:
+        cached = self._top.get(n)
+        if cached is None:
+            cached = []
+            for *_, domain_key in self._order:
+                cached.extend(self._gaps[domain_key][:n - len(cached)])
+                if len(cached) >= n:
+                    break
+            self._top[n] = cached
+        return cached
+
+
+class ChecklistStore:
+    """In-memory profiling checklist backed by a journal and atomic flushes."""
+
+    def __init__(self, path: str, flush_seconds: float = CHECKLIST_FLUSH_SECONDS,
+                 flush_max_seconds: float = CHECKLIST_FLUSH_MAX_SECONDS):
+        self.path = path
+        self.journal_path = f"{path}.journal"
+        self._lock_path = f"{path}.lock"
+        self._flush_seconds = flush_seconds
+        self._flush_max_seconds = flush_max_seconds
+        self._mutex = threading.RLock()
+        self._checklist: dict | None = None
+        self._file_mtime_ns: int | None = None
+        self._completeness_total = 0
+        self._unflushed = 0
+        self._first_unflushed = 0.0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+        self.gaps = GapIndex()
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive cross-process lock on the checklist's sidecar lock file."""
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    # ─── Reads ────────────────────────────────────────────────────────────
+
+    def checklist(self) -> dict:
+        """The current checklist, reloaded first if another writer changed it.
+
+        Callers must treat the returned dict as read-only. Blocking on the
+        first call and after external writes.
+        """
+        with self._mutex:
+            if self._checklist is None or self._file_changed():
+                self._load()
+            return self._checklist
+
+    def overall_completeness(self) -> int:
+        with self._mutex:
+            domains = self.checklist().get("domains", {})
+            return round(self._completeness_total / len(domains)) if domains else 0
+
+    def top_gaps(self, n: int = 5) -> list[Gap]:
+        """Highest-priority gaps; blocking only when the checklist is (re)loaded."""
+        with self._mutex:
+            self.checklist()
+            return self.gaps.top(n)
+
+    def _file_changed(self) -> bool:
+        try:
+            return os.stat(self.path).st_mtime_ns != self._file_mtime_ns
+        except FileNotFoundError:
+            return self._file_mtime_ns is not None
+
+    def _load(self) -> None:
+        """Read the checklist and replay any journalled, unflushed updates."""
+        with self._file_lock():
+            checklist, mtime = self._read_file()
+            entries = self._read_journal()
+        for entry in entries:
+            _apply(checklist, entry)
+        self._set_checklist(checklist, mtime)
+        self._unflushed = len(entries)
+        if entries:
+            logger.info(f"Replayed {len(entries)} journalled checklist updates")
+
+    def _read_file(self) -> tuple[dict, int | None]:
+        try:
+            with open(self.path, "r") as f:
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                return json.load(f), mtime
+        except FileNotFoundError:
+            return {"domains": {}}, None
+
+    def _read_journal(self) -> list[dict]:
+        entries = []
+        try:
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping torn checklist journal line")
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _set_checklist(self, checklist: dict, mtime: int | None) -> None:
+        self._checklist = checklist
+        self._file_mtime_ns = mtime
+        self._completeness_total = sum(
+            d.get("completeness", 0) for d in checklist.get("domains", {}).values()
+        )
+        self.gaps.rebuild(checklist)
+
+    # ─── Writes ───────────────────────────────────────────────────────────
+
+    def update(self, domain: str, key: str, status: str, notes: str = "") -> tuple[int, int]:
+        """Record one item update; returns (domain, overall) completeness.
+
+        The update is durable in the journal when this returns; the
+        checklist file itself is rewritten by the next flush. Raises
+        ``ValueError`` for an unknown domain or key. Blocking.
+        """
+        with self._mutex:
+            domains = self.checklist().get("domains", {})
+            if domain not in domains:
+                raise ValueError(f"Unknown domain: {domain}. Available: {', '.join(domains.keys())}")
+            if not any(i["key"] == key for i in domains[domain].get("items", [])):
+                raise ValueError(f"Unknown key '{key}' in domain '{domain}'.")
+
+            entry = {"domain": domain, "key": key, "status": status,
+                     "source": "voice_conversation", "notes": notes, "ts": time.time()}
+            with self._file_lock():
+                with open(self.journal_path, "a") as f:
+                    f.write(json.dumps(entry) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            previous = domains[domain].get("completeness", 0)
+            _apply(self._checklist, entry)
+            self._completeness_total += domains[domain]["completeness"] - previous
+            self.gaps.update_domain(domain, domains[domain])
+            if not self._unflushed:
+                self._first_unflushed = time.monotonic()
+            self._unflushed += 1
+            return domains[domain]["completeness"], self.overall_completeness()
+
+    def flush(self) -> bool:
+        """Fold the journal into the checklist file; True if it was rewritten.
+
+        Re-reads the file under the lock so updates made by other processes
+        since our last load are kept, then writes atomically. Blocking.
+        """
+        with self._mutex, self._file_lock():
+            entries = self._read_journal()
+            if not entries:
+                self._unflushed = 0
+                return False
+            checklist, _ = self._read_file()
+            for entry in entries:
+                if not _apply(checklist, entry):
+                    logger.warning(f"Dropping checklist update for {entry['domain']}.{entry['key']}: no such item")
+            checklist["overall_completeness"] = _overall(checklist)
+            checklist["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(checklist, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            # The journal is only cleared once the checklist is on disk
+            with open(self.journal_path, "w") as f:
+                os.fsync(f.fileno())
+
+            self._set_checklist(checklist, os.stat(self.path).st_mtime_ns)
+            self._unflushed = 0
+            logger.info(f"Flushed {len(entries)} checklist updates")
+            return True
+
+    def schedule_flush(self) -> None:
+        """Debounce a write-behind flush on the running loop.
+
+        Each call pushes the flush back by ``flush_seconds``, but never past
+        ``flush_max_seconds`` after the oldest unflushed update.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        waited = time.monotonic() - self._first_unflushed if self._unflushed else 0.0
+        delay = max(0.0, min(self._flush_seconds, self._flush_max_seconds - waited))
+        self._flush_handle = asyncio.get_running_loop().call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_in_executor())
+        else:
+            self.schedule_flush()  # one flush at a time; retry after it
+
+    async def _flush_in_executor(self) -> None:
+        try:
+            await run_file_io(self.flush)
+        except Exception as e:
+            # Updates stay in the journal and are retried on the next flush
+            logger.error(f"Checklist flush failed: {e}")
+
+    async def aclose(self) -> None:
+        """Flush pending updates now; call at job shutdown."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+        if self._unflushed:
+            await self._flush_in_executor()
@@ -0,0 +1,169 @@
+"""Adaptive end-of-turn delay per channel and per speaker.
+
+``build_session`` used the same fixed silence wait for every caller, so
+phone callers and fast web talkers waited identically before each reply.
+``EndpointingController`` starts from a channel profile and adapts the
+session's ``min_endpointing_delay`` from what it sees:
+
+- pauses the caller made mid-turn, where they resumed before the turn was
+  committed. The delay only needs to outlast most of these.
+- false endpoints, where the turn was committed and the caller kept
+  talking within ``ENDPOINTING_FALSE_WINDOW``, before the reply finished.
+  These push the delay up.
+
+The delay always stays within the profile's floor and ceiling. At the end of
+the session the controller logs the end-of-turn latency saved compared with
+the profile's starting delay.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+
+from metrics import get_metrics
+
+logger = logging.getLogger("nitara-voice-endpointing")
+ENDPOINTING_ADAPTIVE = os.getenv("ENDPOINTING_ADAPTIVE", "true").lower() != "false"
+# Seconds after a committed turn in which the caller resuming counts as a false endpoint
+ENDPOINTING_FALSE_WINDOW = float(os.getenv("ENDPOINTING_FALSE_WINDOW", "1.5"))
+# False-endpoint rate above which the delay is raised
+ENDPOINTING_FALSE_RATE = float(os.getenv("ENDPOINTING_FALSE_RATE", "0.15"))
+ENDPOINTING_STEP = float(os.getenv("ENDPOINTING_STEP", "0.1"))
+# Headroom over the caller's p90 mid-turn pause
+ENDPOINTING_PAUSE_MARGIN = 0.1
+ENDPOINTING_MIN_PAUSES = 5
+
+
+class EndpointingProfile:
+    """Starting endpointing delays for a channel, and the bounds adaptation stays within."""
+
+    __slots__ = ("name", "min_delay", "max_delay", "floor", "ceiling")
+
+    def __init__(self, name: str, min_delay: float, max_delay: float, floor: float, ceiling: float):
+        self.name = name
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.floor = floor
+        self.ceiling = ceiling
+
+
+# Narrowband phone audio has codec gaps and jitter, and callers pause longer,
+# so SIP starts later and may not go as low as web.
+PROFILES = {
+    ("web", True): EndpointingProfile("web-stt", 0.3, 3.0, floor=0.2, ceiling=1.0),
+    ("web", False): EndpointingProfile("web-vad", 0.5, 5.0, floor=0.3, ceiling=1.2),
+    ("sip", True): EndpointingProfile("sip-stt", 0.4, 3.5, floor=0.3, ceiling=1.2),
+    ("sip", False): EndpointingProfile("sip-vad", 0.6, 5.0, floor=0.4, ceiling=1.5),
+}
+
+
+def endpointing_profile(is_sip: bool, stt_turn_detection: bool) -> EndpointingProfile:
+    return PROFILES[("sip" if is_sip else "web", stt_turn_detection)]
+
+
+class EndpointingController:
+    """Tunes one session's minimum endpointing delay from its caller's pauses."""
+
+    def __init__(self, profile: EndpointingProfile, adaptive: bool = ENDPOINTING_ADAPTIVE):
+        self.profile = profile
+        self.min_delay = profile.min_delay
+        self._adaptive = adaptive
+        self._session = None
+        self._pauses: deque[float] = deque(maxlen=50)
+        self._outcomes: deque[bool] = deque(maxlen=20)
+        self._user_stopped_at: float | None = None
+        self._committed_at: float | None = None
+        self._turns = 0
+        self._false_endpoints = 0
+        self._saved_seconds = 0.0
+
+    def attach(self, session) -> None:
+        self._session = session
+
+        @session.on("user_state_changed")
+        def _on_user_state(ev):
+            now = time.monotonic()
+            if ev.new_state == "speaking":
+                self._on_user_resumed(now)
+            elif ev.old_state == "speaking":
+                self._user_stopped_at = now
+
+        @session.on("agent_state_changed")
+        def _on_agent_state(ev):
+            if ev.new_state == "thinking":
+                self._on_turn_committed(time.monotonic())
+            elif ev.old_state == "speaking" and self._committed_at is not None:
+                # The reply played out without the caller picking up again
+                self._committed_at = None
+                self._outcomes.append(False)
+                self._adapt()
+
+    def _on_user_resumed(self, now: float) -> None:
+        if self._committed_at is not None:
+            # Resumed right after the turn was committed: it ended too early
+            false_endpoint = now - self._committed_at <= ENDPOINTING_FALSE_WINDOW
+            self._committed_at = None
+            self._outcomes.append(false_endpoint)
+            if false_endpoint:
+                self._false_endpoints += 1
+                get_metrics().incr("endpointing_false_endpoints", profile=self.profile.name)
+            self._adapt()
+        elif self._user_stopped_at is not None:
+            # A pause the endpointer correctly waited through
+            self._pauses.append(now - self._user_stopped_at)
+        self._user_stopped_at = None
+
+    def _on_turn_committed(self, now: float) -> None:
+        if self._committed_at is not None:
+            self._outcomes.append(False)  # the previous turn was not followed up
+        self._committed_at = now
+        self._user_stopped_at = None
+        self._turns += 1
+        self._saved_seconds += self.profile.min_delay - self.min_delay
+
+    def _adapt(self) -> None:
+        if not self._adaptive:
+            return
+        false_rate = self._outcomes.count(True) / len(self._outcomes) if self._outcomes else 0.0
+        target = self.min_delay
+        if false_rate > ENDPOINTING_FALSE_RATE:
+            target = self.min_delay + ENDPOINTING_STEP
+        elif len(self._pauses) >= ENDPOINTING_MIN_PAUSES:
+            ordered = sorted(self._pauses)
+            p90 = ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))]
+            wanted = p90 + ENDPOINTING_PAUSE_MARGIN
+            # Come down gently, go up a full step
+            target = self.min_delay + max(-ENDPOINTING_STEP / 2, min(ENDPOINTING_STEP, wanted - self.min_delay))
+        self._apply(min(self.profile.ceiling, max(self.profile.floor, target)))
+
+    def _apply(self, min_delay: float) -> None:
+        if abs(min_delay - self.min_delay) < 0.02:
+            return
+        update_options = getattr(self._session, "update_options", None)
+        if update_options is None:
+            return
+        try:
+            update_options(
+                min_endpointing_delay=min_delay,
+                max_endpointing_delay=max(self.profile.max_delay, min_delay * 2),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update endpointing delay: {e}")
+            return
+        logger.debug(f"Endpointing ({self.profile.name}): min delay {self.min_delay:.2f}s -> {min_delay:.2f}s")
+        self.min_delay = min_delay
+
+    async def aclose(self) -> None:
+        """Log and record this session's endpointing outcome; call at shutdown."""
+        if not self._turns:
+            return
+        voice_metrics = get_metrics()
+        voice_metrics.incr("endpointing_saved_seconds", self._saved_seconds, profile=self.profile.name)
+        voice_metrics.incr("endpointing_turns", self._turns, profile=self.profile.name)
+        logger.info(
+            f"Endpointing ({self.profile.name}): min delay {self.profile.min_delay:.2f}s -> "
+            f"{self.min_delay:.2f}s over {self._turns} turns, {self._false_endpoints} false endpoints, "
+            f"end-of-turn latency saved {self._saved_seconds:.2f}s "
+            f"({self._saved_seconds / self._turns * 1000:.0f}ms/turn)"
+        )
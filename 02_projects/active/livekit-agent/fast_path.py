@@ -0,0 +1,129 @@
+"""Local fast path for simple voice requests.
+
+A rule-based intent classifier that sits in front of ``OrchestratorLLM``.
+Requests such as "what's in my queue" or "read the latest portfolio report"
+can be answered straight from the function tools, with no orchestrator LLM
+round trip. Anything that does not match with high confidence is forwarded
+as before.
+"""
+
+import os
+import re
+
+from tools import check_task_status, read_latest_report
+
+FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "true").lower() != "false"
+FAST_PATH_THRESHOLD = float(os.getenv("FAST_PATH_THRESHOLD", "0.85"))
+
+# Tools report failures as text instead of raising
+_TOOL_FAILURE = re.compile(r"^(?:Error |Could not )")
+
+# Spoken report names -> report type prefix in REPORTS_DIR; first match wins
+REPORT_TYPES = [
+    (re.compile(r"\bportfolio\b"), "portfolio-analysis"),
+    (re.compile(r"\b(monitor(ing)?|health|system status|project status)\b"), "monitor-project"),
+    (re.compile(r"\benrich(ment)?\b"), "network-enrich"),
+    (re.compile(r"\bnetwork\b"), "network-analysis"),
+    (re.compile(r"\byou ?tube\b"), "research-youtube"),
+    (re.compile(r"\bmarket( research)?\b"), "research-market"),
+    (re.compile(r"\btime[- ]value\b"), "time-value-analyze"),
+    (re.compile(r"\bknowledge graph\b"), "knowledge-graph-update"),
+    (re.compile(r"\bdecision journal\b"), "decision-journal-evaluate"),
+]
+
+# (intent, pattern, confidence) — patterns match the whole normalised utterance
+PATTERNS = [
+    ("queue_status", re.compile(
+        r"^(hey nitara )?(what'?s|what is|whats) (in|on) (my|the) (task )?queue( right now| today)?$"), 0.97),
+    ("queue_status", re.compile(
+        r"^(how'?s|how is|check|show( me)?|give me) (my |the )?(task )?queue( status)?( right now| today)?$"), 0.95),
+    ("queue_status", re.compile(
+        r"^(what'?s|what is) (the )?(task |queue )?status( of (my|the) (tasks|queue))?$"), 0.9),
+    ("queue_status", re.compile(r"^how many tasks (are )?(pending|running|queued|in the queue)$"), 0.92),
+    ("latest_report", re.compile(
+        r"^(can you |please )?(read|tell|give|show)( me)? (the |my )?(latest|last|most recent|newest) "
+        r"(?P<subject>[a-z -]+?) ?report$"), 0.96),
+    ("latest_report", re.compile(
+        r"^(what'?s|what is|what does) (in )?(the |my )?(latest|last|most recent) "
+        r"(?P<subject>[a-z -]+?) ?report( say)?$"), 0.93),
+]
+
+# Words that suggest the caller wants reasoning, not a lookup
+FORWARD_CUES = re.compile(r"\b(why|should|compare|recommend|explain|and then|also|but)\b")
+
+_FILLER = re.compile(r"^(um+|uh+|so|okay|ok|hey|hi|please)[, ]+")
+_PUNCT = re.compile(r"[^\w\s'-]")
+
+
+def normalise(text: str) -> str:
+    text = _PUNCT.sub("", text.lower()).strip()
+    previous = None
+    while previous != text:
+        previous = text
+        text = _FILLER.sub("", text)
+    return re.sub(r"\s+", " ", text)
+
+
+class FastPathError(Exception):
+    """A tool could not answer; the turn goes to the orchestrator instead."""
+
+
+class RouteMatch:
+    """A fast-path decision: which intent, how confident, and its argument."""
+
+    __slots__ = ("intent", "confidence", "argument")
+
+    def __init__(self, intent: str, confidence: float, argument: str = ""):
+        self.intent = intent
+        self.confidence = confidence
+        self.argument = argument
+
+
+class IntentRouter:
+    """Classifies utterances into simple intents the tools can answer."""
+
+    def __init__(self, intents: set[str] | None = None,
+                 threshold: float = FAST_PATH_THRESHOLD):
+        self._intents = intents or {"queue_status", "latest_report"}
+        self.threshold = threshold
+
+    def classify(self, text: str) -> RouteMatch | None:
+        utterance = normalise(text)
+        if not utterance:
+            return None
+        best = None
+        for intent, pattern, confidence in PATTERNS:
+            if intent not in self._intents:
+                continue
+            match = pattern.match(utterance)
+            if not match:
+                continue
+            argument = ""
+            if intent == "latest_report":
+                argument = self._report_type(match.group("subject"))
+                if not argument:
+                    continue
+            if FORWARD_CUES.search(utterance):
+                confidence -= 0.3
+            if best is None or confidence > best.confidence:
+                best = RouteMatch(intent, confidence, argument)
+        return best
+
+    @staticmethod
+    def _report_type(subject: str) -> str:
+        for pattern, report_type in REPORT_TYPES:
+            if pattern.search(subject):
+                return report_type
+        return ""
+
+    async def answer(self, match: RouteMatch) -> str:
+        """The tool's answer; raises ``FastPathError`` when the tool failed."""
+        if match.intent == "queue_status":
+            result = await check_task_status()
+        elif match.intent == "latest_report":
+            result = await read_latest_report(match.argument)
+        else:
+            raise ValueError(f"No fast-path handler for intent {match.intent}")
+        if _TOOL_FAILURE.match(result):
+            raise FastPathError(result)
+        return result
@@ -0,0 +1,32 @@
+"""Bounded thread pool for blocking file access from the event loop.
+
+Function tools and the stores behind them read and write report and
+checklist files. Done inline, one slow disk read stalls audio frame
+handling for every session in the process. Done on the loop's default
+executor, file work competes with DNS lookups and everything else that
+uses it. ``run_file_io`` runs it on a small dedicated pool instead.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+FILE_IO_WORKERS = int(os.getenv("FILE_IO_WORKERS", "4"))
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_file_executor() -> ThreadPoolExecutor:
+    """Return the worker-wide file I/O thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=FILE_IO_WORKERS, thread_name_prefix="nitara-file-io")
+    return _executor
+
+
+async def run_file_io(fn, *args, **kwargs):
+    """Run blocking ``fn(*args, **kwargs)`` on the file I/O pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        get_file_executor(), partial(fn, *args, **kwargs)
+    )
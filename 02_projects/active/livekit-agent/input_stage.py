@@ -0,0 +1,177 @@
+"""Caller audio and transcript filtering ahead of the LLM.
+
+On phone lines, background noise set off VAD, and every junk transcript
+that produced became a full orchestrator round trip. Two stages sit in
+front of the LLM:
+
+- ``NoiseSuppressionBudget`` turns on LiveKit noise cancellation for SIP
+  callers, but only as many at once as the worker's CPU can afford.
+  Suppression costs CPU in the job process for the whole call. Slots are
+  files shared by every job process on the host, each held with an
+  exclusive ``flock`` for the length of a call. The kernel drops the lock
+  when its process exits, so a crashed job never keeps a slot. A call that
+  finds them all taken, or the host over ``NOISE_SUPPRESSION_CPU_BUDGET``,
+  runs without suppression.
+- ``TurnGate`` drops completed user turns that have no words, are only
+  hesitations, or are short and low-confidence before they reach the LLM.
+  One-character answers ("5", "A") are kept: callers give scores and
+  choices that way.
+"""
+
+import fcntl
+import logging
+import os
+import re
+import tempfile
+
+from file_io import run_file_io
+from metrics import get_metrics
+
+try:
+    from livekit.plugins import noise_cancellation
+    HAS_NOISE_CANCELLATION = True
+except ImportError:
+    HAS_NOISE_CANCELLATION = False
+
+logger = logging.getLogger("nitara-voice-input")
+NOISE_SUPPRESSION_SIP = os.getenv("NOISE_SUPPRESSION_SIP", "true").lower() != "false"
+# Concurrent suppressed calls per worker host
+NOISE_SUPPRESSION_MAX_SESSIONS = int(os.getenv("NOISE_SUPPRESSION_MAX_SESSIONS", "4"))
+# Load average per core above which new calls start without suppression
+NOISE_SUPPRESSION_CPU_BUDGET = float(os.getenv("NOISE_SUPPRESSION_CPU_BUDGET", "0.7"))
+NOISE_SUPPRESSION_DIR = os.getenv(
+    "NOISE_SUPPRESSION_DIR", os.path.join(tempfile.gettempdir(), "nitara-voice-nc"),
+)
+
+TURN_GATE_ENABLED = os.getenv("TURN_GATE_ENABLED", "true").lower() != "false"
+TURN_GATE_MIN_CONFIDENCE = float(os.getenv("TURN_GATE_MIN_CONFIDENCE", "0.45"))
+# Low confidence only drops turns up to this many words; longer ones are real speech
+TURN_GATE_LOW_CONFIDENCE_WORDS = int(os.getenv("TURN_GATE_LOW_CONFIDENCE_WORDS", "3"))
+
+# Hesitations only. Backchannels like "mhm" and "yeah" can be answers.
+FILLER_WORDS = frozenset({
+    "um", "umm", "uh", "uhh", "uh-uh", "er", "erm", "ah", "ahh", "eh", "hm", "hmm", "hmmm", "mm", "mmm",
+})
+_WORD_RE = re.compile(r"[\w'-]+")
+
+
+def _cpu_per_core() -> float:
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return 0.0
+
+
+class NoiseSuppressionBudget:
+    """Hands out the host's noise-suppression slots to SIP calls."""
+
+    def __init__(self, max_sessions: int = NOISE_SUPPRESSION_MAX_SESSIONS,
+                 cpu_budget: float = NOISE_SUPPRESSION_CPU_BUDGET, slot_dir: str = NOISE_SUPPRESSION_DIR):
+        self._max_sessions = max_sessions
+        self._cpu_budget = cpu_budget
+        self._slot_dir = slot_dir
+        # Slot path -> descriptor holding its lock
+        self._held: dict[str, int] = {}
+
+    def acquire(self) -> str | None:
+        """Claim a free slot; returns its path, or None when over budget."""
+        if self._max_sessions <= 0:
+            return None
+        if self._cpu_budget > 0 and _cpu_per_core() > self._cpu_budget:
+            return None
+        os.makedirs(self._slot_dir, exist_ok=True)
+        for i in range(self._max_sessions):
+            path = os.path.join(self._slot_dir, f"slot-{i}")
+            if path not in self._held and self._claim(path):
+                return path
+        return None
+
+    def release(self, slot: str | None) -> None:
+        fd = self._held.pop(slot, None) if slot is not None else None
+        if fd is not None:
+            os.close(fd)  # drops the lock; the file stays for the next call
+
+    def _claim(self, path: str) -> bool:
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._held[path] = fd
+        return True
+
+
+_noise_budget: NoiseSuppressionBudget | None = None
+
+
+def get_noise_budget() -> NoiseSuppressionBudget:
+    """Return the process's view of the host noise-suppression budget."""
+    global _noise_budget
+    if _noise_budget is None:
+        _noise_budget = NoiseSuppressionBudget()
+    return _noise_budget
+
+
+async def noise_filter_for_call(sip_call: bool):
+    """The noise cancellation filter for this call and its budget slot, or (None, None).
+
+    Release the slot with ``get_noise_budget().release(slot)`` at shutdown.
+    """
+    if not (sip_call and NOISE_SUPPRESSION_SIP and HAS_NOISE_CANCELLATION):
+        return None, None
+    voice_metrics = get_metrics()
+    slot = await run_file_io(get_noise_budget().acquire)
+    if slot is None:
+        voice_metrics.incr("noise_suppression_skipped")
+        logger.info("Noise suppression budget exhausted; SIP call runs without it")
+        return None, None
+    try:
+        # The telephony model is tuned for narrowband audio; older plugins only have BVC
+        factory = getattr(noise_cancellation, "BVCTelephony", None) or noise_cancellation.BVC
+        noise_filter = factory()
+    except Exception as e:
+        get_noise_budget().release(slot)
+        logger.warning(f"Noise cancellation unavailable: {e}")
+        return None, None
+    voice_metrics.incr("noise_suppression_sessions")
+    return noise_filter, slot
+
+
+class TurnGate:
+    """Decides whether a completed user turn is worth a reply.
+
+    ``observe_final`` records the STT confidence of each final transcript in
+    the turn; ``check`` returns why a turn should be dropped, or None.
+    """
+
+    def __init__(self, channel: str, min_confidence: float = TURN_GATE_MIN_CONFIDENCE,
+                 low_confidence_words: int = TURN_GATE_LOW_CONFIDENCE_WORDS):
+        self.channel = channel
+        self._min_confidence = min_confidence
+        self._low_confidence_words = low_confidence_words
+        self._confidences: list[float] = []
+
+    def observe_final(self, confidence: float) -> None:
+        # Providers that don't score transcripts report 0
+        if confidence > 0:
+            self._confidences.append(confidence)
+
+    def check(self, text: str) -> str | None:
+        confidences, self._confidences = self._confidences, []
+        words = [w.lower() for w in _WORD_RE.findall(text or "") if any(c.isalnum() for c in w)]
+        if not words:
+            return "empty"
+        if all(w in FILLER_WORDS for w in words):
+            return "filler"
+        if (confidences and len(words) <= self._low_confidence_words
+                and sum(confidences) / len(confidences) < self._min_confidence):
+            return "low_confidence"
+        return None
+
+    def record_drop(self, reason: str, text: str, backend_call: bool) -> None:
+        voice_metrics = get_metrics()
+        voice_metrics.incr("turn_gate_dropped", reason=reason, channel=self.channel)
+        if backend_call:
+            voice_metrics.incr("turn_gate_backend_calls_avoided", channel=self.channel)
+        logger.debug(f"Dropped {reason} turn ({self.channel}): {text!r}")
@@ -0,0 +1,174 @@
+"""Per-process cache of STT boosting keywords.
+
+The cache is filled once in ``prewarm`` and refreshed in the background while
+jobs run, so ``entrypoint`` never waits on ``/api/livekit/keywords``. Each
+keyword set is versioned by a content hash of its cleaned keyterms; when the
+backend is unreachable the last good set keeps being served.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import urllib.parse
+import urllib.request
+
+import aiohttp
+
+from backend_client import get_backend_client
+
+logger = logging.getLogger("nitara-voice-keywords")
+BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:3001")
+KEYWORD_REFRESH_SECONDS = float(os.getenv("KEYWORD_REFRESH_SECONDS", "300"))
+KEYWORD_FETCH_TIMEOUT = float(os.getenv("KEYWORD_FETCH_TIMEOUT", "5"))
+
+
+def _keywords_url(project_id: str = "") -> str:
+    url = f"{BACKEND_URL}/api/livekit/keywords"
+    if project_id:
+        url += "?" + urllib.parse.urlencode({"projectId": project_id})
+    return url
+
+
+def clean_keyterms(keywords: list[str]) -> list[str]:
+    """Strip ``term:boost`` suffixes, blanks and duplicates, keeping order."""
+    seen = set()
+    terms = []
+    for k in keywords:
+        term = k.split(":")[0].strip() if k else ""
+        if term and term not in seen:
+            seen.add(term)
+            terms.append(term)
+    return terms
+
+
+class KeywordSet:
+    """A cleaned keyterm list versioned by the hash of its content."""
+
+    __slots__ = ("keyterms", "version", "fetched_at")
+
+    def __init__(self, keywords: list[str], fetched_at: float = 0.0):
+        self.keyterms = clean_keyterms(keywords)
+        self.version = hashlib.sha1(
+            "\n".join(self.keyterms).encode("utf-8")
+        ).hexdigest()[:12]
+        self.fetched_at = fetched_at
+
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at if self.fetched_at else float("inf")
+
+
+EMPTY_KEYWORDS = KeywordSet([])
+
+
+async def fetch_keywords(project_id: str = "") -> list[str] | None:
+    """Fetch domain-specific keywords from the backend; ``None`` on failure."""
+    try:
+        async with get_backend_client().get(
+            _keywords_url(project_id),
+            timeout=aiohttp.ClientTimeout(total=KEYWORD_FETCH_TIMEOUT),
+        ) as resp:
+            if resp.status == 200:
+                data = await resp.json()
+                return data.get("keywords", [])
+            logger.warning(f"Keyword fetch returned HTTP {resp.status}")
+    except Exception as e:
+        logger.warning(f"Failed to fetch keywords: {e}")
+    return None
+
+
+def fetch_keywords_blocking(project_id: str = "") -> list[str] | None:
+    """Synchronous fetch for ``prewarm``, which runs before the job loop."""
+    try:
+        with urllib.request.urlopen(_keywords_url(project_id),
+                                    timeout=KEYWORD_FETCH_TIMEOUT) as resp:
+            return json.loads(resp.read().decode("utf-8")).get("keywords", [])
+    except Exception as e:
+        logger.warning(f"Failed to prefetch keywords: {e}")
+    return None
+
+
+class KeywordCache:
+    """Stale-while-revalidate keyword sets, global and per ``projectId``."""
+
+    def __init__(self, refresh_seconds: float = KEYWORD_REFRESH_SECONDS):
+        self._refresh_seconds = refresh_seconds
+        self._sets: dict[str, KeywordSet] = {}
+        self._pending: dict[str, asyncio.Task] = {}
+        self._refresh_task: asyncio.Task | None = None
+
+    def prefill(self) -> None:
+        """Blocking initial fill of the global set; call from ``prewarm``."""
+        keywords = fetch_keywords_blocking()
+        if keywords is not None:
+            self._store("", keywords)
+
+    def get(self, project_id: str = "") -> KeywordSet:
+        """Return the best cached set without waiting on the backend.
+
+        Falls back to the global set while a project subset is being fetched,
+        and schedules a revalidation when the entry is missing or stale.
+        """
+        entry = self._sets.get(project_id)
+        if entry is None or entry.age() > self._refresh_seconds:
+            self._revalidate(project_id)
+        if entry is None and project_id:
+            entry = self._sets.get("")
+        return entry or EMPTY_KEYWORDS
+
+    def start(self) -> None:
+        """Start periodic background refresh on the running loop."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def aclose(self) -> None:
+        tasks = [t for t in [self._refresh_task, *self._pending.values()] if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresh_task = None
+        self._pending.clear()
+
+    async def refresh(self, project_id: str = "") -> KeywordSet | None:
+        keywords = await fetch_keywords(project_id)
+        if keywords is None:
+            stale = self._sets.get(project_id)
+            if stale is not None:
+                logger.info(
+                    f"Serving stale keywords v{stale.version} "
+                    f"({stale.age():.0f}s old) for '{project_id or 'global'}'"
+                )
+            return stale
+        return self._store(project_id, keywords)
+
+    def _store(self, project_id: str, keywords: list[str]) -> KeywordSet:
+        new_set = KeywordSet(keywords, fetched_at=time.monotonic())
+        current = self._sets.get(project_id)
+        if current is not None and current.version == new_set.version:
+            # Unchanged content: keep the existing list, just mark it fresh
+            current.fetched_at = new_set.fetched_at
+            return current
+        self._sets[project_id] = new_set
+        logger.info(
+            f"Keywords v{new_set.version} for '{project_id or 'global'}': "
+            f"{len(new_set.keyterms)} keyterms"
+        )
+        return new_set
+
+    def _revalidate(self, project_id: str) -> None:
+        if project_id in self._pending:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self.refresh(project_id))
+        except RuntimeError:
+            return  # no loop yet (prewarm); prefill covers this case
+        self._pending[project_id] = task
+        task.add_done_callback(lambda _: self._pending.pop(project_id, None))
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_seconds)
+            for project_id in list(self._sets) or [""]:
+                await self.refresh(project_id)
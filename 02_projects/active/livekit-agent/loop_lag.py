@@ -0,0 +1,171 @@
+"""Event-loop lag sampling for job processes.
+
+Audio frames, VAD and every session's I/O share one event loop per job
+process, so a timer that fires late is the earliest sign of CPU starvation
+or a blocking call. ``LoopLagMonitor`` measures how late a periodic timer
+fires, publishes the p95 as a gauge, and writes it to a small per-process
+file so the worker's load function (see ``worker_load``) can see lag in
+job processes it does not share a loop with. Files live in a directory per
+worker, so workers sharing a host each read only their own jobs.
+
+A watchdog thread also notices when the timer has not fired for
+``LOOP_STALL_THRESHOLD`` seconds. While the loop is still stuck, it logs
+the task that is running and where its thread is executing, so a blocking
+call that creeps back in shows up by name.
+"""
+
+import asyncio
+import glob
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+from metrics import LatencyHistogram, get_metrics
+
+logger = logging.getLogger("nitara-voice-loop")
+LOOP_LAG_DIR = os.getenv("LOOP_LAG_DIR", os.path.join(tempfile.gettempdir(), "nitara-voice-lag"))
+# Set in the worker process and inherited by its job processes
+LOOP_LAG_WORKER_ENV = "NITARA_VOICE_WORKER_ID"
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.1"))
+LOOP_LAG_REPORT_SECONDS = float(os.getenv("LOOP_LAG_REPORT_SECONDS", "2"))
+LOOP_STALL_THRESHOLD = float(os.getenv("LOOP_STALL_THRESHOLD", "0.25"))
+
+
+def claim_worker_namespace() -> None:
+    """Give this worker its own lag directory; call before job processes start."""
+    os.environ.setdefault(LOOP_LAG_WORKER_ENV, str(os.getpid()))
+
+
+def loop_lag_dir() -> str:
+    """Lag directory of the worker this process belongs to."""
+    return os.path.join(LOOP_LAG_DIR, os.getenv(LOOP_LAG_WORKER_ENV, "shared"))
+
+
+def read_loop_lag(max_age: float = 10.0) -> float:
+    """Highest lag p95 reported by this worker's live job processes, in seconds. Blocking."""
+    worst = 0.0
+    cutoff = time.time() - max_age
+    for path in glob.glob(os.path.join(loop_lag_dir(), "*.lag")):
+        try:
+            if os.stat(path).st_mtime < cutoff:
+                os.remove(path)  # the process is gone
+                continue
+            with open(path, "r") as f:
+                worst = max(worst, float(f.read() or 0))
+        except (OSError, ValueError):
+            continue
+    return worst
+
+
+class LoopLagMonitor:
+    """Periodic timer on the running loop that records how late it fires."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL,
+                 report_seconds: float = LOOP_LAG_REPORT_SECONDS,
+                 stall_threshold: float = LOOP_STALL_THRESHOLD):
+        self._interval = interval
+        self._report_seconds = report_seconds
+        self._stall_threshold = stall_threshold
+        self._dir = loop_lag_dir()
+        self._path = os.path.join(self._dir, f"{os.getpid()}.lag")
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id = 0
+        self._heartbeat = time.monotonic()
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self.lag = LatencyHistogram(window=max(1, int(30 / interval)))
+
+    def start(self) -> None:
+        if self._interval <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+        if self._stall_threshold > 0 and (self._watchdog is None or not self._watchdog.is_alive()):
+            self._stopped.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch, name="nitara-loop-watchdog", daemon=True,
+            )
+            self._watchdog.start()
+
+    async def aclose(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_report = time.monotonic()
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self._heartbeat = time.monotonic()
+            self.lag.observe(max(0.0, time.perf_counter() - start - self._interval))
+            if time.monotonic() - last_report >= self._report_seconds:
+                last_report = time.monotonic()
+                p95 = self.lag.percentile(0.95)
+                get_metrics().set_gauge("event_loop_lag_p95_seconds", p95)
+                try:
+                    await loop.run_in_executor(None, self._write, p95)
+                except OSError as e:
+                    logger.debug(f"Failed to report loop lag: {e}")
+
+    def _watch(self) -> None:
+        """Watchdog thread: report each stall once, while it is happening."""
+        reported = None
+        while not self._stopped.wait(self._stall_threshold / 2):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self._interval
+            if stalled < self._stall_threshold or heartbeat == reported:
+                continue
+            reported = heartbeat
+            get_metrics().incr("event_loop_stalls")
+            logger.warning(f"Event loop stalled for {stalled * 1000:.0f}ms+ in {self._culprit()}")
+
+    def _culprit(self) -> str:
+        """The running task and the innermost frames of the loop thread."""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        where = "no task (a callback)"
+        if task is not None:
+            coro = task.get_coro()
+            where = f"task {task.get_name()} ({getattr(coro, '__qualname__', coro)})"
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return where
+        stack = traceback.extract_stack(frame)[-3:]
+        return where + " at " + " <- ".join(
+            f"{os.path.basename(f.filename)}:{f.lineno} {f.name}" for f in reversed(stack)
+        )
+
+    def _write(self, p95: float) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        tmp = f"{self._path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(f"{p95:.4f}")
+        os.replace(tmp, self._path)
+
+
+_monitor: LoopLagMonitor | None = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Return the process-wide loop lag monitor."""
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopLagMonitor()
+    return _monitor
@@ -0,0 +1,233 @@
+"""In-process latency histograms and counters for the voice pipeline.
+
+Every voice turn is timed from the end of user speech through transcription,
+the orchestrator round trip, first TTS audio and end of playback. Samples are
+kept per (stage, persona, channel, deep_mode) in bounded windows and reported
+as p50/p95/p99. A background task dumps a JSON snapshot per worker process.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+
+logger = logging.getLogger("nitara-voice-metrics")
+VOICE_METRICS_DIR = os.getenv("VOICE_METRICS_DIR", "/srv/focus-flow/07_system/logs/voice-metrics")
+VOICE_METRICS_DUMP_SECONDS = float(os.getenv("VOICE_METRICS_DUMP_SECONDS", "60"))
+VOICE_METRICS_WINDOW = int(os.getenv("VOICE_METRICS_WINDOW", "2048"))
+
+# Turn marks, in pipeline order. Each is recorded as seconds since end of user speech.
+TURN_MARKS = (
+    "transcript_final",
+    "orchestrator_sent",
+    "orchestrator_first_byte",
+    "orchestrator_parsed",
+    "first_audio",
+    "playback_end",
+)
+
+
+class LatencyHistogram:
+    """Sliding window of latency samples with percentile summaries."""
+
+    def __init__(self, window: int = VOICE_METRICS_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self) -> dict:
+        ordered = sorted(self._samples)
+        n = len(ordered)
+
+        def pick(q: float) -> float:
+            return round(ordered[min(n - 1, int(q * n))] * 1000, 1) if n else 0.0
+
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 1) if self.count else 0.0,
+            "p50_ms": pick(0.50),
+            "p95_ms": pick(0.95),
+            "p99_ms": pick(0.99),
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+def _label_key(labels: dict) -> str:
+    return ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+
+
+class VoiceMetrics:
+    """Process-wide registry of labelled histograms and counters."""
+
+    def __init__(self):
+        self._histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self._counters: dict[str, dict[str, float]] = {}
+        self._gauges: dict[str, dict[str, float]] = {}
+        self._dump_task: asyncio.Task | None = None
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        by_label = self._histograms.setdefault(name, {})
+        key = _label_key(labels)
+        if key not in by_label:
+            by_label[key] = LatencyHistogram()
+        by_label[key].observe(seconds)
+
+    def incr(self, name: str, amount: float = 1, **labels) -> None:
+        by_label = self._counters.setdefault(name, {})
+        key = _label_key(labels)
+        by_label[key] = by_label.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def histogram(self, name: str, **labels) -> LatencyHistogram | None:
+        return self._histograms.get(name, {}).get(_label_key(labels))
+
+    def snapshot(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "timestamp": time.time(),
+            "histograms": {
+                name: {key: h.summary() for key, h in by_label.items()}
+                for name, by_label in self._histograms.items()
+            },
+            "counters": {
+                name: {key: round(v, 3) for key, v in by_label.items()}
+                for name, by_label in self._counters.items()
+            },
+            "gauges": {
+                name: {key: round(v, 3) for key, v in by_label.items()}
+                for name, by_label in self._gauges.items()
+            },
+        }
+
+    def dump(self, path: str | None = None) -> str:
+        """Write a snapshot atomically; returns the file path."""
+        path = path or os.path.join(VOICE_METRICS_DIR, f"voice-metrics-{os.getpid()}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp, path)
+        return path
+
+    def start_periodic_dump(self, interval: float = VOICE_METRICS_DUMP_SECONDS) -> None:
+        if interval > 0 and (self._dump_task is None or self._dump_task.done()):
+            self._dump_task = asyncio.create_task(self._dump_loop(interval))
+
+    async def flush(self) -> None:
+        """Stop the periodic dump and write a final snapshot."""
+        if self._dump_task is not None:
+            self._dump_task.cancel()
+            self._dump_task = None
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.dump)
+        except Exception as e:
+            logger.warning(f"Failed to write voice metrics: {e}")
+
+    async def _dump_loop(self, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await loop.run_in_executor(None, self.dump)
+            except Exception as e:
+                logger.warning(f"Failed to write voice metrics: {e}")
+
+
+_metrics: VoiceMetrics | None = None
+
+
+def get_metrics() -> VoiceMetrics:
+    """Return the worker-wide metrics registry."""
+    global _metrics
+    if _metrics is None:
+        _metrics = VoiceMetrics()
+    return _metrics
+
+
+class TurnTracker:
+    """Times each turn of one voice session.
+
+    A turn starts at the end of user speech (VAD, or the STT final transcript
+    when VAD did not fire) and ends when the agent finishes speaking. Marks
+    are recorded as seconds since the start of the turn.
+    """
+
+    def __init__(self, persona: str, sip: bool, deep_mode: bool,
+                 metrics: VoiceMetrics | None = None):
+        self.labels = {
+            "persona": persona,
+            "channel": "sip" if sip else "web",
+            "deep_mode": str(bool(deep_mode)).lower(),
+        }
+        self._metrics = metrics or get_metrics()
+        self._turn_start: float | None = None
+        self._marks: dict[str, float] = {}
+
+    def start_turn(self, at: float | None = None) -> None:
+        self._turn_start = at if at is not None else time.perf_counter()
+        self._marks = {}
+
+    def mark(self, name: str, at: float | None = None) -> None:
+        """Record a stage once per turn; later repeats are ignored."""
+        if self._turn_start is None or name in self._marks:
+            return
+        at = at if at is not None else time.perf_counter()
+        self._marks[name] = at
+        self._metrics.observe(name, at - self._turn_start, **self.labels)
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration measured elsewhere with this session's labels."""
+        self._metrics.observe(name, seconds, **self.labels)
+
+    def end_turn(self) -> None:
+        self.mark("playback_end")
+        self._turn_start = None
+
+    def attach(self, session) -> None:
+        """Subscribe to AgentSession events that bound each stage."""
+
+        @session.on("user_state_changed")
+        def _on_user_state(ev):
+            if ev.old_state == "speaking" and ev.new_state != "speaking":
+                self.start_turn()
+
+        @session.on("user_input_transcribed")
+        def _on_transcript(ev):
+            if not ev.is_final:
+                return
+            if self._turn_start is None:
+                self.start_turn()
+            self.mark("transcript_final")
+
+        @session.on("agent_state_changed")
+        def _on_agent_state(ev):
+            if ev.new_state == "speaking":
+                self.mark("first_audio")
+            elif ev.old_state == "speaking":
+                self.end_turn()
+
+        @session.on("metrics_collected")
+        def _on_metrics(ev):
+            m = ev.metrics
+            if getattr(m, "type", "") == "eou_metrics":
+                self.observe("eou_delay", m.end_of_utterance_delay)
+                self.observe("stt_transcription_delay", m.transcription_delay)
+            elif getattr(m, "type", "") == "tts_metrics" and m.ttfb >= 0:
+                self.observe("tts_ttfb", m.ttfb)
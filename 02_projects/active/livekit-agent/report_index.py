@@ -0,0 +1,198 @@
+"""In-process index of the latest report per type.
+
+``read_latest_report`` used to glob and sort all of ``REPORTS_DIR`` and
+``json.load`` the newest match on every call. ``ReportIndex`` keeps the
+newest file of each report type with its voice summary already extracted,
+so a lookup is a dict access. The index is brought up to date by polling
+the directory mtime: a full listing happens only when files are added or
+removed, and only the newest file of a type is ever parsed.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+
+from file_io import run_file_io
+
+logger = logging.getLogger("nitara-voice-reports")
+REPORT_INDEX_POLL_SECONDS = float(os.getenv("REPORT_INDEX_POLL_SECONDS", "10"))
+
+# <report-type>-YYYY-MM-DD[...].json
+_DATED_NAME = re.compile(r"^(?P<type>.+?)-(?P<date>\d{4}-\d{2}-\d{2})")
+
+
+def report_type_of(filename: str) -> tuple[str, str]:
+    """Split a report filename into (report type, date); date may be empty."""
+    stem = filename.removesuffix(".json")
+    match = _DATED_NAME.match(stem)
+    return (match["type"], match["date"]) if match else (stem, "")
+
+
+def summarize_report(report_type: str, report: dict, file_date: str = "") -> str:
+    """The spoken summary of a report: date, summary or notes, status, score."""
+    date = report.get("date") or file_date or "unknown date"
+    parts = [f"Latest {report_type} report from {date}."]
+
+    if "summary" in report:
+        parts.append(str(report["summary"]))
+    elif "notes" in report:
+        parts.append(str(report["notes"]))
+
+    status = report.get("status", "")
+    if status:
+        parts.append(f"Status: {status}.")
+
+    score = report.get("satisfaction_score")
+    if isinstance(score, (int, float)):
+        parts.append(f"Quality score: {score:.1%}.")
+
+    return " ".join(parts)
+
+
+class ReportEntry:
+    """The newest report of one type and its pre-extracted summary."""
+
+    __slots__ = ("filename", "mtime_ns", "summary")
+
+    def __init__(self, filename: str, mtime_ns: int, summary: str):
+        self.filename = filename
+        self.mtime_ns = mtime_ns
+        self.summary = summary
+
+
+class ReportIndex:
+    """Newest report per type, refreshed incrementally from directory mtimes."""
+
+    def __init__(self, reports_dir: str, poll_seconds: float = REPORT_INDEX_POLL_SECONDS):
+        self._reports_dir = reports_dir
+        self._poll_seconds = poll_seconds
+        self._entries: dict[str, ReportEntry] = {}
+        self._dir_mtime_ns: int | None = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._poll_task: asyncio.Task | None = None
+        self._listeners: list = []
+
+    def lookup(self, report_type: str) -> str | None:
+        """Summary of the newest ``report_type`` report, without disk I/O.
+
+        An exact type match is a dict lookup; otherwise ``report_type`` is
+        treated as a prefix, as the old filename glob did. ``None`` means no
+        report matches.
+        """
+        entry = self._entries.get(report_type)
+        if entry is None:
+            matches = [e for t, e in self._entries.items() if t.startswith(report_type)]
+            entry = max(matches, key=lambda e: e.filename, default=None)
+        return entry.summary if entry else None
+
+    def entry(self, report_type: str) -> ReportEntry | None:
+        """The indexed newest file of exactly ``report_type``, if any."""
+        return self._entries.get(report_type)
+
+    async def get(self, report_type: str) -> str | None:
+        """``lookup``, loading the index first if nothing has filled it yet."""
+        if not self._loaded:
+            await run_file_io(self.refresh)
+        return self.lookup(report_type)
+
+    def refresh(self) -> bool:
+        """Bring the index up to date; returns True when an entry changed.
+
+        Blocking: call from ``prewarm`` or an executor.
+        """
+        with self._lock:
+            try:
+                dir_mtime = os.stat(self._reports_dir).st_mtime_ns
+            except FileNotFoundError:
+                changed = bool(self._entries)
+                self._entries = {}
+                self._loaded = True
+                return changed
+
+            if dir_mtime == self._dir_mtime_ns:
+                # Nothing added or removed; only check indexed files for rewrites
+                newest = {t: e.filename for t, e in self._entries.items()}
+            else:
+                newest = self._scan()
+
+            entries = {}
+            for report_type, filename in newest.items():
+                try:
+                    mtime = os.stat(os.path.join(self._reports_dir, filename)).st_mtime_ns
+                except FileNotFoundError:
+                    continue  # removed since the scan; the dir mtime changed too
+                current = self._entries.get(report_type)
+                if current and current.filename == filename and current.mtime_ns == mtime:
+                    entries[report_type] = current
+                else:
+                    entries[report_type] = self._load(report_type, filename, mtime, current)
+
+            changed = entries != self._entries
+            self._entries = entries
+            self._dir_mtime_ns = dir_mtime
+            self._loaded = True
+            return changed
+
+    def add_listener(self, callback) -> None:
+        """Await ``callback()`` on the poll loop after each refresh that changed an entry."""
+        self._listeners.append(callback)
+
+    def start(self) -> None:
+        """Start polling the reports directory on the running loop."""
+        if self._poll_seconds > 0 and (self._poll_task is None or self._poll_task.done()):
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def aclose(self) -> None:
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            await asyncio.gather(self._poll_task, return_exceptions=True)
+            self._poll_task = None
+
+    def _scan(self) -> dict[str, str]:
+        """Newest filename per report type; names sort by date within a type."""
+        newest: dict[str, str] = {}
+        with os.scandir(self._reports_dir) as it:
+            for dirent in it:
+                name = dirent.name
+                if not name.endswith(".json") or not dirent.is_file():
+                    continue
+                report_type, _ = report_type_of(name)
+                if name > newest.get(report_type, ""):
+                    newest[report_type] = name
+        return newest
+
+    def _load(self, report_type: str, filename: str, mtime_ns: int,
+              current: ReportEntry | None) -> ReportEntry:
+        try:
+            with open(os.path.join(self._reports_dir, filename), "r") as f:
+                report = json.load(f)
+            if not isinstance(report, dict):
+                raise ValueError("report is not a JSON object")
+        except Exception as e:
+            # Often a report still being written: keep serving the previous
+            # summary; the file is re-read once its mtime moves again
+            logger.warning(f"Failed to index report {filename}: {e}")
+            summary = current.summary if current else f"Error reading report: {e}"
+            return ReportEntry(filename, mtime_ns, summary)
+        _, file_date = report_type_of(filename)
+        return ReportEntry(filename, mtime_ns, summarize_report(report_type, report, file_date))
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_seconds)
+            try:
+                if not await run_file_io(self.refresh):
+                    continue
+                logger.info(f"Report index updated: {len(self._entries)} report types")
+            except Exception as e:
+                logger.warning(f"Report index refresh failed: {e}")
+                continue
+            for callback in self._listeners:
+                try:
+                    await callback()
+                except Exception as e:
+                    logger.warning(f"Report index listener failed: {e}")
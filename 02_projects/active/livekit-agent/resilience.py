@@ -0,0 +1,130 @@
+"""Circuit breaker and hedging policy for the orchestrator backend.
+
+``CircuitBreaker`` tracks rolling latency and error rate for one backend.
+It opens after consecutive failures, or after a high error rate over a
+window of recent requests. While open, turns fail fast (or go straight to
+the secondary LLM) instead of each paying the full failure cost. After
+``reset_seconds`` a single probe is let through (half-open); its outcome
+closes or re-opens the breaker.
+
+The breaker also tracks how long the primary takes to produce its first
+output, and that sets the hedge delay: a turn that has produced nothing by
+the p95 time to first output is raced against the secondary LLM. Full
+request time would be the wrong yardstick, since it includes the streamed
+body.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+
+from metrics import LatencyHistogram, get_metrics
+
+logger = logging.getLogger("nitara-voice-resilience")
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_ERROR_RATE = float(os.getenv("BREAKER_ERROR_RATE", "0.5"))
+BREAKER_WINDOW = int(os.getenv("BREAKER_WINDOW", "20"))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "30"))
+# Hedge delay before there are enough first-output samples for a p95, and its floor
+HEDGE_DEFAULT_DELAY = float(os.getenv("HEDGE_DEFAULT_DELAY", "4"))
+HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "1.5"))
+HEDGE_MIN_SAMPLES = 20
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+_STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend whose breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker with rolling latency and error rate."""
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 error_rate: float = BREAKER_ERROR_RATE, window: int = BREAKER_WINDOW,
+                 reset_seconds: float = BREAKER_RESET_SECONDS):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._error_rate = error_rate
+        self._reset_seconds = reset_seconds
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.latency = LatencyHistogram(window=256)
+        self.first_output = LatencyHistogram(window=256)
+        self.state = CLOSED
+        self._publish()
+
+    def allow(self) -> bool:
+        """Whether a request may go to the backend now."""
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self._reset_seconds:
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+        return self.state == CLOSED
+
+    def record_success(self, seconds: float) -> None:
+        self.latency.observe(seconds)
+        self._outcomes.append(True)
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+        if self.state != CLOSED:
+            # Start the error-rate window afresh after recovering
+            self._outcomes.clear()
+            self._outcomes.append(True)
+            self._transition(CLOSED)
+        self._publish()
+
+    def record_failure(self) -> None:
+        self._outcomes.append(False)
+        self._consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN or self._should_trip():
+            self._opened_at = time.monotonic()
+            self._transition(OPEN)
+        self._publish()
+
+    def record_first_output(self, seconds: float) -> None:
+        """Time from sending a hedgeable request to its first spoken output."""
+        self.first_output.observe(seconds)
+
+    def release(self) -> None:
+        """Forget an abandoned request (barge-in) without judging the backend."""
+        self._probe_in_flight = False
+
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on the primary before starting a hedge."""
+        if self.first_output.count < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        return max(HEDGE_MIN_DELAY, self.first_output.percentile(0.95))
+
+    def _should_trip(self) -> bool:
+        if self.state != CLOSED:
+            return False
+        if self._consecutive_failures >= self._failure_threshold:
+            return True
+        return (len(self._outcomes) == self._outcomes.maxlen
+                and self.error_rate() >= self._error_rate)
+
+    def _transition(self, state: str) -> None:
+        logger.warning(f"Circuit breaker {self.name}: {self.state} -> {state} "
+                       f"(error rate {self.error_rate():.0%})")
+        self.state = state
+        get_metrics().incr("breaker_transitions", breaker=self.name, state=state)
+
+    def _publish(self) -> None:
+        voice_metrics = get_metrics()
+        voice_metrics.set_gauge("breaker_state", _STATE_GAUGE[self.state], breaker=self.name)
+        voice_metrics.set_gauge("breaker_error_rate", self.error_rate(), breaker=self.name)
+        voice_metrics.set_gauge("breaker_p95_seconds", self.latency.percentile(0.95), breaker=self.name)
@@ -0,0 +1,79 @@
+"""Start/end-of-speech decisions from per-window speech probabilities.
+
+The same rules ``silero.VAD`` applies to its model output, kept free of
+audio and model code so ``batched_vad`` streams can share them and tests
+can drive them with fixed probabilities:
+
+- Raw probabilities go through an exponential filter first, so a single
+  noisy window doesn't flip the decision.
+- Speech starts once the smoothed probability has stayed at or above
+  ``activation_threshold`` for ``min_speech_duration``.
+- Once speaking, a window still counts as speech while the smoothed
+  probability is above ``deactivation_threshold`` (0.15 below the
+  activation threshold). Speech ends after ``min_silence_duration`` below
+  it, so soft syllables and trailing words don't cut a turn short.
+"""
+
+# Weight of the previous smoothed value, as in the Silero plugin
+SMOOTHING = 0.35
+DEACTIVATION_OFFSET = 0.15
+
+START_OF_SPEECH = "start_of_speech"
+END_OF_SPEECH = "end_of_speech"
+
+
+class SpeechActivity:
+    """Speech state of one stream, advanced one window at a time.
+
+    After each ``update``, ``speech_seconds`` is the length of the current
+    (or just ended) speech and ``silence_seconds`` the silence so far.
+    """
+
+    def __init__(self, *, activation_threshold: float, min_speech_duration: float,
+                 min_silence_duration: float, window_seconds: float, smoothing: float = SMOOTHING):
+        self.activation_threshold = activation_threshold
+        self.deactivation_threshold = max(activation_threshold - DEACTIVATION_OFFSET, 0.01)
+        self._min_speech = min_speech_duration
+        self._min_silence = min_silence_duration
+        self._window = window_seconds
+        self._smoothing = smoothing
+        self.probability: float | None = None
+        self.speaking = False
+        self.speech_seconds = 0.0
+        self.silence_seconds = 0.0
+        # Runs above/below threshold that decide the start and end of speech
+        self._above_seconds = 0.0
+        self._below_seconds = 0.0
+
+    def update(self, raw_probability: float) -> str | None:
+        """Advance one window; returns START_OF_SPEECH, END_OF_SPEECH or None."""
+        if self.probability is None:
+            self.probability = raw_probability
+        else:
+            self.probability = self._smoothing * self.probability + (1 - self._smoothing) * raw_probability
+        p = self.probability
+
+        if p >= self.activation_threshold or (self.speaking and p > self.deactivation_threshold):
+            self._above_seconds += self._window
+            self._below_seconds = 0.0
+        else:
+            self._below_seconds += self._window
+            self._above_seconds = 0.0
+
+        if self.speaking:
+            self.speech_seconds += self._window
+            self.silence_seconds = self._below_seconds
+        else:
+            self.speech_seconds = 0.0
+            self.silence_seconds += self._window
+
+        if not self.speaking and self._above_seconds >= self._min_speech:
+            self.speaking = True
+            self.speech_seconds = self._above_seconds
+            self.silence_seconds = 0.0
+            return START_OF_SPEECH
+        if self.speaking and self._below_seconds >= self._min_silence:
+            self.speaking = False
+            self.silence_seconds = self._below_seconds
+            return END_OF_SPEECH
+        return None
@@ -0,0 +1,175 @@
+"""Per-process pool of ready STT and TTS clients.
+
+Every persona used to construct fresh ``inference.STT`` / ``inference.TTS``
+clients, and ``build_stt`` a fresh Deepgram client, so each call paid client
+construction plus websocket/TLS setup before the first word. The pool keeps
+clients keyed by (kind, model, voice id, keyterm hash). ``acquire`` hands
+out an idle client and warms its connection. Hits, misses and the
+construction time saved by hits are reported through ``metrics``.
+
+LiveKit runs each job in its own process, so the pool never carries a
+client from one session to the next. It pays off within one job: clients
+built in ``prewarm`` are ready before the call arrives, and clients a
+persona gives back when it is rebuilt for the participant's metadata are
+taken by the new persona. When the session ends, its clients are closed.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Callable
+
+from metrics import get_metrics
+
+logger = logging.getLogger("nitara-voice-speech-pool")
+SPEECH_POOL_ENABLED = os.getenv("SPEECH_POOL_ENABLED", "true").lower() != "false"
+# Idle clients kept per key, and how long an idle client is kept
+SPEECH_POOL_MAX_IDLE = int(os.getenv("SPEECH_POOL_MAX_IDLE", "2"))
+SPEECH_POOL_IDLE_SECONDS = float(os.getenv("SPEECH_POOL_IDLE_SECONDS", "600"))
+
+
+class SpeechClientPool:
+    """Idle STT/TTS clients by key, checked out and returned within one job."""
+
+    def __init__(self, max_idle: int = SPEECH_POOL_MAX_IDLE,
+                 idle_seconds: float = SPEECH_POOL_IDLE_SECONDS):
+        self._max_idle = max_idle
+        self._idle_seconds = idle_seconds
+        self._idle: dict[tuple, list[tuple[object, float]]] = {}
+        self._checked_out: dict[int, tuple[tuple, object]] = {}
+        self._build_seconds: dict[tuple, float] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def fill(self, key: tuple, factory: Callable[[], object]) -> None:
+        """Build an idle client for ``key`` ahead of the first job. Blocking."""
+        if not SPEECH_POOL_ENABLED or self._idle.get(key):
+            return
+        client = self._build(key, factory)
+        if client is not None:
+            self._idle.setdefault(key, []).append((client, time.monotonic()))
+
+    def acquire(self, key: tuple, factory: Callable[[], object]):
+        """An idle client for ``key``, or a new one from ``factory()``.
+
+        ``key`` starts with the client kind ("stt" or "tts"). Factory
+        exceptions propagate, as they would without the pool.
+        """
+        if not SPEECH_POOL_ENABLED:
+            return factory()
+        self._expire_idle()
+        idle = self._idle.get(key)
+        if idle:
+            client, _ = idle.pop()
+            self._hits += 1
+            voice_metrics = get_metrics()
+            voice_metrics.incr("speech_pool_hits", kind=key[0])
+            voice_metrics.incr("speech_pool_setup_saved_seconds",
+                               self._build_seconds.get(key, 0.0), kind=key[0])
+        else:
+            self._misses += 1
+            get_metrics().incr("speech_pool_misses", kind=key[0])
+            client = self._build(key, factory, raise_errors=True)
+        self._checked_out[id(client)] = (key, client)
+        self._publish()
+        _prewarm_connection(client)
+        return client
+
+    def release(self, client) -> None:
+        """Return a client taken with ``acquire``; others are ignored."""
+        if client is None:
+            return
+        checked_out = self._checked_out.pop(id(client), None)
+        if checked_out is None:
+            return
+        key, _ = checked_out
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self._max_idle:
+            idle.append((client, time.monotonic()))
+        else:
+            _close_later(client)
+        self._publish()
+
+    def stats(self) -> dict:
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            "idle": sum(len(v) for v in self._idle.values()),
+            "checked_out": len(self._checked_out),
+        }
+
+    async def aclose(self) -> None:
+        idle, self._idle = self._idle, {}
+        for clients in idle.values():
+            for client, _ in clients:
+                await _close(client)
+
+    def _build(self, key: tuple, factory: Callable[[], object], raise_errors: bool = False):
+        start = time.perf_counter()
+        try:
+            client = factory()
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.warning(f"Failed to build pooled {key[0]} client {key[1:]}: {e}")
+            return None
+        seconds = time.perf_counter() - start
+        previous = self._build_seconds.get(key)
+        # Smoothed, so one slow cold build does not dominate "saved" time
+        self._build_seconds[key] = seconds if previous is None else 0.8 * previous + 0.2 * seconds
+        get_metrics().observe("speech_client_build", seconds, kind=key[0])
+        return client
+
+    def _expire_idle(self) -> None:
+        cutoff = time.monotonic() - self._idle_seconds
+        for key, clients in self._idle.items():
+            stale = [c for c, since in clients if since < cutoff]
+            if stale:
+                self._idle[key] = [(c, since) for c, since in clients if since >= cutoff]
+                for client in stale:
+                    _close_later(client)
+
+    def _publish(self) -> None:
+        stats = self.stats()
+        voice_metrics = get_metrics()
+        voice_metrics.set_gauge("speech_pool_hit_rate", stats["hit_rate"])
+        voice_metrics.set_gauge("speech_pool_idle", stats["idle"])
+
+
+def _prewarm_connection(client) -> None:
+    """Open the client's provider connection now rather than on first use."""
+    prewarm = getattr(client, "prewarm", None)
+    if prewarm is None:
+        return
+    try:
+        prewarm()
+    except Exception as e:
+        logger.debug(f"Connection prewarm failed: {e}")
+
+
+async def _close(client) -> None:
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.warning(f"Failed to close pooled speech client: {e}")
+
+
+def _close_later(client) -> None:
+    try:
+        asyncio.get_running_loop().create_task(_close(client))
+    except RuntimeError:
+        pass  # no loop (prewarm); the process owns it until exit
+
+
+_speech_pool: SpeechClientPool | None = None
+
+
+def get_speech_pool() -> SpeechClientPool:
+    """Return this job process's speech client pool."""
+    global _speech_pool
+    if _speech_pool is None:
+        _speech_pool = SpeechClientPool()
+    return _speech_pool
@@ -0,0 +1,225 @@
+"""Speakable text: sentence chunking and markdown clean-up before TTS.
+
+LLM replies can contain markdown, links and code that the voice prompts ask
+the model to avoid but it sometimes produces anyway. ``SpeechChunker`` turns
+a reply — whole or as streamed deltas — into normalised sentences, so each
+one can be sent to TTS as its own chunk and synthesis of the first sentence
+starts while the rest is still arriving.
+"""
+
+import re
+
+CODE_PLACEHOLDER = "I've put the code in the chat thread."
+
+_FENCE = "```"
+_ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "inc",
+    "ltd", "co", "corp", "e.g", "i.e", "approx", "no", "nr", "ca", "min", "max",
+}
+
+_MD_LINK = re.compile(r"!?\[([^\]]*)\]\((?:[^()\s]|\([^)]*\))+\)")
+# A URL never ends in punctuation: that belongs to the sentence around it
+_URL = re.compile(r"\b(?:https?://|www\.)[^\s]*[^\s.,;:!?'\")\]]", re.IGNORECASE)
+# A dotted token with a path or a TLD-like last label, e.g. "example.com/docs"
+_BARE_DOMAIN = re.compile(r"[\w-]+(?:\.[\w-]+)*\.[a-z]{2,}(?:/\S*)?", re.IGNORECASE)
+_URL_PREFIX = re.compile(r"^(?:https?://)?(?:www\.)?", re.IGNORECASE)
+_INLINE_CODE = re.compile(r"`([^`]*)`")
+_EMPHASIS = re.compile(r"(\*\*|\*|~~)(?=\S)(.+?)(?<=\S)\1")
+# Underscores only mark emphasis at word edges, not inside snake_case names
+_UNDERSCORE_EMPHASIS = re.compile(r"(?<!\w)(__|_)(?=\S)(.+?)(?<=\S)\1(?!\w)")
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s*", re.MULTILINE)
+_LIST_MARKER = re.compile(r"^\s*(?:[-*+•]|\d{1,3}[.)])\s+", re.MULTILINE)
+_BLOCKQUOTE = re.compile(r"^\s*>\s?", re.MULTILINE)
+_TABLE_RULE = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$", re.MULTILINE)
+_HTML_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_WHITESPACE = re.compile(r"[ \t]+")
+# Sentence end: terminal punctuation (plus closing quotes/brackets) then
+# whitespace, or a line break (list items, headings)
+_SENTENCE_END = re.compile(r"([.!?…]+[\"')\]]*)(\s+)|()(\n\s*)")
+_TERMINAL = ".!?…"
+
+
+def normalize_for_speech(text: str) -> str:
+    """Strip or rewrite markdown, URLs and inline code into speakable text."""
+    if not text:
+        return ""
+    text = _MD_LINK.sub(lambda m: m.group(1), text)
+    text = _URL.sub(lambda m: f"a link on {_URL_PREFIX.sub('', m.group(0)).split('/')[0]}", text)
+    text = _INLINE_CODE.sub(lambda m: m.group(1), text)
+    text = _TABLE_RULE.sub("", text)
+    text = _HEADING.sub("", text)
+    text = _BLOCKQUOTE.sub("", text)
+    text = _LIST_MARKER.sub("", text)
+    text = _EMPHASIS.sub(lambda m: m.group(2), text)
+    text = _UNDERSCORE_EMPHASIS.sub(lambda m: m.group(2), text)
+    text = _HTML_TAG.sub("", text)
+    text = text.replace("|", ", ")
+
+    # Line breaks become sentence breaks so list items are read as sentences
+    lines = [line.strip() for line in text.splitlines()]
+    parts = []
+    for line in lines:
+        if not line:
+            continue
+        if parts and parts[-1][-1] not in ".!?…:;,":
+            parts[-1] += "."
+        parts.append(line)
+    return _WHITESPACE.sub(" ", " ".join(parts)).strip()
+
+
+def _is_abbreviation(segment: str) -> bool:
+    """True when the period ending ``segment`` belongs to an abbreviation."""
+    words = segment.split()
+    if not words:
+        return False
+    word = words[-1].rstrip(".").lower()
+    if len(words) == 1 and word.isdigit():
+        return True  # numbered list marker, "1. Build next"
+    if _URL.fullmatch(word) or _BARE_DOMAIN.fullmatch(word) or ("/" in word and "." in word):
+        return False  # "see example.com/docs." ends the sentence
+    return word in _ABBREVIATIONS or "." in word or (len(word) == 1 and word.isalpha())
+
+
+def _trailing_backticks(text: str) -> str:
+    """A trailing run of backticks that could be the start of a code fence."""
+    run = len(text) - len(text.rstrip("`"))
+    return text[len(text) - run:] if 0 < run < len(_FENCE) else ""
+
+
+def split_sentences(text: str) -> tuple[list[str], str]:
+    """Split complete sentences off ``text``; returns (sentences, remainder)."""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        if match.group(1) is None:
+            end = match.start()
+        else:
+            end = match.end(1)
+            if text[end - 1] == "." and _is_abbreviation(text[start:end]):
+                continue
+        sentence = text[start:end].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    return sentences, text[start:]
+
+
+class SpeechChunker:
+    """Incrementally turns LLM text into normalised, speakable sentences.
+
+    ``push`` accepts deltas of any size and returns the sentences completed so
+    far; ``flush`` returns whatever is left at the end of the reply. Fenced
+    code blocks are dropped and announced once with ``CODE_PLACEHOLDER``.
+    Sentences shorter than ``min_chars`` are merged with the next one, except
+    the first, which is released as early as possible.
+    """
+
+    def __init__(self, min_chars: int = 24):
+        self._min_chars = min_chars
+        self._buffer = ""
+        self._fence_carry = ""
+        self._pending = ""
+        self._in_code = False
+        self._announced_code = False
+        self._emitted = 0
+
+    def push(self, delta: str) -> list[str]:
+        if not delta:
+            return []
+        # _strip_code may release text before a fence into the buffer itself
+        stripped = self._strip_code(delta)
+        self._buffer += stripped
+        sentences, self._buffer = split_sentences(self._buffer)
+        return self._release(sentences)
+
+    def flush(self) -> list[str]:
+        tail = self._buffer + ("" if self._in_code else self._fence_carry)
+        self._buffer = self._fence_carry = ""
+        sentences, rest = split_sentences(tail + " ")
+        out = self._release(sentences + ([rest] if rest.strip() else []))
+        if self._pending:
+            out.append(self._pending)
+            self._pending = ""
+        return out
+
+    def _strip_code(self, delta: str) -> str:
+        """Return the part of ``delta`` outside fenced code blocks."""
+        text = self._fence_carry + delta
+        self._fence_carry = ""
+        kept = []
+        while text:
+            if self._in_code:
+                end = text.find(_FENCE)
+                if end < 0:
+                    self._fence_carry = _trailing_backticks(text)
+                    break
+                text = text[end + len(_FENCE):]
+                self._in_code = False
+                continue
+
+            start = text.find(_FENCE)
+            if start < 0:
+                self._fence_carry = _trailing_backticks(text)
+                kept.append(text[:len(text) - len(self._fence_carry)])
+                break
+            # End the text before the fence as a sentence so it is released
+            self._buffer = (self._buffer + "".join(kept) + text[:start]).rstrip()
+            kept = []
+            if self._buffer and self._buffer[-1] not in _TERMINAL + ":":
+                self._buffer += "."
+            kept.append(" ")
+            if not self._announced_code:
+                kept.append(f"{CODE_PLACEHOLDER} ")
+                self._announced_code = True
+            text = text[start + len(_FENCE):]
+            self._in_code = True
+        return "".join(kept)
+
+    def _release(self, sentences: list[str]) -> list[str]:
+        out = []
+        for raw in sentences:
+            sentence = normalize_for_speech(raw)
+            if not sentence:
+                continue
+            if sentence[-1] not in _TERMINAL:
+                sentence += "."
+            if self._pending:
+                sentence = f"{self._pending} {sentence}"
+                self._pending = ""
+            if self._emitted and len(sentence) < self._min_chars:
+                self._pending = sentence
+                continue
+            out.append(sentence)
+            self._emitted += 1
+        return out
+
+
+def speakable_sentences(text: str) -> list[str]:
+    """Chunk a complete reply into normalised sentences."""
+    chunker = SpeechChunker()
+    return chunker.push(text) + chunker.flush()
+
+
+async def speakable_llm_stream(chunks):
+    """Re-chunk an ``llm_node`` stream into normalised sentences.
+
+    Text (plain strings or chunks with ``delta.content``) is buffered through
+    a ``SpeechChunker``; chunks carrying tool calls pass through untouched.
+    """
+    chunker = SpeechChunker()
+    first = True
+    async for chunk in chunks:
+        if isinstance(chunk, str):
+            text = chunk
+        else:
+            delta = getattr(chunk, "delta", None)
+            if delta is None or getattr(delta, "tool_calls", None) or not delta.content:
+                yield chunk
+                continue
+            text = delta.content
+        for sentence in chunker.push(text):
+            yield sentence if first else f" {sentence}"
+            first = False
+    for sentence in chunker.flush():
+        yield sentence if first else f" {sentence}"
+        first = False
@@ -0,0 +1,157 @@
+"""Per-session watcher for tasks enqueued during a voice call.
+
+Instead of the founder asking "is it done yet?" (another LLM turn and
+backend call), each session keeps one polling loop that fetches
+``/api/queue/tasks/<id>`` for each task it enqueued and is still waiting
+on; the loop ends when none are left. Status changes are published on the
+``nitara.tasks`` data-channel topic, and completion can be announced by the
+agent. ``check_task_status`` serves per-task lookups from the watcher's cache.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Awaitable, Callable
+
+import aiohttp
+
+from backend_client import get_backend_client
+
+logger = logging.getLogger("nitara-voice-tasks")
+TASK_WATCH_SECONDS = float(os.getenv("TASK_WATCH_SECONDS", "5"))
+TASK_ANNOUNCE = os.getenv("TASK_ANNOUNCE", "true").lower() != "false"
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def describe_task(task: dict) -> str:
+    """One spoken sentence or two about a task's status."""
+    text = f"Task {task.get('id', 'unknown')} ({task.get('skill', 'unknown skill')}) is {task.get('status', 'unknown')}."
+    if task.get("status") == "failed" and task.get("error"):
+        text += f" Error: {task['error']}."
+    elif task.get("completed_at"):
+        text += f" Finished at {task['completed_at']}."
+    if task.get("result"):
+        text += f" Result: {task['result']}"
+    return text
+
+
+class TaskWatcher:
+    """Tracks this session's tasks with a single poll loop over their ids."""
+
+    def __init__(self, backend_url: str, headers: Callable[[], dict], room=None,
+                 announce: Callable[[dict], Awaitable[None]] | None = None,
+                 interval: float = TASK_WATCH_SECONDS):
+        self._backend_url = backend_url
+        self._headers = headers
+        self._room = room
+        self._announce = announce if TASK_ANNOUNCE else None
+        self._interval = interval
+        self._watched: set[str] = set()
+        self._tasks: dict[str, dict] = {}
+        self._poll_task: asyncio.Task | None = None
+        self._local_tasks: set[asyncio.Task] = set()
+
+    def watch(self, task_id: str, skill: str = "") -> None:
+        """Follow ``task_id`` until it completes or fails."""
+        self._tasks.setdefault(task_id, {"id": task_id, "skill": skill, "status": "queued"})
+        self._watched.add(task_id)
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    def track(self, task_id: str, skill: str, work: Awaitable[dict]) -> None:
+        """Follow in-process background work as if it were a queued task.
+
+        ``work`` resolves to extra fields for the finished task (such as
+        ``result``); status changes are published and announced like queue
+        tasks, and ``status`` answers for it.
+        """
+        task = {"id": task_id, "skill": skill, "status": "running"}
+        self._tasks[task_id] = task
+        local = asyncio.create_task(self._run_local(task, work))
+        self._local_tasks.add(local)
+        local.add_done_callback(self._local_tasks.discard)
+
+    def status(self, task_id: str) -> dict | None:
+        """Last known state of a task enqueued in this session."""
+        return self._tasks.get(task_id)
+
+    async def aclose(self) -> None:
+        self._watched.clear()
+        for local in list(self._local_tasks):
+            local.cancel()
+        await asyncio.gather(*self._local_tasks, return_exceptions=True)
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            await asyncio.gather(self._poll_task, return_exceptions=True)
+            self._poll_task = None
+
+    async def _poll_loop(self) -> None:
+        while self._watched:
+            await asyncio.sleep(self._interval)
+            watched = list(self._watched)
+            results = await asyncio.gather(*(self._fetch_task(t) for t in watched), return_exceptions=True)
+            for task_id, task in zip(watched, results):
+                if isinstance(task, Exception):
+                    logger.warning(f"Task watch poll for {task_id} failed: {task}")
+                elif task_id in self._watched:
+                    await self._observe({**task, "id": task_id})
+
+    async def _run_local(self, task: dict, work: Awaitable[dict]) -> None:
+        await self._publish(task)
+        try:
+            finished = {**task, "status": "completed", **await work}
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Background task {task['id']} failed: {e}")
+            finished = {**task, "status": "failed", "error": str(e)}
+        finished["completed_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        await self._observe(finished)
+
+    async def _fetch_task(self, task_id: str) -> dict:
+        async with get_backend_client().get(
+            f"{self._backend_url}/api/queue/tasks/{task_id}", headers=self._headers(),
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            if resp.status != 200:
+                raise Exception(f"HTTP {resp.status}")
+            return await resp.json()
+
+    async def _observe(self, task: dict) -> None:
+        task_id = task["id"]
+        previous = self._tasks.get(task_id, {})
+        self._tasks[task_id] = task
+        if previous.get("status") == task.get("status"):
+            return
+
+        logger.info(f"Task {task_id} ({task.get('skill')}): {previous.get('status')} -> {task.get('status')}")
+        await self._publish(task)
+        if task.get("status") in TERMINAL_STATUSES:
+            self._watched.discard(task_id)
+            if self._announce is not None:
+                try:
+                    await self._announce(task)
+                except Exception as e:
+                    logger.warning(f"Failed to announce task {task_id}: {e}")
+
+    async def _publish(self, task: dict) -> None:
+        """Forward a status change to the frontend via data channel."""
+        if not self._room:
+            return
+        try:
+            msg = json.dumps({
+                "type": "task_status",
+                "task_id": task["id"],
+                "skill": task.get("skill", ""),
+                "status": task.get("status", ""),
+                "error": task.get("error"),
+                "result_file": task.get("result_file"),
+                "completed_at": task.get("completed_at"),
+                "result": task.get("result"),
+            })
+            await self._room.local_participant.publish_data(msg, reliable=True, topic="nitara.tasks")
+        except Exception as e:
+            logger.warning(f"Failed to publish task status: {e}")
@@ -0,0 +1,41 @@
+import pytest
+
+llm = pytest.importorskip("livekit.agents.llm")
+
+from chat_context import ContextWindow, RollingSummaryContext, item_tokens  # noqa: E402
+
+
+def chat(*messages: tuple[str, str]) -> "llm.ChatContext":
+    ctx = llm.ChatContext.empty()
+    for role, text in messages:
+        ctx.add_message(role=role, content=text)
+    return ctx
+
+
+def total_tokens(ctx) -> int:
+    return sum(item_tokens(i) for i in ctx.items)
+
+
+def test_window_keeps_recent_items_within_budget():
+    ctx = chat(("system", "Be brief."), *[("user", f"message {i} " * 20) for i in range(30)])
+    compacted = ContextWindow("test", max_items=12, token_budget=400).compact(ctx)
+    assert total_tokens(compacted) <= 400
+    assert compacted.items[0].text_content == "Be brief."
+    assert compacted.items[-1].text_content == ctx.items[-1].text_content
+
+
+def test_single_oversized_message_is_truncated_to_budget():
+    ctx = chat(("system", "Be brief."), ("user", "word " * 2000))
+    compacted = ContextWindow("test", token_budget=300).compact(ctx)
+    assert total_tokens(compacted) <= 300
+    last = compacted.items[-1]
+    assert last.role == "user" and last.id == ctx.items[-1].id
+    assert last.text_content.startswith("word word")
+
+
+def test_oversized_message_is_dropped_when_no_room_is_left():
+    ctx = chat(("system", "Be brief."), ("user", "word " * 2000))
+    policy = RollingSummaryContext("test", seed="Founder runs a bakery.", token_budget=560, summary_tokens=500)
+    compacted = policy.compact(ctx)
+    assert total_tokens(compacted) <= 560
+    assert all(item.role != "user" for item in compacted.items)
@@ -0,0 +1,105 @@
+import json
+import os
+
+import checklist_store
+from checklist_store import ChecklistStore, GapIndex
+
+CHECKLIST = {
+    "domains": {
+        "work": {"label": "Work", "priority": "high", "completeness": 0, "items": [
+            {"key": "role", "label": "Role", "status": "unknown"},
+            {"key": "team", "label": "Team", "status": "unknown"},
+        ]},
+        "identity": {"label": "Identity", "priority": "critical", "completeness": 50, "items": [
+            {"key": "name", "label": "Name", "status": "known"},
+            {"key": "city", "label": "City", "status": "unknown"},
+        ]},
+        "health": {"label": "Health", "priority": "high", "completeness": 33, "items": [
+            {"key": "sleep", "label": "Sleep", "status": "partial"},
+            {"key": "sport", "label": "Sport", "status": "partial"},
+            {"key": "diet", "label": "Diet", "status": "unknown"},
+        ]},
+    },
+}
+
+
+def write_checklist(tmp_path) -> str:
+    path = str(tmp_path / "checklist.json")
+    with open(path, "w") as f:
+        json.dump(CHECKLIST, f)
+    return path
+
+
+def read_json(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_journal_is_replayed_after_a_crash(tmp_path):
+    path = write_checklist(tmp_path)
+    ChecklistStore(path).update("work", "role", "known", notes="founder")
+    # The process dies before its flush: the file is untouched, the journal has the update
+    assert read_json(path) == CHECKLIST
+
+    reloaded = ChecklistStore(path)
+    item = reloaded.checklist()["domains"]["work"]["items"][0]
+    assert (item["status"], item["notes"]) == ("known", "founder")
+    assert reloaded.checklist()["domains"]["work"]["completeness"] == 50
+    assert reloaded.flush()
+    assert read_json(path)["domains"]["work"]["items"][0]["status"] == "known"
+
+
+def test_flush_replaces_the_file_and_clears_the_journal(tmp_path, monkeypatch):
+    path = write_checklist(tmp_path)
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(checklist_store.os, "replace",
+                        lambda src, dst: (replaced.append((src, dst)), real_replace(src, dst)))
+    store = ChecklistStore(path)
+    assert store.update("identity", "city", "known") == (100, 44)
+
+    assert store.flush()
+    assert replaced == [(f"{path}.tmp", path)]
+    on_disk = read_json(path)
+    assert on_disk["domains"]["identity"]["completeness"] == 100
+    assert on_disk["overall_completeness"] == 44
+    assert os.path.getsize(store.journal_path) == 0
+    assert not os.path.exists(f"{path}.tmp")
+    assert not store.flush()  # nothing left to fold in
+
+
+def test_flush_keeps_updates_journalled_by_another_process(tmp_path):
+    path = write_checklist(tmp_path)
+    first, second = ChecklistStore(path), ChecklistStore(path)
+    first.update("work", "role", "known")
+    second.update("work", "team", "partial")
+    assert first.flush()
+    items = read_json(path)["domains"]["work"]["items"]
+    assert [i["status"] for i in items] == ["known", "partial"]
+    assert second.checklist()["domains"]["work"]["completeness"] == 75
+
+
+def test_gap_index_orders_by_priority_then_completeness():
+    index = GapIndex()
+    index.rebuild(CHECKLIST)
+    assert [(g.domain_key, g.key) for g in index.top(5)] == [
+        ("identity", "city"), ("work", "role"), ("work", "team"), ("health", "diet"),
+    ]
+    assert [g.key for g in index.top(2)] == ["city", "role"]
+
+
+def test_top_gaps_follow_updates(tmp_path):
+    path = write_checklist(tmp_path)
+    store = ChecklistStore(path)
+    assert [g.key for g in store.top_gaps(3)] == ["city", "role", "team"]
+
+    # Work passes Health's completeness, so Health's gap moves ahead of it
+    store.update("work", "role", "known")
+    assert [g.key for g in store.top_gaps(5)] == ["city", "diet", "team"]
+    store.update("work", "team", "partial")
+    assert [g.key for g in store.top_gaps(5)] == ["city", "diet"]
+
+    store.update("health", "diet", "partial")
+    assert [g.key for g in store.top_gaps(5)] == ["city"]
+    store.update("identity", "city", "known")
+    assert store.top_gaps(5) == []
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+from input_stage import NoiseSuppressionBudget, TurnGate
+
+HOLD_SLOT = """
+import fcntl, os, sys
+fd = os.open(sys.argv[1], os.O_RDWR)
+fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+print("held", flush=True)
+sys.stdin.read()
+"""
+
+
+@pytest.mark.parametrize("text", ["", "   ", ".", "...", "-"])
+def test_gate_drops_turns_without_words(text):
+    assert TurnGate("web").check(text) == "empty"
+
+
+@pytest.mark.parametrize("text", ["um", "Uh, hmm.", "mm mmm"])
+def test_gate_drops_hesitations(text):
+    assert TurnGate("sip").check(text) == "filler"
+
+
+@pytest.mark.parametrize("text", ["5", "8.", "A", "y", "no", "yes", "mhm", "yeah", "what's in my queue"])
+def test_gate_keeps_short_answers(text):
+    assert TurnGate("sip").check(text) is None
+
+
+def test_gate_drops_short_low_confidence_turns():
+    gate = TurnGate("sip", min_confidence=0.45, low_confidence_words=3)
+    gate.observe_final(0.3)
+    assert gate.check("call mom") == "low_confidence"
+    gate.observe_final(0.3)
+    assert gate.check("what is in my queue today") is None
+    # Confidence is per turn, and providers that don't score report 0
+    gate.observe_final(0.0)
+    assert gate.check("call mom") is None
+
+
+def test_noise_budget_hands_out_and_reuses_slots(tmp_path):
+    budget = NoiseSuppressionBudget(max_sessions=2, cpu_budget=0, slot_dir=str(tmp_path))
+    first, second = budget.acquire(), budget.acquire()
+    assert first and second and first != second
+    assert budget.acquire() is None
+    budget.release(first)
+    assert budget.acquire() == first
+
+
+def test_noise_budget_slot_is_freed_when_its_process_exits(tmp_path):
+    budget = NoiseSuppressionBudget(max_sessions=1, cpu_budget=0, slot_dir=str(tmp_path))
+    slot = budget.acquire()
+    budget.release(slot)
+    # Another job process holds the only slot, then dies without releasing it
+    holder = subprocess.Popen(
+        [sys.executable, "-c", HOLD_SLOT, slot], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+    )
+    try:
+        assert holder.stdout.readline().strip() == b"held"
+        assert budget.acquire() is None
+    finally:
+        holder.kill()
+        holder.wait()
+    assert budget.acquire() == slot
@@ -0,0 +1,68 @@
+import pytest
+
+import resilience
+from resilience import CLOSED, HALF_OPEN, HEDGE_DEFAULT_DELAY, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_consecutive_failures_open_the_breaker(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_seconds=30)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_error_rate_over_a_full_window_opens_the_breaker(clock):
+    breaker = CircuitBreaker("test", failure_threshold=10, error_rate=0.5, window=4)
+    for ok in (True, False, True):
+        breaker.record_success(0.1) if ok else breaker.record_failure()
+    assert breaker.state == CLOSED  # window not full yet
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_half_open_lets_one_probe_through_and_closes_on_success(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock[0] += 29
+    assert not breaker.allow()
+    clock[0] += 1
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_success(0.2)
+    assert breaker.state == CLOSED
+    assert breaker.error_rate() == 0.0
+
+
+def test_failed_probe_reopens_and_released_probe_frees_the_slot(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.release()  # barge-in: no verdict on the backend
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    clock[0] += 29
+    assert not breaker.allow()
+
+
+def test_hedge_delay_follows_first_output_p95():
+    breaker = CircuitBreaker("test")
+    assert breaker.hedge_delay() == HEDGE_DEFAULT_DELAY
+    for _ in range(resilience.HEDGE_MIN_SAMPLES):
+        breaker.record_first_output(2.5)
+        breaker.record_success(9.0)  # full request time doesn't count
+    assert breaker.hedge_delay() == pytest.approx(2.5)
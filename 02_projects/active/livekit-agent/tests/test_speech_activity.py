@@ -0,0 +1,45 @@
+import pytest
+
+from speech_activity import END_OF_SPEECH, START_OF_SPEECH, SpeechActivity
+
+WINDOW = 0.032
+
+
+def run(probabilities, **kwargs):
+    options = dict(activation_threshold=0.5, min_speech_duration=0.05,
+                   min_silence_duration=0.1, window_seconds=WINDOW)
+    options.update(kwargs)
+    activity = SpeechActivity(**options)
+    return activity, [(i, t) for i, p in enumerate(probabilities) if (t := activity.update(p))]
+
+
+def test_speech_starts_after_min_speech_and_ends_after_min_silence():
+    activity, transitions = run([0.1] * 3 + [0.9] * 4 + [0.1] * 8)
+    # Smoothed: 0.62 at window 3, 0.80 at window 4 -> two windows (64 ms) above 0.5
+    # Dropping back: 0.38 at window 7 is still speech, then four windows below 0.35
+    assert transitions == [(4, START_OF_SPEECH), (11, END_OF_SPEECH)]
+    # Four silent windows ended it, three more followed
+    assert activity.silence_seconds == pytest.approx(7 * WINDOW)
+
+
+def test_single_spike_does_not_start_speech():
+    _, transitions = run([0.1] * 3 + [0.95] + [0.1] * 5)
+    assert transitions == []
+
+
+def test_speech_continues_between_thresholds():
+    # Raw probability settles between deactivation (0.35) and activation (0.5):
+    # too low to start speech, but speech already under way carries on
+    activity, transitions = run([0.9] * 3 + [0.42] * 12)
+    assert transitions == [(1, START_OF_SPEECH)]
+    assert activity.speaking
+    assert activity.speech_seconds == pytest.approx(15 * WINDOW)
+
+    _, transitions = run([0.1] * 3 + [0.42] * 12)
+    assert transitions == []
+
+
+def test_deactivation_threshold_has_a_floor():
+    activity = SpeechActivity(activation_threshold=0.1, min_speech_duration=0.05,
+                              min_silence_duration=0.1, window_seconds=WINDOW)
+    assert activity.deactivation_threshold == 0.01
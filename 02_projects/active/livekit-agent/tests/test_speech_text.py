@@ -0,0 +1,52 @@
+from speech_text import CODE_PLACEHOLDER, SpeechChunker, normalize_for_speech, speakable_sentences, split_sentences
+
+
+def chunk_stream(deltas: list[str]) -> list[str]:
+    chunker = SpeechChunker()
+    out = []
+    for delta in deltas:
+        out += chunker.push(delta)
+    return out + chunker.flush()
+
+
+def test_prose_before_code_fence_in_same_delta_is_spoken():
+    reply = ("Your deploy failed because the config is wrong. Here is the fix you need to apply.\n"
+             "```yaml\nkey: value\n```\nRun it and redeploy.")
+    assert speakable_sentences(reply) == [
+        "Your deploy failed because the config is wrong.",
+        "Here is the fix you need to apply.",
+        CODE_PLACEHOLDER,
+        "Run it and redeploy.",
+    ]
+
+
+def test_code_fence_split_across_deltas():
+    deltas = ["Here is the fix you need to apply to the config.\n`", "``py", "thon\nprint(1)\n`",
+              "``\nRun it and redeploy."]
+    assert chunk_stream(deltas) == [
+        "Here is the fix you need to apply to the config.",
+        CODE_PLACEHOLDER,
+        "Run it and redeploy.",
+    ]
+
+
+def test_url_keeps_the_sentence_end():
+    assert speakable_sentences("See https://example.com/docs/page. Then restart the worker service.") == [
+        "See a link on example.com.",
+        "Then restart the worker service.",
+    ]
+    assert split_sentences("See example.com/docs. Then restart the worker service now.") == (
+        ["See example.com/docs."], "Then restart the worker service now.",
+    )
+    assert split_sentences("Open docs.example.io. Then restart it. Use e.g. this one. ") == (
+        ["Open docs.example.io.", "Then restart it.", "Use e.g. this one."], "",
+    )
+    assert normalize_for_speech("Details at www.example.com, as before.") == (
+        "Details at a link on example.com, as before."
+    )
+
+
+def test_underscores_inside_identifiers_are_kept():
+    assert normalize_for_speech("Set snake_case_name in config_loader.") == "Set snake_case_name in config_loader."
+    assert normalize_for_speech("This is _really_ and __very__ important.") == "This is really and very important."
+    assert normalize_for_speech("This is **bold** and *soft*.") == "This is bold and soft."
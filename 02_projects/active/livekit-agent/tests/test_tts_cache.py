@@ -0,0 +1,46 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("livekit.rtc")
+
+from tts_cache import CachedAudio, TTSCache, cache_key  # noqa: E402
+
+ENTRY_BYTES = 1000
+
+
+def audio() -> CachedAudio:
+    return CachedAudio(b"\0" * ENTRY_BYTES, 24000, 1)
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache_dir = str(tmp_path)
+    writer = TTSCache(cache_dir, memory_bytes=0, disk_bytes=3100)
+    keys = {name: cache_key("voice", name, "model") for name in ("a", "b", "c", "d")}
+
+    async def scenario():
+        for name in ("a", "b", "c"):
+            await writer.put(keys[name], audio())
+        for age, name in enumerate(("a", "b", "c"), start=1):
+            os.utime(writer._path(keys[name]), (age, age))
+        # Another process plays "a", which makes it the most recent
+        assert await TTSCache(cache_dir, memory_bytes=0).get(keys["a"]) is not None
+        # The fourth entry is over the cap: oldest go until the tier is under 90% of it
+        await writer.put(keys["d"], audio())
+
+    asyncio.run(scenario())
+    assert {name for name, key in keys.items() if writer._on_disk(key)} == {"a", "d"}
+    remaining = sum(os.path.getsize(writer._path(keys[name])) for name in ("a", "d"))
+    assert remaining <= 3100 * 0.9
+
+
+def test_disk_entry_round_trips(tmp_path):
+    key = cache_key("voice", "Done.", "model")
+
+    async def scenario():
+        await TTSCache(str(tmp_path)).put(key, CachedAudio(b"\1\2" * 480, 48000, 2))
+        return await TTSCache(str(tmp_path)).get(key)
+
+    cached = asyncio.run(scenario())
+    assert (cached.pcm, cached.sample_rate, cached.num_channels) == (b"\1\2" * 480, 48000, 2)
@@ -4,45 +4,83 @@ These tools allow voice agents to interact with the Focus Flow backend
 for task management, report reading, and profiling updates.
 """
 
-import json
 import logging
 import os
-from datetime import datetime
+import time
 
 import aiohttp
 
+from backend_client import get_backend_client
+from checklist_store import ChecklistStore
+from file_io import run_file_io
+from report_index import ReportIndex
+from task_watcher import TaskWatcher, describe_task
+
 logger = logging.getLogger("nitara-voice-tools")
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:3001")
 QUEUE_TOKEN_PATH = "/srv/focus-flow/07_system/secrets/.queue-api-token"
+# How often the token file is re-stat'ed for rotation
+QUEUE_TOKEN_CHECK_SECONDS = float(os.getenv("QUEUE_TOKEN_CHECK_SECONDS", "30"))
 PROFILING_CHECKLIST_PATH = "/srv/focus-flow/07_system/agent/profiling-checklist.json"
 REPORTS_DIR = "/srv/focus-flow/07_system/reports"
 
+# In-memory checklist with journalled, write-behind updates; see checklist_store
+CHECKLIST_STORE = ChecklistStore(PROFILING_CHECKLIST_PATH)
+
+# Newest report per type with voice summaries pre-extracted; see report_index
+REPORT_INDEX = ReportIndex(REPORTS_DIR)
+
+
+_queue_token = ""
+_queue_token_mtime_ns: int | None = None
+_queue_token_checked = float("-inf")
+
 
 def _read_queue_token() -> str:
-    """Read the queue API bearer token."""
+    """Read the queue API bearer token, cached until the file's mtime changes.
+
+    The file is stat'ed at most every ``QUEUE_TOKEN_CHECK_SECONDS``, so the
+    token costs no disk access on most calls.
+    """
+    global _queue_token, _queue_token_mtime_ns, _queue_token_checked
+    now = time.monotonic()
+    if now - _queue_token_checked < QUEUE_TOKEN_CHECK_SECONDS:
+        return _queue_token
+    _queue_token_checked = now
     try:
-        with open(QUEUE_TOKEN_PATH, "r") as f:
-            return f.read().strip()
+        mtime = os.stat(QUEUE_TOKEN_PATH).st_mtime_ns
+        if mtime != _queue_token_mtime_ns:
+            with open(QUEUE_TOKEN_PATH, "r") as f:
+                _queue_token = f.read().strip()
+            _queue_token_mtime_ns = mtime
     except FileNotFoundError:
-        logger.warning("Queue API token not found")
-        return ""
+        if _queue_token or _queue_token_mtime_ns is None:
+            logger.warning("Queue API token not found")
+        _queue_token = ""
+        _queue_token_mtime_ns = -1
+    return _queue_token
 
 
-async def enqueue_task(skill: str, arguments: str = "", priority: str = "medium") -> str:
+def queue_auth_headers() -> dict:
+    """Authorization header for the queue API, empty without a token."""
+    token = _read_queue_token()
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+async def enqueue_task(skill: str, arguments: str = "", priority: str = "medium",
+                       watcher: TaskWatcher | None = None) -> str:
     """Enqueue a task in Nitara's autonomous agent system.
 
     Args:
         skill: The skill to execute (e.g., 'portfolio-analysis', 'research-market')
         arguments: Arguments to pass to the skill
         priority: Task priority — 'low', 'medium', or 'high'
+        watcher: Session task watcher that should follow the new task
 
     Returns:
         Confirmation message with task ID or error description.
     """
-    token = _read_queue_token()
-    headers = {"Content-Type": "application/json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    headers = {"Content-Type": "application/json", **queue_auth_headers()}
 
     payload = {
         "skill": skill,
@@ -51,55 +89,74 @@ async def enqueue_task(skill: str, arguments: str = "", priority: str = "medium"
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{BACKEND_URL}/api/queue/enqueue",
-                json=payload,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                data = await resp.json()
-                if resp.status == 200 or resp.status == 201:
-                    task_id = data.get("id", "unknown")
-                    return f"Task queued successfully. ID: {task_id}, skill: {skill}, priority: {priority}."
-                else:
-                    return f"Failed to queue task: {data.get('error', 'unknown error')}"
+        async with get_backend_client().post(
+            f"{BACKEND_URL}/api/queue/enqueue",
+            json=payload,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            data = await resp.json()
+            if resp.status == 200 or resp.status == 201:
+                task_id = data.get("id", "unknown")
+                if watcher is not None and "id" in data:
+                    watcher.watch(task_id, skill)
+                return f"Task queued successfully. ID: {task_id}, skill: {skill}, priority: {priority}."
+            else:
+                return f"Failed to queue task: {data.get('error', 'unknown error')}"
     except Exception as e:
         logger.error(f"enqueue_task failed: {e}")
         return f"Error queuing task: {str(e)}"
 
 
-async def check_task_status(task_id: str = "") -> str:
+async def check_task_status(task_id: str = "", watcher: TaskWatcher | None = None) -> str:
     """Check the status of queued tasks.
 
     Args:
         task_id: Optional specific task ID. If empty, returns recent task summary.
+        watcher: Session task watcher whose cache answers for its own tasks
 
     Returns:
         Task status information.
     """
-    token = _read_queue_token()
-    headers = {}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    if task_id:
+        return await _check_one_task(task_id, watcher)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            url = f"{BACKEND_URL}/api/queue/stats"
-            async with session.get(
-                url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                data = await resp.json()
-                if resp.status == 200:
-                    pending = data.get("pending", 0)
-                    running = data.get("running", 0)
-                    completed = data.get("completed_today", 0)
-                    return (
-                        f"Queue status: {pending} pending, {running} running, "
-                        f"{completed} completed today."
-                    )
-                else:
-                    return f"Could not fetch queue status: {data.get('error', 'unknown')}"
+        url = f"{BACKEND_URL}/api/queue/stats"
+        async with get_backend_client().get(
+            url, headers=queue_auth_headers(), timeout=aiohttp.ClientTimeout(total=10)
+        ) as resp:
+            data = await resp.json()
+            if resp.status == 200:
+                pending = data.get("pending", 0)
+                running = data.get("running", 0)
+                completed = data.get("completed_today", 0)
+                return (
+                    f"Queue status: {pending} pending, {running} running, "
+                    f"{completed} completed today."
+                )
+            else:
+                return f"Could not fetch queue status: {data.get('error', 'unknown')}"
+    except Exception as e:
+        logger.error(f"check_task_status failed: {e}")
+        return f"Error checking status: {str(e)}"
+
+
+async def _check_one_task(task_id: str, watcher: TaskWatcher | None) -> str:
+    """Status of one task, from the session watcher's cache when it has it."""
+    cached = watcher.status(task_id) if watcher is not None else None
+    if cached is not None:
+        return describe_task(cached)
+
+    try:
+        async with get_backend_client().get(
+            f"{BACKEND_URL}/api/queue/tasks/{task_id}",
+            headers=queue_auth_headers(), timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            data = await resp.json()
+            if resp.status == 200:
+                return describe_task(data)
+            return f"Could not fetch task {task_id}: {data.get('error', 'unknown')}"
     except Exception as e:
         logger.error(f"check_task_status failed: {e}")
         return f"Error checking status: {str(e)}"
@@ -116,33 +173,10 @@ async def read_latest_report(report_type: str = "portfolio-analysis") -> str:
         Summary of the latest report, or a message if no report found.
     """
     try:
-        import glob
-
-        pattern = os.path.join(REPORTS_DIR, f"{report_type}*.json")
-        files = sorted(glob.glob(pattern), reverse=True)
-        if not files:
+        summary = await REPORT_INDEX.get(report_type)
+        if summary is None:
             return f"No {report_type} reports found yet."
-
-        with open(files[0], "r") as f:
-            report = json.load(f)
-
-        # Extract key fields for voice summary
-        parts = [f"Latest {report_type} report from {report.get('date', 'unknown date')}."]
-
-        if "summary" in report:
-            parts.append(report["summary"])
-        elif "notes" in report:
-            parts.append(report["notes"])
-
-        status = report.get("status", "")
-        if status:
-            parts.append(f"Status: {status}.")
-
-        score = report.get("satisfaction_score")
-        if score is not None:
-            parts.append(f"Quality score: {score:.1%}.")
-
-        return " ".join(parts)
+        return summary
     except Exception as e:
         logger.error(f"read_latest_report failed: {e}")
         return f"Error reading report: {str(e)}"
@@ -161,48 +195,28 @@ async def update_profiling_data(domain: str, key: str, value: str, notes: str =
         Confirmation message.
     """
     try:
-        with open(PROFILING_CHECKLIST_PATH, "r") as f:
-            checklist = json.load(f)
-
-        domains = checklist.get("domains", {})
-        if domain not in domains:
-            return f"Unknown domain: {domain}. Available: {', '.join(domains.keys())}"
-
-        items = domains[domain].get("items", [])
-        found = False
-        for item in items:
-            if item["key"] == key:
-                item["status"] = value
-                item["source"] = "voice_conversation"
-                if notes:
-                    item["notes"] = notes
-                found = True
-                break
-
-        if not found:
-            return f"Unknown key '{key}' in domain '{domain}'."
-
-        # Recompute domain completeness
-        total = len(items)
-        known = sum(1 for i in items if i["status"] == "known")
-        partial = sum(1 for i in items if i["status"] == "partial")
-        domains[domain]["completeness"] = round((known + partial * 0.5) / total * 100)
-
-        # Recompute overall completeness
-        all_domains = list(domains.values())
-        checklist["overall_completeness"] = round(
-            sum(d["completeness"] for d in all_domains) / len(all_domains)
+        domain_completeness, overall = await run_file_io(
+            CHECKLIST_STORE.update, domain, key, value, notes
         )
-        checklist["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-
-        with open(PROFILING_CHECKLIST_PATH, "w") as f:
-            json.dump(checklist, f, indent=2)
-
-        return (
+        CHECKLIST_STORE.schedule_flush()
+        result = (
             f"Updated {domain}.{key} to '{value}'. "
-            f"Domain completeness: {domains[domain]['completeness']}%. "
-            f"Overall: {checklist['overall_completeness']}%."
+            f"Domain completeness: {domain_completeness}%. "
+            f"Overall: {overall}%."
         )
+        # The gap index is already up to date, so suggesting the next
+        # question is a cached lookup. It goes through the store's lock: a
+        # flush may be rebuilding the index in the file I/O pool.
+        try:
+            next_gaps = await run_file_io(CHECKLIST_STORE.top_gaps, 1)
+        except Exception as e:
+            logger.warning(f"update_profiling_data: next gap lookup failed: {e}")
+            next_gaps = []
+        if next_gaps:
+            result += f" Next gap to explore: {next_gaps[0].domain_label}: {next_gaps[0].label}."
+        return result
+    except ValueError as e:
+        return str(e)
     except Exception as e:
         logger.error(f"update_profiling_data failed: {e}")
         return f"Error updating profiling data: {str(e)}"
@@ -215,36 +229,17 @@ async def get_profiling_gaps() -> str:
         Description of the top profiling gaps to address.
     """
     try:
-        with open(PROFILING_CHECKLIST_PATH, "r") as f:
-            checklist = json.load(f)
-
-        gaps = []
-        for domain_key, domain in checklist.get("domains", {}).items():
-            if domain["completeness"] >= 80:
-                continue
-            for item in domain.get("items", []):
-                if item["status"] == "unknown":
-                    gaps.append({
-                        "domain": domain["label"],
-                        "domain_key": domain_key,
-                        "key": item["key"],
-                        "label": item["label"],
-                        "priority": domain.get("priority", "medium"),
-                    })
-
-        # Sort by priority (critical > high > medium)
-        priority_order = {"critical": 0, "high": 1, "medium": 2}
-        gaps.sort(key=lambda g: priority_order.get(g["priority"], 3))
+        gaps, overall = await run_file_io(
+            lambda: (CHECKLIST_STORE.top_gaps(5), CHECKLIST_STORE.overall_completeness())
+        )
 
         if not gaps:
             return "All profiling domains are at 80% or above. Great coverage!"
 
-        top = gaps[:5]
-        lines = [f"Top {len(top)} profiling gaps to address:"]
-        for g in top:
-            lines.append(f"- {g['domain']}: {g['label']} (priority: {g['priority']})")
+        lines = [f"Top {len(gaps)} profiling gaps to address:"]
+        for g in gaps:
+            lines.append(f"- {g.domain_label}: {g.label} (priority: {g.priority})")
 
-        overall = checklist.get("overall_completeness", 0)
         lines.append(f"\nOverall profiling completeness: {overall}%.")
         return "\n".join(lines)
     except Exception as e:
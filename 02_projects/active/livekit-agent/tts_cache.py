@@ -0,0 +1,226 @@
+"""Content-addressed cache of synthesized speech.
+
+Fallback lines, "Done." and similar fixed phrases used to be synthesized
+again on every turn. ``TTSCache`` stores the rendered PCM keyed by
+(voice id, normalized text, TTS model). An in-memory LRU sits in front of
+an on-disk tier that is shared by all worker processes and capped in size,
+so a hit plays back with no network call.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import unicodedata
+from collections import OrderedDict
+
+from livekit import rtc
+
+from metrics import get_metrics
+
+logger = logging.getLogger("nitara-voice-tts-cache")
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "/srv/focus-flow/07_system/cache/voice-tts")
+TTS_CACHE_MEMORY_MB = float(os.getenv("TTS_CACHE_MEMORY_MB", "32"))
+TTS_CACHE_DISK_MB = float(os.getenv("TTS_CACHE_DISK_MB", "256"))
+
+FRAME_MS = 20
+_HEADER = struct.Struct("<IH")  # sample rate, channels; int16 PCM follows
+
+
+def normalize_phrase(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(voice_id: str, text: str, model: str) -> str:
+    raw = f"{model}\0{voice_id}\0{normalize_phrase(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CachedAudio:
+    """Interleaved int16 PCM for one phrase."""
+
+    __slots__ = ("pcm", "sample_rate", "num_channels")
+
+    def __init__(self, pcm: bytes, sample_rate: int, num_channels: int):
+        self.pcm = pcm
+        self.sample_rate = sample_rate
+        self.num_channels = num_channels
+
+    @classmethod
+    def from_frames(cls, frames: list[rtc.AudioFrame]) -> "CachedAudio":
+        first = frames[0]
+        pcm = b"".join(bytes(f.data.cast("B")) for f in frames)
+        return cls(pcm, first.sample_rate, first.num_channels)
+
+    def frames(self) -> list[rtc.AudioFrame]:
+        samples = self.sample_rate * FRAME_MS // 1000
+        step = samples * self.num_channels * 2
+        out = []
+        for offset in range(0, len(self.pcm), step):
+            chunk = self.pcm[offset:offset + step]
+            out.append(rtc.AudioFrame(
+                data=chunk, sample_rate=self.sample_rate, num_channels=self.num_channels,
+                samples_per_channel=len(chunk) // (2 * self.num_channels),
+            ))
+        return out
+
+
+class TTSCache:
+    """Memory LRU over a size-capped disk tier of rendered phrases."""
+
+    def __init__(self, cache_dir: str = TTS_CACHE_DIR,
+                 memory_bytes: int = int(TTS_CACHE_MEMORY_MB * 1024 * 1024),
+                 disk_bytes: int = int(TTS_CACHE_DISK_MB * 1024 * 1024)):
+        self._dir = cache_dir
+        self._memory_cap = memory_bytes
+        self._disk_cap = disk_bytes
+        self._memory: OrderedDict[str, CachedAudio] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: int | None = None
+
+    async def get(self, key: str) -> CachedAudio | None:
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            get_metrics().incr("tts_cache_hits", tier="memory")
+            return audio
+        audio = await asyncio.get_running_loop().run_in_executor(None, self._read_disk, key)
+        if audio is not None:
+            self._remember(key, audio)
+            get_metrics().incr("tts_cache_hits", tier="disk")
+            return audio
+        get_metrics().incr("tts_cache_misses")
+        return None
+
+    async def put(self, key: str, audio: CachedAudio) -> None:
+        self._remember(key, audio)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write_disk, key, audio)
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache entry: {e}")
+
+    async def render(self, tts_instance, text: str) -> CachedAudio | None:
+        """Synthesize ``text`` with ``tts_instance`` and collect the audio."""
+        frames = []
+        async with tts_instance.stream() as stream:
+            stream.push_text(text)
+            stream.end_input()
+            async for event in stream:
+                frames.append(event.frame)
+        return CachedAudio.from_frames(frames) if frames else None
+
+    async def prerender(self, tts_factory, voices: dict[str, str], phrases: list[str],
+                        model: str) -> int:
+        """Make sure every phrase is cached for every voice; returns renders done.
+
+        ``tts_factory(voice_id)`` builds the TTS client for a voice. Phrases
+        already on disk (from another process or an earlier run) are skipped.
+        """
+        rendered = 0
+        for voice_id in dict.fromkeys(voices.values()):
+            tts_instance = None
+            for phrase in phrases:
+                key = cache_key(voice_id, phrase, model)
+                if key in self._memory or await asyncio.get_running_loop().run_in_executor(
+                        None, self._on_disk, key):
+                    continue
+                try:
+                    tts_instance = tts_instance or tts_factory(voice_id)
+                    audio = await self.render(tts_instance, phrase)
+                except Exception as e:
+                    logger.warning(f"Failed to pre-render '{phrase[:40]}' for {voice_id}: {e}")
+                    continue
+                if audio is not None:
+                    await self.put(key, audio)
+                    rendered += 1
+            if tts_instance is not None:
+                await tts_instance.aclose()
+        return rendered
+
+    def _remember(self, key: str, audio: CachedAudio) -> None:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        self._memory[key] = audio
+        self._memory_bytes += len(audio.pcm)
+        while self._memory_bytes > self._memory_cap and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted.pcm)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, key[:2], f"{key}.pcm")
+
+    def _on_disk(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def _read_disk(self, key: str) -> CachedAudio | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # recency for disk eviction
+        except FileNotFoundError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        sample_rate, num_channels = _HEADER.unpack_from(data)
+        return CachedAudio(data[_HEADER.size:], sample_rate, num_channels)
+
+    def _write_disk(self, key: str, audio: CachedAudio) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(audio.sample_rate, audio.num_channels))
+            f.write(audio.pcm)
+        os.replace(tmp, path)
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+        else:
+            self._disk_bytes += _HEADER.size + len(audio.pcm)
+        if self._disk_bytes > self._disk_cap:
+            self._evict_disk()
+
+    def _disk_entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        for root, _, files in os.walk(self._dir):
+            for name in files:
+                if not name.endswith(".pcm"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict_disk(self) -> None:
+        """Drop least recently used files until the tier is at 90% of its cap."""
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, size, _ in entries)
+        target = self._disk_cap * 0.9
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self._disk_bytes = total
+        logger.info(f"TTS disk cache evicted {removed} entries ({total / 1048576:.1f}MB kept)")
+
+
+_tts_cache: TTSCache | None = None
+
+
+def get_tts_cache() -> TTSCache:
+    """Return the worker-wide TTS cache."""
+    global _tts_cache
+    if _tts_cache is None:
+        _tts_cache = TTSCache()
+    return _tts_cache
@@ -0,0 +1,140 @@
+"""Worker load reporting and admission control.
+
+With LiveKit's default load function and process-pool sizing, a burst of
+inbound SIP calls kept landing on one worker until it was CPU-starved, and
+VAD and audio quality dropped for every call on it. ``WorkerLoad`` reports
+the highest of three pressures, each a fraction of its budget:
+
+- CPU use over ``WORKER_CPU_BUDGET``
+- active sessions over ``WORKER_MAX_SESSIONS``
+- the worst event-loop lag among this worker's job processes over
+  ``WORKER_LAG_BUDGET``, re-read only as often as jobs report it
+
+A pressure at its budget puts the reported load at ``WORKER_LOAD_THRESHOLD``,
+where LiveKit stops dispatching to the worker, so calls spread to other
+workers before quality drops. The number of idle prewarmed processes
+follows the recent job arrival rate.
+"""
+
+import logging
+import math
+import os
+import time
+from collections import deque
+
+from loop_lag import LOOP_LAG_REPORT_SECONDS, claim_worker_namespace, read_loop_lag
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+logger = logging.getLogger("nitara-voice-load")
+WORKER_MAX_SESSIONS = int(os.getenv("WORKER_MAX_SESSIONS", "8"))
+WORKER_LOAD_THRESHOLD = float(os.getenv("WORKER_LOAD_THRESHOLD", "0.75"))
+WORKER_CPU_BUDGET = float(os.getenv("WORKER_CPU_BUDGET", "0.85"))
+WORKER_LAG_BUDGET = float(os.getenv("WORKER_LAG_BUDGET", "0.1"))
+JOB_MEMORY_WARN_MB = float(os.getenv("JOB_MEMORY_WARN_MB", "600"))
+JOB_MEMORY_LIMIT_MB = float(os.getenv("JOB_MEMORY_LIMIT_MB", "1000"))
+# Idle processes: bounds, and the window job arrivals are counted over
+WORKER_IDLE_MIN = int(os.getenv("WORKER_IDLE_MIN", "1"))
+WORKER_IDLE_MAX = int(os.getenv("WORKER_IDLE_MAX", "4"))
+WORKER_ARRIVAL_WINDOW = float(os.getenv("WORKER_ARRIVAL_WINDOW", "120"))
+# Seconds a new process takes to prewarm; arrivals within it need an idle process
+WORKER_PREWARM_SECONDS = float(os.getenv("WORKER_PREWARM_SECONDS", "10"))
+
+
+def _cpu_fraction() -> float:
+    """System-wide CPU use since the previous call, 0..1."""
+    if HAS_PSUTIL:
+        return psutil.cpu_percent(interval=None) / 100
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return 0.0
+
+
+class WorkerLoad:
+    """``load_fnc`` for WorkerOptions; also sizes the idle process pool."""
+
+    def __init__(self, max_sessions: int = WORKER_MAX_SESSIONS):
+        self._max_sessions = max_sessions
+        self._seen_jobs: set[str] = set()
+        self._arrivals: deque[float] = deque()
+        self._idle_target: int | None = None
+        self._full = False
+        self._lag = 0.0
+        self._lag_read_at = float("-inf")
+        self.load = 0.0
+
+    def __call__(self, worker) -> float:
+        active_jobs = list(getattr(worker, "active_jobs", []))
+        self._count_arrivals(active_jobs)
+
+        cpu = _cpu_fraction() / WORKER_CPU_BUDGET
+        sessions = len(active_jobs) / self._max_sessions if self._max_sessions > 0 else 0.0
+        lag = self._loop_lag() / WORKER_LAG_BUDGET if WORKER_LAG_BUDGET > 0 else 0.0
+        self.load = min(1.0, max(cpu, sessions, lag) * WORKER_LOAD_THRESHOLD)
+
+        full = self.load >= WORKER_LOAD_THRESHOLD
+        if full != self._full:
+            self._full = full
+            logger.warning(
+                f"Worker {'full' if full else 'accepting jobs again'}: cpu {cpu:.2f}, "
+                f"sessions {len(active_jobs)}/{self._max_sessions}, lag {lag:.2f} of budget"
+            )
+
+        self._resize_idle_pool(worker, len(active_jobs))
+        return self.load
+
+    def _loop_lag(self) -> float:
+        # Job processes rewrite their files every LOOP_LAG_REPORT_SECONDS;
+        # scanning the directory more often only costs disk I/O
+        now = time.monotonic()
+        if now - self._lag_read_at >= LOOP_LAG_REPORT_SECONDS:
+            self._lag_read_at = now
+            self._lag = read_loop_lag()
+        return self._lag
+
+    def _count_arrivals(self, active_jobs: list) -> None:
+        now = time.monotonic()
+        job_ids = {getattr(getattr(j, "job", None), "id", None) or str(id(j)) for j in active_jobs}
+        for _ in job_ids - self._seen_jobs:
+            self._arrivals.append(now)
+        self._seen_jobs = job_ids
+        while self._arrivals and self._arrivals[0] < now - WORKER_ARRIVAL_WINDOW:
+            self._arrivals.popleft()
+
+    def idle_target(self, active: int) -> int:
+        """Idle processes to keep: arrivals expected while one prewarms, plus one."""
+        rate = len(self._arrivals) / WORKER_ARRIVAL_WINDOW
+        expected = math.ceil(rate * WORKER_PREWARM_SECONDS) + 1
+        free_slots = max(0, self._max_sessions - active) if self._max_sessions > 0 else WORKER_IDLE_MAX
+        return max(0, min(WORKER_IDLE_MAX, free_slots, max(WORKER_IDLE_MIN, expected)))
+
+    def _resize_idle_pool(self, worker, active: int) -> None:
+        target = self.idle_target(active)
+        if target == self._idle_target:
+            return
+        # LiveKit has no public hook for this; skip quietly on versions without it
+        proc_pool = getattr(worker, "_proc_pool", None)
+        loop = getattr(worker, "_loop", None)
+        if proc_pool is None or loop is None or not hasattr(proc_pool, "set_target_idle_processes"):
+            return
+        self._idle_target = target
+        logger.info(f"Idle process target: {target} ({len(self._arrivals)} jobs in the last "
+                    f"{WORKER_ARRIVAL_WINDOW:.0f}s)")
+        loop.call_soon_threadsafe(proc_pool.set_target_idle_processes, target)
+
+
+def worker_options_kwargs() -> dict:
+    """Load and process-pool settings for ``WorkerOptions``."""
+    claim_worker_namespace()
+    return {
+        "load_fnc": WorkerLoad(),
+        "load_threshold": WORKER_LOAD_THRESHOLD,
+        "num_idle_processes": WORKER_IDLE_MAX,
+        "job_memory_warn_mb": JOB_MEMORY_WARN_MB,
+        "job_memory_limit_mb": JOB_MEMORY_LIMIT_MB,
+    }